@@ -1,68 +1,56 @@
 import pygame as game
-import time
+from classes.Animator.Animator import ANIMATOR, Tween
+from animations.easing import ease_in_out_curve
 
+# One black overlay per screen size, reused by every fade (only its alpha changes)
+_overlays: dict[tuple[int, int], game.Surface] = {}
 
-def lerp(a: float, b: float, t: float) -> float:
+
+def fade_overlay(size: tuple[int, int]) -> game.Surface:
     """
-    Linear interpolation between a and b by t.
+    The black overlay used by fades, created once per size.
 
     Args:
-        a (float): Start value.
-        b (float): End value.
-        t (float): Interpolation factor in [0, 1].
-
+        size (tuple[int, int]): Size of the screen to cover.
     Returns:
-        float: Interpolated value.
-
+        game.Surface: The shared overlay (fades only change its surface alpha).
     """
-    return a + (b - a) * t
+    overlay: game.Surface | None = _overlays.get(size)
+    if overlay is None:
+        overlay = game.Surface(size)
+        if game.display.get_surface() is not None:
+            overlay = overlay.convert()
+        overlay.fill((0, 0, 0))
+        _overlays[size] = overlay
+    return overlay
 
 
-def ease_in_out_curve(t: float) -> float:
+def start_fade(duration: int = 1000) -> Tween:
     """
-    Smoothstep easing (ease-in-out).
-    Maps t in [0,1] to eased t.
+    Start a fade-in; draw it with `draw_fade` on top of each frame until it is done.
 
     Args:
-        t (float): Input time factor in [0, 1].
+        duration (int): Duration of the fade-in effect in milliseconds.
     Returns:
-        float: Eased time factor in [0, 1].
+        Tween: The fade's progress (advanced by ANIMATOR.update()).
     """
-    return lerp(0, 1, t * t * (3 - 2 * t))
+    return ANIMATOR.add(duration, ease_in_out_curve)
 
 
-def fade_in(
-    SCREEN: game.Surface, draw_callback: callable, duration: int = 1000
-) -> None:
+def draw_fade(SCREEN: game.Surface, fade: Tween) -> None:
     """
-    Performs a fade-in animation for the given screen.
+    Darken the screen for the current point of a fade-in (black at the start, clear at the end).
 
     Args:
-        SCREEN (game.Surface): Main display surface.
-        draw_callback (callable): Function to draw the screen content (called every frame).
-        duration (int): Duration of the fade-in effect in milliseconds.
+        SCREEN (game.Surface): Surface to draw the fade on, after the frame itself.
+        fade (Tween): The fade returned by `start_fade`.
     Returns:
         None
     """
-    clock = game.time.Clock()
-    start_time = time.time()
-
-    while True:
-        elapsed = (time.time() - start_time) * 1000  # ms
-        t = min(elapsed / duration, 1.0)
-        eased_t = ease_in_out_curve(t)
-
-        # First draw normal screen
-        draw_callback()
-
-        # Copy screen content and overlay black with decreasing opacity
-        overlay = game.Surface(SCREEN.get_size()).convert_alpha()
-        overlay.fill((0, 0, 0, int(255 * (1 - eased_t))))
-        SCREEN.blit(overlay, (0, 0))
-
-        game.display.update()
-
-        if t >= 1.0:
-            break
+    alpha: int = int(255 * (1 - fade.value))
+    if alpha <= 0:
+        return
+    overlay: game.Surface = fade_overlay(SCREEN.get_size())
+    overlay.set_alpha(alpha)
+    SCREEN.blit(overlay, (0, 0))
 
-        clock.tick(60)  # Limit FPS
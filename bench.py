@@ -0,0 +1,92 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # draw_snake needs a display mode
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import sys
+import pygame as game
+from settings.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from simulation.bench import (
+    BASELINE_PATH,
+    BENCHMARKS,
+    compare,
+    load_baseline,
+    measure_menu_idle,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the game's hot paths over snake length, poison and obstacle "
+        "counts, and fail if they scale worse than the stored baseline."
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run"
+    )
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store these results as the baseline"
+    )
+    parser.add_argument("--json", metavar="PATH", help="also write the results to PATH")
+    parser.add_argument(
+        "--budget", type=float, default=0.02, help="seconds per timed run"
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=0.5,
+        help="allowed rise of a growth exponent over the baseline",
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=3.0,
+        help="allowed slowdown of the largest case over the baseline",
+    )
+    parser.add_argument(
+        "--menu-idle",
+        type=float,
+        metavar="SECONDS",
+        help="instead, measure the CPU use of the idle main menu, paced and unpaced",
+    )
+    args = parser.parse_args()
+
+    if args.menu_idle:
+        for run in measure_menu_idle(args.menu_idle):
+            label: str = "paced" if run["paced"] else "unpaced"
+            print(
+                f"menu idle {label:8} cpu={run['cpu_percent']:5.1f}%  "
+                f"{run['frames']} frames in {run['seconds']:.1f} s ({run['fps']} fps)"
+            )
+        sys.exit(0)
+
+    game.init()
+    game.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results: dict = run_benchmarks(args.only, budget=args.budget)
+    for key, entry in results.items():
+        times: str = " ".join(f"{n}:{ns / 1000:.2f}" for n, ns in entry["points"])
+        print(f"{key:34} exponent={entry['exponent']:5.2f}  us per call  {times}")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"baseline saved to {args.baseline}")
+        sys.exit(0)
+
+    baseline: dict | None = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"no baseline at {args.baseline} (run with --save-baseline)")
+        sys.exit(0)
+    failures: list[str] = compare(results, baseline, args.max_growth, args.max_slowdown)
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+    print(f"no regressions against {args.baseline}")
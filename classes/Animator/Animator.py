@@ -0,0 +1,117 @@
+import time
+from typing import Callable
+from animations.easing import ease_in_out_curve
+
+
+class Tween:
+    """
+    A value going from 0.0 to 1.0 (through an easing curve) over a duration.
+    It never waits: each `advance` computes the progress from the frame's
+    timestamp, so a slow frame just moves it further along.
+    """
+
+    def __init__(
+        self,
+        duration: float,
+        start: float,
+        ease: Callable[[float], float] = ease_in_out_curve,
+    ):
+        """
+        :param duration: Length of the tween in milliseconds.
+        :param start: Time the tween starts at, in milliseconds (perf_counter based).
+        :param ease: Maps linear progress in [0, 1] to eased progress.
+        """
+        self.duration: float = duration
+        self.start: float = start
+        self.ease: Callable[[float], float] = ease
+        self.value: float = ease(0.0)  # eased progress, 0.0 -> 1.0
+        self.done: bool = False
+
+    def advance(self, now: float) -> bool:
+        """
+        Move the tween to the time `now`.
+
+        :param now: Current time in milliseconds (same clock as `start`).
+        Returns:
+            bool: True once the tween has finished.
+        """
+        t: float = (now - self.start) / self.duration if self.duration > 0 else 1.0
+        t = min(max(t, 0.0), 1.0)
+        self.value = self.ease(t)
+        self.done = t >= 1.0
+        return self.done
+
+
+class Animator:
+    """
+    Keeps the running tweens and advances them once per frame, without sleeping,
+    so animations never hold up the loop that draws them. A frame costs one
+    `advance` per running tween; finished and cancelled tweens are dropped.
+    """
+
+    def __init__(self):
+        self.tweens: list[Tween] = []  # running tweens
+
+    @staticmethod
+    def now() -> float:
+        """
+        Returns:
+            float: The animation clock in milliseconds.
+        """
+        return time.perf_counter() * 1000
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns:
+            bool: True while any tween is running (the screen is still changing).
+        """
+        return bool(self.tweens)
+
+    def add(
+        self,
+        duration: float,
+        ease: Callable[[float], float] = ease_in_out_curve,
+        now: float | None = None,
+    ) -> Tween:
+        """
+        Start a tween.
+
+        :param duration: Length of the tween in milliseconds.
+        :param ease: Maps linear progress in [0, 1] to eased progress.
+        :param now: Start time in milliseconds (the animation clock if None).
+        Returns:
+            Tween: The tween; read its `value` and `done` when drawing.
+        """
+        tween: Tween = Tween(duration, self.now() if now is None else now, ease)
+        self.tweens.append(tween)
+        return tween
+
+    def cancel(self, tween: Tween):
+        """
+        Stop a tween where it is (it is dropped on the next `update`).
+
+        :param tween: A tween returned by `add`.
+        """
+        tween.done = True
+
+    def update(self, now: float | None = None) -> int:
+        """
+        Advance every running tween to the current frame.
+
+        :param now: Frame time in milliseconds (the animation clock if None).
+        Returns:
+            int: Number of tweens still running.
+        """
+        if not self.tweens:
+            return 0
+        if now is None:
+            now = self.now()
+        self.tweens = [
+            tween for tween in self.tweens if not tween.done and not tween.advance(now)
+        ]
+        return len(self.tweens)
+
+
+# Process-wide animator; the screen loops call ANIMATOR.update() once per frame
+ANIMATOR: Animator = Animator()
@@ -0,0 +1,343 @@
+import math
+import time
+from collections import deque
+from pygame import Vector2
+from classes.Board.Board import Board
+from classes.Main import Main
+from classes.Obstacle.Obstacle import Obstacle
+from classes.Profiler.Profiler import percentile_us
+
+# Neighbour offsets, in the order moves are tried (ties keep this order)
+MOVES: tuple[tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+# Most cells a room check visits (a region this big counts as open, whatever the length)
+ROOM_CAP: int = 64
+
+
+class Autopilot:
+    """
+    Steers a `Main` game towards the apple on its own (in place of the keyboard).
+
+    Planning uses a BFS distance field from the apple that treats poisons as walls.
+    The field only depends on the apple and the poisons, so it is cached between
+    ticks. A moved apple changes every distance, and poisons respawn on every
+    apple eaten, so each apple costs one full rebuild (counted in `stats`). Between
+    apples the field is only repaired incrementally (distances can only shrink)
+    when a poison is eaten, and otherwise reused as is. Snake and
+    obstacles move every tick, so they are handled per decision instead: the next
+    head cell must stay clear of falling rows (predicted at `Main.obstacle_speed`,
+    including the next row to spawn) for as long as the body will lie on it, and
+    must leave the snake enough room (a flood fill bounded by ROOM_CAP cells, or
+    cut short once it reaches the tail).
+    """
+
+    def __init__(self, main: Main, horizon: int = 3, samples: int = 4096):
+        """
+        :param main: The game to steer.
+        :param horizon: How many ticks ahead rows count as walls for the room check.
+        :param samples: How many recent decision times to keep for percentiles.
+        """
+        self.main: Main = main
+        self.horizon: int = horizon
+        self.resize()
+
+        # Planning cost
+        self.decisions: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+        self.recent_ns: deque[int] = deque(maxlen=samples)
+        self.rebuilds: int = 0  # full BFS runs (one per apple position)
+        self.repairs: int = 0  # incremental updates after a poison was eaten
+
+    def resize(self):
+        """
+        Start over with an empty field sized for the current board (at start, and
+        whenever a zoom change resized the board).
+        """
+        board: Board = self.main.board
+        self.width: int = board.width
+        self.height: int = board.height
+        self.unreachable: int = board.size + 1  # distance of cells cut off by poisons
+        self.distance: list[int] = [self.unreachable] * board.size
+        self.target: int | None = None  # apple cell the field was built for
+        self.poisons: set[int] = set()  # poison cells the field was built for
+        # on-board neighbours of every cell, looked up by the BFS and the room checks
+        self.adjacent: list[tuple[int, ...]] = [
+            self.neighbours(i) for i in range(board.size)
+        ]
+
+    def neighbours(self, i: int) -> tuple[int, ...]:
+        """
+        On-board neighbours of a cell (see `adjacent` for all of them, precomputed).
+
+        :param i: Cell index.
+        Returns:
+            tuple[int, ...]: Indexes of the up to 4 adjacent cells.
+        """
+        x: int = i % self.width
+        cells: list[int] = []
+        if i >= self.width:
+            cells.append(i - self.width)
+        if x < self.width - 1:
+            cells.append(i + 1)
+        if i < (self.height - 1) * self.width:
+            cells.append(i + self.width)
+        if x > 0:
+            cells.append(i - 1)
+        return tuple(cells)
+
+    def rebuild(self):
+        """
+        Recompute the whole distance field with a BFS from the apple.
+        """
+        self.rebuilds += 1
+        distance: list[int] = [self.unreachable] * len(self.distance)
+        self.distance = distance
+        if self.target is None:
+            return
+        distance[self.target] = 0
+        frontier: deque[int] = deque([self.target])
+        poisons: set[int] = self.poisons
+        adjacent: list[tuple[int, ...]] = self.adjacent
+        while frontier:
+            i: int = frontier.popleft()
+            step: int = distance[i] + 1
+            for n in adjacent[i]:
+                if step < distance[n] and n not in poisons:
+                    distance[n] = step
+                    frontier.append(n)
+
+    def repair(self, opened: set[int]):
+        """
+        Update the field after some poison cells became walkable: only the cells
+        whose path to the apple gets shorter through them are visited.
+
+        :param opened: Cells that are no longer poisoned.
+        """
+        self.repairs += 1
+        distance: list[int] = self.distance
+        adjacent: list[tuple[int, ...]] = self.adjacent
+        frontier: deque[int] = deque()
+        for i in opened:
+            distance[i] = min(
+                [distance[n] + 1 for n in adjacent[i]] + [self.unreachable]
+            )
+            frontier.append(i)
+        while frontier:
+            i: int = frontier.popleft()
+            step: int = distance[i] + 1
+            for n in adjacent[i]:
+                if step < distance[n] and n not in self.poisons:
+                    distance[n] = step
+                    frontier.append(n)
+
+    def sync_field(self):
+        """
+        Bring the cached field up to date with the apple and the poisons: a full
+        rebuild if the apple moved or poisons appeared (once per apple eaten), an
+        incremental repair if poisons were only eaten.
+        """
+        main: Main = self.main
+        if main.board.width != self.width or main.board.height != self.height:
+            self.resize()  # cell indexes changed: the cached field is meaningless
+        apple: Vector2 | None = main.apple.pos
+        target: int | None = (
+            None if apple is None else int(apple.y) * self.width + int(apple.x)
+        )
+        poisons: set[int] = set(main.poisons.cells)
+        if target != self.target or not poisons <= self.poisons:
+            self.target = target
+            self.poisons = poisons
+            self.rebuild()
+        elif poisons != self.poisons:
+            opened: set[int] = self.poisons - poisons
+            self.poisons = poisons
+            self.repair(opened)
+
+    def obstacle_tracks(self) -> list[tuple[int, int, int, float]]:
+        """
+        Obstacles as (x, width, height, y now), plus the row the spawn timer will
+        add next (placed as far above the board as it has ticks left to wait).
+
+        Returns:
+            list[tuple[int, int, int, float]]: One entry per obstacle.
+        """
+        main: Main = self.main
+        if main.obstacles is None:
+            return []
+        tracks: list[tuple[int, int, int, float]] = [
+            (obstacle.x, obstacle.width, obstacle.height, obstacle.y)
+            for obstacle in main.obstacles
+        ]
+        wait: int = max(
+            1, math.ceil(main.obstacle_spawn_interval - main._obstacle_spawn_timer)
+        )
+        top: float = -main.obstacle_height - main.obstacle_speed * wait
+        for x in Obstacle.row_columns(
+            main.obstacle_width, main.obstacles_count, main.board.width
+        ):
+            tracks.append((x, main.obstacle_width, main.obstacle_height, top))
+        return tracks
+
+    def covered_cells(self, tracks: list[tuple[int, int, int, float]]) -> set[int]:
+        """
+        Cells covered by obstacles now or within `horizon` ticks.
+
+        :param tracks: Result of `obstacle_tracks`.
+        Returns:
+            set[int]: Indexes of the cells to keep out of.
+        """
+        cells: set[int] = set()
+        speed: float = self.main.obstacle_speed
+        for left, width, height, top in tracks:
+            columns: range = range(max(0, left), min(self.width, left + width))
+            for t in range(self.horizon + 1):
+                base: int = math.floor(top + speed * t)
+                for y in range(max(0, base), min(self.height, base + height)):
+                    cells.update(y * self.width + x for x in columns)
+        return cells
+
+    def first_hit(
+        self, tracks: list[tuple[int, int, int, float]], x: int, y: int, ticks: int
+    ) -> int | None:
+        """
+        First tick at which a falling obstacle would cover a cell, within `ticks`.
+        The head entering a cell keeps a body segment there for as many ticks as
+        the snake is long, so that is the window a new head cell must stay clear.
+
+        :param tracks: Result of `obstacle_tracks`.
+        :param x: Grid column of the cell.
+        :param y: Grid row of the cell.
+        :param ticks: Length of the window (0 = the collision check of the next tick).
+        Returns:
+            int | None: The tick offset of the first hit, or None if it stays clear.
+        """
+        speed: float = self.main.obstacle_speed
+        first: int | None = None
+        for left, width, height, top in tracks:
+            if not left <= x < left + width:
+                continue
+            # rows covered after t moves: floor(top + speed * t) .. + height - 1
+            if speed <= 0:
+                start: int = 0 if y - height + 1 <= top < y + 1 else ticks + 1
+            else:
+                start: int = max(0, math.ceil((y - height + 1 - top) / speed))
+                if top + speed * start >= y + 1:
+                    continue  # already below the cell
+            if start <= ticks and (first is None or start < first):
+                first = start
+        return first
+
+    def room(self, start: int, blocked: set[int], limit: int, tail: int) -> int:
+        """
+        Count the free cells reachable from `start` (flood fill), stopping at `limit`.
+        Reaching the tail also counts as enough room: the snake can follow it, and
+        the region grows as the tail moves on.
+
+        :param start: Cell the head would move to.
+        :param blocked: Extra cells to treat as walls (obstacles).
+        :param limit: Enough room; the fill stops once it is reached.
+        :param tail: Cell of the tail.
+        Returns:
+            int: Number of reachable cells (at most `limit`).
+        """
+        snake: bytearray = self.main.board.snake
+        adjacent: list[tuple[int, ...]] = self.adjacent
+        seen: set[int] = {start}
+        frontier: list[int] = [start]
+        while frontier and len(seen) < limit:
+            i: int = frontier.pop()
+            for n in adjacent[i]:
+                if n == tail and n != start:
+                    return limit
+                if n not in seen and not snake[n] and n not in blocked:
+                    seen.add(n)
+                    frontier.append(n)
+        return len(seen)
+
+    def plan(self) -> Vector2 | None:
+        """
+        Pick the next direction (without timing it, see `decide`).
+
+        Returns:
+            Vector2 | None: The direction to take, or None to keep going straight.
+        """
+        main: Main = self.main
+        board: Board = main.board
+        self.sync_field()
+        tracks: list[tuple[int, int, int, float]] = self.obstacle_tracks()
+        blocked: set[int] = self.covered_cells(tracks)
+        head_x, head_y = main.snake.body.cell(0)
+        tail: tuple[int, int] = main.snake.body.cell(-1)
+        tail_cell: int = board.index(*tail)
+        length: int = len(main.snake.body)
+        limit: int = min(length + 2, ROOM_CAP)
+        reverse: tuple[int, int] = (
+            -int(main.snake.direction.x),
+            -int(main.snake.direction.y),
+        )
+
+        best: tuple | None = None
+        for dx, dy in MOVES:
+            if (dx, dy) == reverse:
+                continue
+            x: int = head_x + dx
+            y: int = head_y + dy
+            if not board.in_bounds(x, y):
+                continue
+            i: int = board.index(x, y)
+            # the tail cell frees up this tick unless the snake is growing
+            if board.snake[i] and ((x, y) != tail or main.snake.new_block):
+                continue
+            hit: int | None = self.first_hit(tracks, x, y, length + 2)
+            if hit == 0:
+                continue  # an obstacle is on it already
+            room: int = self.room(i, blocked, limit, tail_cell)
+            key: tuple = (
+                hit is not None,  # a row would fall on the body there
+                room < limit,  # dead ends last
+                board.items[i] == Board.POISON,  # poisons only if nothing else
+                self.distance[i],
+                -room,
+            )
+            if best is None or key < best[0]:
+                best = (key, dx, dy)
+
+        if best is None or (best[1], best[2]) == (-reverse[0], -reverse[1]):
+            return None  # straight on (or every move loses): no turn to record
+        return Vector2(best[1], best[2])
+
+    def decide(self) -> Vector2 | None:
+        """
+        Pick the next direction and record how long planning took.
+
+        Returns:
+            Vector2 | None: The direction to take, or None to keep going straight.
+        """
+        start: int = time.perf_counter_ns()
+        direction: Vector2 | None = self.plan()
+        elapsed: int = time.perf_counter_ns() - start
+        self.decisions += 1
+        self.total_ns += elapsed
+        self.max_ns = max(self.max_ns, elapsed)
+        self.recent_ns.append(elapsed)
+        return direction
+
+    def stats(self) -> dict:
+        """
+        Planning cost so far.
+
+        Returns:
+            dict: decisions, mean/p50/p95/max decision time in microseconds (p50 and
+            p95 over the recent decisions), full field rebuilds (one per apple) and
+            incremental repairs (one per poison eaten).
+        """
+        recent: list[int] = sorted(self.recent_ns)
+        return {
+            "decisions": self.decisions,
+            "mean_us": self.total_ns / self.decisions / 1000 if self.decisions else 0.0,
+            "p50_us": percentile_us(recent, 0.50),
+            "p95_us": percentile_us(recent, 0.95),
+            "max_us": self.max_ns / 1000,
+            "rebuilds": self.rebuilds,
+            "repairs": self.repairs,
+        }
@@ -0,0 +1,442 @@
+import numpy as np
+from settings.settings import (
+    CELL_NUMBER_X,
+    CELL_NUMBER_Y,
+    CELL_SIZE,
+    LEVELS,
+    SCREEN_HEIGHT,
+)
+from classes.Board.Board import Board
+from classes.Obstacle.Obstacle import Obstacle
+
+# Actions, one per game per step (reversing is ignored, like Main.change_direction)
+NOOP: int = 0
+UP: int = 1
+DOWN: int = 2
+LEFT: int = 3
+RIGHT: int = 4
+ACTION_VECTORS: np.ndarray = np.array(
+    [(0, 0), (0, -1), (0, 1), (-1, 0), (1, 0)], dtype=np.int64
+)
+
+# Per-step outcome of each game
+PLAYING: int = 0
+GAME_OVER: int = 1
+WIN: int = 2
+
+OBSTACLE_WIDTH: int = 2  # same as Main.obstacle_width
+OBSTACLE_HEIGHT: int = 2  # same as Main.obstacle_height
+
+
+class BatchGame:
+    """
+    N independent games of one level stepped in lockstep with NumPy array operations.
+    Implements the same rules as `Main`, `Snake`, `Item`, `PoisonField` and `Obstacle`
+    (see `simulation/parity.py`), but every game's state lives in shared arrays:
+    snake ring buffers, occupancy grids, item grids and obstacle rows.
+    Obstacles spawn a whole row at a time and move together, so they are stored per row.
+    Games stay on the base grid, like headless `Main` games: there are no zoom tiers
+    (only the windowed game zooms, see ZOOM_TIERS).
+    """
+
+    def __init__(
+        self, level: str, count: int, seed: int | None = None, max_rows: int = 12
+    ):
+        """
+        Initialize `count` fresh games of the given level.
+
+        :param level: The difficulty level ('easy', 'medium', 'hard').
+        :param count: Number of games to run side by side.
+        :param seed: Seed of the batch RNG (random if None).
+        :param max_rows: Maximum obstacle rows alive at once in one game.
+        """
+        self.level: str = level
+        self.count: int = count
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.has_poisons: bool = level != "easy"
+        self.base_speed: float = LEVELS[level]["move_interval"]
+
+        self.width: int = CELL_NUMBER_X
+        self.height: int = CELL_NUMBER_Y
+        self.cells: int = self.width * self.height
+        self.capacity: int = self.cells + 1  # full board plus the colliding head
+        self.games: np.ndarray = np.arange(count)
+
+        # Snake ring buffers (head at slot `start`, `length` segments)
+        self.body_x: np.ndarray = np.zeros((count, self.capacity), dtype=np.int16)
+        self.body_y: np.ndarray = np.zeros((count, self.capacity), dtype=np.int16)
+        self.start: np.ndarray = np.zeros(count, dtype=np.int64)
+        self.length: np.ndarray = np.zeros(count, dtype=np.int64)
+        self.direction: np.ndarray = np.zeros((count, 2), dtype=np.int64)
+        self.new_block: np.ndarray = np.zeros(count, dtype=bool)
+
+        # Occupancy grids, flat like Board (index = y * width + x)
+        self.snake_grid: np.ndarray = np.zeros((count, self.cells), dtype=np.uint8)
+        self.item_grid: np.ndarray = np.zeros((count, self.cells), dtype=np.uint8)
+        self.apple: np.ndarray = np.full(count, -1, dtype=np.int64)  # apple cell
+
+        # Score and speeds
+        self.score: np.ndarray = np.zeros(count, dtype=np.int64)
+        self.snake_speed: np.ndarray = np.full(count, self.base_speed, dtype=float)
+        self.obstacle_spawn_interval: np.ndarray = np.full(count, 120.0)
+        self.obstacle_timer: np.ndarray = np.zeros(count, dtype=np.int64)
+        self.obstacle_speed: np.ndarray = np.full(count, 0.50)
+        self.obstacles_count: np.ndarray = np.full(count, 4, dtype=np.int64)
+
+        # Obstacle rows: fractional y of the row and which columns it covers
+        self.max_rows: int = max_rows
+        self.row_y: np.ndarray = np.zeros((count, max_rows))
+        self.row_active: np.ndarray = np.zeros((count, max_rows), dtype=bool)
+        self.row_mask: np.ndarray = np.zeros(
+            (count, max_rows, self.width), dtype=bool
+        )
+        # Column mask of a spawned row for each obstacles_count (4..10 in play)
+        self.row_layouts: np.ndarray = np.zeros((21, self.width), dtype=bool)
+        for n in range(1, 21):
+            for x in Obstacle.row_columns(OBSTACLE_WIDTH, n):
+                x = max(0, min(x, max(0, self.width - OBSTACLE_WIDTH)))
+                self.row_layouts[n, x : x + OBSTACLE_WIDTH] = True
+
+        self.outcome: np.ndarray = np.zeros(count, dtype=np.int8)  # of the last step
+        self.games_over: int = 0  # finished rounds so far
+        self.wins: int = 0
+
+        self.reset_games(self.games, outcome=PLAYING)
+        self.obstacle_speed[:] = 0.50  # Main starts at 0.50 (rounds reset to 0.70)
+
+    def step(self, actions: np.ndarray | None = None) -> np.ndarray:
+        """
+        Advance every game by one tick (the batched `Main.update_game`).
+
+        :param actions: One of NOOP/UP/DOWN/LEFT/RIGHT per game (all NOOP if None).
+        Returns:
+            np.ndarray: Outcome of this step per game (PLAYING, GAME_OVER or WIN).
+        """
+        games: np.ndarray = self.games
+        self.outcome[:] = PLAYING
+
+        # Steering, ignoring reversals like Main.change_direction
+        if actions is not None:
+            actions = np.asarray(actions, dtype=np.int64)
+            vectors: np.ndarray = ACTION_VECTORS[actions]
+            turn: np.ndarray = (actions != NOOP) & np.any(
+                vectors != -self.direction, axis=1
+            )
+            self.direction[turn] = vectors[turn]
+
+        # Snake.move_growth: drop the tail unless growing, then push the new head
+        self._pop_tail(games[~self.new_block])
+        self.new_block[:] = False
+        head_x: np.ndarray = self.body_x[games, self.start] + self.direction[:, 0]
+        head_y: np.ndarray = self.body_y[games, self.start] + self.direction[:, 1]
+        self.start = (self.start - 1) % self.capacity
+        self.body_x[games, self.start] = head_x
+        self.body_y[games, self.start] = head_y
+        self.length += 1
+
+        inside: np.ndarray = (
+            (head_x >= 0) & (head_x < self.width) & (head_y >= 0) & (head_y < self.height)
+        )
+        on_board: np.ndarray = games[inside]
+        head: np.ndarray = np.zeros(self.count, dtype=np.int64)
+        head[on_board] = head_y[on_board] * self.width + head_x[on_board]
+        self.snake_grid[on_board, head[on_board]] += 1
+
+        # Main.check_collision_item
+        item: np.ndarray = self.item_grid[on_board, head[on_board]]
+        won: np.ndarray = self._eat_apples(on_board[item == Board.APPLE], head)
+        self._eat_poisons(on_board[item == Board.POISON], head)
+
+        # Main.check_fail: border, self and obstacle collisions
+        self.reset_games(games[~inside], outcome=GAME_OVER)
+        inside[won] = False  # already restarted
+        checked: np.ndarray = games[inside]
+        crashed: np.ndarray = checked[self.snake_grid[checked, head[checked]] > 1]
+        self.reset_games(crashed, outcome=GAME_OVER)
+        if self.level == "hard":
+            self.reset_games(self._obstacle_hits(), outcome=GAME_OVER)
+            self._update_obstacles()
+
+        return self.outcome
+
+    def reset_games(self, indexes: np.ndarray, outcome: int = GAME_OVER):
+        """
+        Start a new round in the given games (`Main.reset_round`).
+
+        :param indexes: Indexes of the games to reset.
+        :param outcome: Recorded in `self.outcome` (GAME_OVER, WIN, or PLAYING on creation).
+        """
+        if not len(indexes):
+            return
+        self.outcome[indexes] = outcome
+        self.games_over += int(outcome == GAME_OVER) * len(indexes)
+        self.wins += int(outcome == WIN) * len(indexes)
+
+        self.snake_grid[indexes] = 0
+        self.item_grid[indexes] = 0
+
+        # Snake.place_start_body: 3 segments in the center, facing right
+        center_x: int = self.width // 2
+        center_y: int = self.height // 2
+        self.start[indexes] = 0
+        self.length[indexes] = 3
+        for i in range(3):
+            self.body_x[indexes, i] = center_x - i
+            self.body_y[indexes, i] = center_y
+            self.snake_grid[indexes, center_y * self.width + center_x - i] = 1
+        self.direction[indexes] = (1, 0)
+        self.new_block[indexes] = False
+
+        self.score[indexes] = 0
+        self.row_active[indexes] = False
+        self.obstacle_spawn_interval[indexes] = 120
+        self.obstacle_speed[indexes] = 0.70
+        self.obstacles_count[indexes] = 4
+        self.snake_speed[indexes] = self.base_speed
+
+        self.apple[indexes] = -1
+        self._place_apples(indexes)
+        if self.has_poisons:
+            self._respawn_poisons(indexes)
+
+    def load_game(self, index: int, main):
+        """
+        Copy the state of a scalar `Main` game into one slot of the batch.
+
+        :param index: Slot to overwrite.
+        :param main: The game to copy (must be of the same level).
+        """
+        cells: list[tuple[int, int]] = list(main.snake.body.cells())
+        self.start[index] = 0
+        self.length[index] = len(cells)
+        self.body_x[index, : len(cells)] = [x for x, _ in cells]
+        self.body_y[index, : len(cells)] = [y for _, y in cells]
+        self.direction[index] = (int(main.snake.direction.x), int(main.snake.direction.y))
+        self.new_block[index] = main.snake.new_block
+
+        self.snake_grid[index] = np.frombuffer(main.board.snake, dtype=np.uint8)
+        self.item_grid[index] = np.frombuffer(main.board.items, dtype=np.uint8)
+        pos = main.apple.pos
+        self.apple[index] = -1 if pos is None else int(pos.y) * self.width + int(pos.x)
+
+        self.score[index] = main.score_HUD.score
+        self.snake_speed[index] = main.snake_speed
+        self.obstacle_spawn_interval[index] = main.obstacle_spawn_interval
+        self.obstacle_timer[index] = main._obstacle_spawn_timer
+        self.obstacle_speed[index] = main.obstacle_speed
+        self.obstacles_count[index] = main.obstacles_count
+
+        self.row_active[index] = False
+        self.row_mask[index] = False
+        rows: dict[float, int] = {}
+        for obstacle in main.obstacles or []:
+            if obstacle.y not in rows:
+                rows[obstacle.y] = len(rows)
+                self.row_y[index, rows[obstacle.y]] = obstacle.y
+                self.row_active[index, rows[obstacle.y]] = True
+            x: int = obstacle.x
+            self.row_mask[index, rows[obstacle.y], x : x + obstacle.width] = True
+
+    def head_cells(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Grid position of every snake head.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: x and y arrays, one entry per game.
+        """
+        return self.body_x[self.games, self.start], self.body_y[self.games, self.start]
+
+    def _pop_tail(self, indexes: np.ndarray):
+        """
+        Remove the tail segment of the given games.
+
+        :param indexes: Indexes of the games whose tail leaves.
+        """
+        slot: np.ndarray = (self.start[indexes] + self.length[indexes] - 1) % self.capacity
+        tail: np.ndarray = (
+            self.body_y[indexes, slot].astype(np.int64) * self.width
+            + self.body_x[indexes, slot]
+        )
+        self.snake_grid[indexes, tail] -= 1
+        self.length[indexes] -= 1
+
+    def _free_mask(self, indexes: np.ndarray) -> np.ndarray:
+        """
+        Cells with neither snake nor item (where items may spawn).
+
+        :param indexes: Indexes of the games to look at.
+        Returns:
+            np.ndarray: Boolean (len(indexes), cells) mask.
+        """
+        return (self.snake_grid[indexes] == 0) & (self.item_grid[indexes] == 0)
+
+    def _place_apples(self, indexes: np.ndarray) -> np.ndarray:
+        """
+        Put the apple on a uniformly random free cell (`Item.randomize_position`).
+
+        :param indexes: Indexes of the games needing an apple.
+        Returns:
+            np.ndarray: Boolean mask, False where the board had no free cell.
+        """
+        free: np.ndarray = self._free_mask(indexes)
+        counts: np.ndarray = free.sum(axis=1)
+        placed: np.ndarray = counts > 0
+        rank: np.ndarray = (self.rng.random(len(indexes)) * counts).astype(np.int64)
+        cell: np.ndarray = np.argmax(free.cumsum(axis=1) > rank[:, None], axis=1)
+        self.apple[indexes[placed]] = cell[placed]
+        self.item_grid[indexes[placed], cell[placed]] = Board.APPLE
+        return placed
+
+    def _respawn_poisons(self, indexes: np.ndarray):
+        """
+        Replace the poisons with a new random set (`PoisonField.respawn`).
+
+        :param indexes: Indexes of the games to respawn poisons in.
+        """
+        if not len(indexes):
+            return
+        self._clear_poisons(indexes)
+        if self.level == "medium":
+            apples: np.ndarray = self.score[indexes]
+            counts: np.ndarray = self.rng.integers(3 + apples, 5 + apples + 1)
+        else:  # hard
+            counts: np.ndarray = self.rng.integers(3, 9, size=len(indexes))
+
+        free: np.ndarray = self._free_mask(indexes)
+        counts = np.minimum(counts, free.sum(axis=1))
+        keys: np.ndarray = self.rng.random(free.shape)
+        keys[~free] = 2.0  # occupied cells sort last
+        widest: int = int(counts.max())
+        if not widest:
+            return
+        # the `widest` smallest keys of each row, then sorted so each game takes its first `count`
+        order: np.ndarray = np.argpartition(keys, widest - 1, axis=1)[:, :widest]
+        order = np.take_along_axis(
+            order, np.argsort(np.take_along_axis(keys, order, axis=1), axis=1), axis=1
+        )
+        rows, ranks = np.nonzero(np.arange(widest) < counts[:, None])
+        self.item_grid[indexes[rows], order[rows, ranks]] = Board.POISON
+
+    def _clear_poisons(self, indexes: np.ndarray):
+        """
+        Remove every poison of the given games.
+
+        :param indexes: Indexes of the games to clear.
+        """
+        grid: np.ndarray = self.item_grid[indexes]
+        grid[grid == Board.POISON] = Board.EMPTY
+        self.item_grid[indexes] = grid
+
+    def _eat_apples(self, eaters: np.ndarray, head: np.ndarray) -> np.ndarray:
+        """
+        Apple collision for the games whose head is on their apple.
+
+        :param eaters: Indexes of the games that ate their apple.
+        :param head: Head cell of every game.
+        Returns:
+            np.ndarray: Indexes of the games won (no cell left for a new apple).
+        """
+        if not len(eaters):
+            return eaters
+        self.new_block[eaters] = True
+        self.score[eaters] += 1
+        self.obstacle_spawn_interval[eaters] = np.maximum(
+            0, self.obstacle_spawn_interval[eaters] - 0.25
+        )
+        self.obstacle_speed[eaters] += 0.005
+        self.obstacles_count[eaters] = self.rng.integers(4, 11, size=len(eaters))
+
+        self.item_grid[eaters, head[eaters]] = Board.EMPTY
+        self.apple[eaters] = -1
+        placed: np.ndarray = self._place_apples(eaters)
+        if not placed.all():  # free the poison cells and try again
+            retry: np.ndarray = eaters[~placed]
+            self._clear_poisons(retry)
+            placed[~placed] = self._place_apples(retry)
+        won: np.ndarray = eaters[~placed]
+        self.reset_games(won, outcome=WIN)
+        eaters = eaters[placed]
+
+        if self.level == "medium":
+            self.snake_speed[eaters] = np.maximum(20.0, self.snake_speed[eaters] - 0.05)
+        if self.has_poisons:
+            self._respawn_poisons(eaters)
+        return won
+
+    def _eat_poisons(self, eaters: np.ndarray, head: np.ndarray):
+        """
+        Poison collision for the games whose head is on a poison.
+
+        :param eaters: Indexes of the games that ate a poison.
+        :param head: Head cell of every game.
+        """
+        if not len(eaters):
+            return
+        self.score[eaters] = np.maximum(0, self.score[eaters] - 1)
+        self.item_grid[eaters, head[eaters]] = Board.EMPTY
+        self._pop_tail(eaters[self.length[eaters] > 3])  # Snake.shrink
+        self.obstacle_spawn_interval[eaters] = np.minimum(
+            120, self.obstacle_spawn_interval[eaters] + 0.25
+        )
+        self.obstacle_speed[eaters] = np.maximum(0.70, self.obstacle_speed[eaters] - 0.005)
+        if self.level == "medium":
+            self.snake_speed[eaters] = np.minimum(
+                LEVELS["medium"]["move_interval"], self.snake_speed[eaters] + 0.05
+            )
+
+    def _obstacle_hits(self) -> np.ndarray:
+        """
+        Games where any snake segment lies under an obstacle.
+        Only the active rows are looked at (a game rarely has more than one or two
+        of its `max_rows` slots in use), each against the board rows it covers.
+
+        Returns:
+            np.ndarray: Indexes of the games that hit an obstacle (ascending).
+        """
+        games, rows = divmod(np.flatnonzero(self.row_active), self.max_rows)
+        if not len(games):
+            return games
+        base_y: np.ndarray = np.floor(self.row_y[games, rows]).astype(np.int64)
+        mask: np.ndarray = self.row_mask[games, rows]  # (active rows, width)
+        grid: np.ndarray = self.snake_grid.reshape(self.count, self.height, self.width)
+        hit: np.ndarray = np.zeros(len(games), dtype=bool)
+        for dy in range(OBSTACLE_HEIGHT):
+            y: np.ndarray = base_y + dy
+            valid: np.ndarray = np.flatnonzero((y >= 0) & (y < self.height))
+            under: np.ndarray = grid[games[valid], y[valid]] > 0  # whole board rows
+            hit[valid] |= np.any(under & mask[valid], axis=1)
+        crashed: np.ndarray = np.zeros(self.count, dtype=bool)
+        crashed[games[hit]] = True
+        return np.flatnonzero(crashed)
+
+    def _update_obstacles(self):
+        """
+        Move, drop and spawn obstacle rows (`Main.update_obstacles`).
+        """
+        # flat views of the row slots, so only the active ones are touched
+        row_y: np.ndarray = self.row_y.reshape(-1)
+        row_active: np.ndarray = self.row_active.reshape(-1)
+        active: np.ndarray = np.flatnonzero(row_active)
+        row_y[active] += self.obstacle_speed[active // self.max_rows]
+        gone: np.ndarray = row_y[active] * CELL_SIZE >= SCREEN_HEIGHT  # off screen
+        row_active[active[gone]] = False
+        active = active[~gone]
+
+        self.obstacle_timer += 1
+        due: np.ndarray = self.obstacle_timer >= self.obstacle_spawn_interval
+        self.obstacle_timer[due] = 0
+        top_occupied: np.ndarray = np.zeros(self.count, dtype=bool)
+        top_occupied[
+            active[np.trunc(row_y[active]) < OBSTACLE_HEIGHT + 1] // self.max_rows
+        ] = True
+        spawn: np.ndarray = np.flatnonzero(due & ~top_occupied)
+        if not len(spawn):
+            return
+        slot: np.ndarray = np.argmin(self.row_active[spawn], axis=1)
+        if self.row_active[spawn, slot].any():
+            raise OverflowError("no free obstacle row, raise max_rows")
+        self.row_y[spawn, slot] = -OBSTACLE_HEIGHT
+        self.row_mask[spawn, slot] = self.row_layouts[
+            np.clip(self.obstacles_count[spawn], 1, len(self.row_layouts) - 1)
+        ]
+        self.row_active[spawn, slot] = True
@@ -0,0 +1,284 @@
+import math
+import random
+from settings.settings import CELL_NUMBER_X, CELL_NUMBER_Y
+
+
+class Board:
+    """
+    Occupancy grid of the game board, updated incrementally as things move.
+    Each layer is a flat bytearray of width * height cells (index = y * width + x),
+    so border, self, obstacle and item checks on the snake head are O(1) lookups.
+    Cells with neither snake nor item are also kept in a swap-remove free list,
+    so a random empty cell can be picked in O(1) however full the board is.
+    """
+
+    EMPTY: int = 0
+    APPLE: int = 1
+    POISON: int = 2
+
+    def __init__(self, width: int = CELL_NUMBER_X, height: int = CELL_NUMBER_Y):
+        """
+        Initialize an empty board.
+
+        :param width: Number of cells horizontally.
+        :param height: Number of cells vertically.
+        """
+        self.width: int = width
+        self.height: int = height
+        self.size: int = width * height
+
+        self.snake: bytearray = bytearray(self.size)  # snake segments per cell
+        self.obstacles: bytearray = bytearray(self.size)  # obstacles per cell
+        self.items: bytearray = bytearray(self.size)  # EMPTY, APPLE or POISON
+
+        # Number of (snake segment, obstacle) pairs sharing a cell, kept up to date
+        # by every add/remove so the obstacle check never walks the snake.
+        self.obstacle_hits: int = 0
+
+        # Free-cell index: free_cells holds every free cell index (unordered) and
+        # free_slot[i] is the position of cell i in free_cells (-1 if occupied).
+        self.free_cells: list[int] = list(range(self.size))
+        self.free_slot: list[int] = list(range(self.size))
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """
+        Check whether a grid coordinate lies on the board.
+
+        :param x: Grid column.
+        :param y: Grid row.
+        Returns:
+            bool: True if (x, y) is inside the board.
+        """
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Flat index of an in-bounds grid coordinate.
+
+        :param x: Grid column.
+        :param y: Grid row.
+        Returns:
+            int: The cell index into the layers.
+        """
+        return y * self.width + x
+
+    def add_snake(self, x: int, y: int):
+        """
+        Mark a snake segment on a cell (off-board cells are ignored).
+
+        :param x: Grid column.
+        :param y: Grid row.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i: int = y * self.width + x
+            if not self.snake[i] and not self.items[i]:
+                self._take_free(i)
+            self.snake[i] += 1
+            self.obstacle_hits += self.obstacles[i]
+
+    def remove_snake(self, x: int, y: int):
+        """
+        Remove a snake segment from a cell (off-board cells are ignored).
+
+        :param x: Grid column.
+        :param y: Grid row.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i: int = y * self.width + x
+            self.snake[i] -= 1
+            self.obstacle_hits -= self.obstacles[i]
+            if not self.snake[i] and not self.items[i]:
+                self._give_free(i)
+
+    def set_item(self, x: int, y: int, kind: int):
+        """
+        Place an item (APPLE or POISON) on a cell.
+
+        :param x: Grid column.
+        :param y: Grid row.
+        :param kind: Board.APPLE or Board.POISON.
+        """
+        i: int = y * self.width + x
+        if not self.snake[i] and not self.items[i]:
+            self._take_free(i)
+        self.items[i] = kind
+
+    def clear_item(self, x: int, y: int):
+        """
+        Remove whatever item is on a cell.
+
+        :param x: Grid column.
+        :param y: Grid row.
+        """
+        i: int = y * self.width + x
+        if self.items[i] and not self.snake[i]:
+            self._give_free(i)
+        self.items[i] = Board.EMPTY
+
+    def is_free(self, x: int, y: int) -> bool:
+        """
+        Check whether a cell has neither a snake segment nor an item on it.
+
+        :param x: Grid column.
+        :param y: Grid row.
+        Returns:
+            bool: True if an item can spawn on the cell.
+        """
+        i: int = y * self.width + x
+        return not self.snake[i] and not self.items[i]
+
+    def free_count(self) -> int:
+        """
+        Number of cells an item could spawn on.
+
+        Returns:
+            int: How many cells have neither snake nor item.
+        """
+        return len(self.free_cells)
+
+    def random_free_cell(self, rng: random.Random) -> tuple[int, int] | None:
+        """
+        Pick a uniformly random cell with neither snake nor item, in O(1).
+
+        :param rng: Random source of the game session.
+        Returns:
+            tuple[int, int] | None: (x, y) of the cell, or None if the board is full.
+        """
+        if not self.free_cells:
+            return None
+        i: int = self.free_cells[rng.randrange(len(self.free_cells))]
+        return i % self.width, i // self.width
+
+    def snapshot(self) -> tuple:
+        """
+        Copy every layer and the free-cell index (in order, so later random picks
+        replay identically after `restore`).
+
+        Returns:
+            tuple: Opaque board state for `restore`.
+        """
+        return (
+            bytes(self.snake),
+            bytes(self.obstacles),
+            bytes(self.items),
+            self.obstacle_hits,
+            self.free_cells[:],
+            self.free_slot[:],
+        )
+
+    def restore(self, snapshot: tuple):
+        """
+        Put back a board state copied by `snapshot` (in place, the layers stay shared).
+
+        :param snapshot: The state returned by `snapshot`.
+        """
+        snake, obstacles, items, self.obstacle_hits, free_cells, free_slot = snapshot
+        self.snake[:] = snake
+        self.obstacles[:] = obstacles
+        self.items[:] = items
+        self.free_cells[:] = free_cells
+        self.free_slot[:] = free_slot
+
+    def remap(self, width: int, height: int, dx: int = 0, dy: int = 0):
+        """
+        Resize the board (in place, the board object stays shared), moving snake
+        segments and items by (dx, dy); whatever lands outside the new size is
+        dropped. The obstacle layer comes back empty: the obstacles are re-added by
+        their owner, since rows above the old board may now be on the new one.
+
+        :param width: New number of cells horizontally.
+        :param height: New number of cells vertically.
+        :param dx: Columns added in front of the old board's cells.
+        :param dy: Rows added above the old board's cells.
+        """
+        old_width: int = self.width
+        snake: bytearray = self.snake
+        items: bytearray = self.items
+        size: int = width * height
+        new_snake: bytearray = bytearray(size)
+        new_items: bytearray = bytearray(size)
+        for i in range(self.size):
+            if snake[i] or items[i]:
+                x: int = i % old_width + dx
+                y: int = i // old_width + dy
+                if 0 <= x < width and 0 <= y < height:
+                    new_snake[y * width + x] = snake[i]
+                    new_items[y * width + x] = items[i]
+
+        self.width = width
+        self.height = height
+        self.size = size
+        self.snake[:] = new_snake
+        self.items[:] = new_items
+        self.obstacles[:] = bytearray(size)
+        self.obstacle_hits = 0
+        self.free_cells[:] = [
+            i for i in range(size) if not new_snake[i] and not new_items[i]
+        ]
+        self.free_slot[:] = [-1] * size
+        for slot, i in enumerate(self.free_cells):
+            self.free_slot[i] = slot
+
+    def _take_free(self, i: int):
+        """
+        Remove cell `i` from the free list (swap with the last entry, then pop).
+
+        :param i: Cell index that just became occupied.
+        """
+        slot: int = self.free_slot[i]
+        last: int = self.free_cells.pop()
+        if last != i:
+            self.free_cells[slot] = last
+            self.free_slot[last] = slot
+        self.free_slot[i] = -1
+
+    def _give_free(self, i: int):
+        """
+        Append cell `i` to the free list.
+
+        :param i: Cell index that just became free.
+        """
+        self.free_slot[i] = len(self.free_cells)
+        self.free_cells.append(i)
+
+    def _obstacle_rows(self, top: float, height: int) -> range:
+        """
+        Rows of an obstacle whose (fractional) top edge is at `top`, clipped to the board.
+
+        :param top: Fractional grid row of the obstacle's top edge.
+        :param height: Obstacle height in cells.
+        Returns:
+            range: The on-board rows covered by the obstacle.
+        """
+        base_y: int = int(math.floor(top))
+        return range(max(0, base_y), min(self.height, base_y + height))
+
+    def add_obstacle(self, x: int, top: float, width: int, height: int):
+        """
+        Mark the cells covered by an obstacle (using the floor of its y, like `Obstacle.get_cells`).
+
+        :param x: Leftmost grid column of the obstacle.
+        :param top: Fractional grid row of the obstacle's top edge.
+        :param width: Obstacle width in cells.
+        :param height: Obstacle height in cells.
+        """
+        for y in self._obstacle_rows(top, height):
+            row: int = y * self.width
+            for i in range(row + max(0, x), row + min(self.width, x + width)):
+                self.obstacles[i] += 1
+                self.obstacle_hits += self.snake[i]
+
+    def remove_obstacle(self, x: int, top: float, width: int, height: int):
+        """
+        Unmark the cells covered by an obstacle.
+
+        :param x: Leftmost grid column of the obstacle.
+        :param top: Fractional grid row of the obstacle's top edge.
+        :param width: Obstacle width in cells.
+        :param height: Obstacle height in cells.
+        """
+        for y in self._obstacle_rows(top, height):
+            row: int = y * self.width
+            for i in range(row + max(0, x), row + min(self.width, x + width)):
+                self.obstacles[i] -= 1
+                self.obstacle_hits -= self.snake[i]
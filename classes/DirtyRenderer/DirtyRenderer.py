@@ -0,0 +1,103 @@
+import pygame as game
+from typing import Callable
+
+
+class DirtyRenderer:
+    """
+    Draws a frame onto the screen by redrawing only what changed since the previous
+    frame, and returns those rectangles for `display.update(rects)`.
+
+    The frame is drawn onto the renderer itself, which records every `blit` as a
+    (surface, rect) pair instead of drawing it. Pairs that appeared or disappeared
+    since the last frame mark their rects dirty (a moved sprite dirties both its old
+    and new place); each dirty rect is restored from the background and everything
+    overlapping it is blitted again, clipped to it, in the original order. A frame
+    where nothing moved costs the recording only, and updates nothing.
+
+    Surfaces are compared by identity, so a sprite whose pixels change must be
+    handed in as a new surface (like the HUD does when the score changes).
+    """
+
+    def __init__(self, screen: game.Surface, background: game.Surface):
+        """
+        :param screen: The display surface.
+        :param background: What the screen shows under everything (screen-sized).
+        """
+        self.screen: game.Surface = screen
+        self.background: game.Surface = background
+        self.bounds: game.Rect = screen.get_rect()
+        self.calls: list[tuple[game.Surface, game.Rect]] = []  # this frame's blits
+        self.drawn: set[tuple] = set()  # (surface, x, y, w, h) of the last frame
+        self.full: bool = True  # the next frame redraws the whole screen
+
+    def invalidate(self):
+        """
+        Redraw the whole screen on the next frame (e.g. after something else drew on it).
+        """
+        self.full = True
+
+    def blit(self, source: game.Surface, dest: game.Rect | tuple) -> game.Rect:
+        """
+        Record a blit (in place of `Surface.blit`, whole surfaces only).
+
+        :param source: The surface to draw.
+        :param dest: Its top-left position, or a rect whose top-left is used.
+        Returns:
+            game.Rect: The area the surface covers.
+        """
+        x, y = dest[0], dest[1]
+        rect: game.Rect = game.Rect(int(x), int(y), *source.get_size())
+        self.calls.append((source, rect))
+        return rect
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> list[game.Rect] | None:
+        """
+        Record several blits (in place of `Surface.blits`).
+
+        :param blit_sequence: (surface, dest) pairs.
+        :param doreturn: If True, return the covered areas.
+        Returns:
+            list[game.Rect] | None: The area of each blit if `doreturn`.
+        """
+        rects: list[game.Rect] = [self.blit(source, dest) for source, dest in blit_sequence]
+        return rects if doreturn else None
+
+    def render(self, draw: Callable[["DirtyRenderer"], None]) -> list[game.Rect]:
+        """
+        Draw a frame.
+
+        :param draw: Draws the frame onto the surface it is given (this renderer).
+        Returns:
+            list[game.Rect]: The screen areas that changed, for `display.update`.
+        """
+        self.calls = []
+        draw(self)
+        calls: list[tuple[game.Surface, game.Rect]] = self.calls
+        drawn: set[tuple] = {(surface, *rect) for surface, rect in calls}
+        screen: game.Surface = self.screen
+
+        if self.full:
+            self.full = False
+            self.drawn = drawn
+            screen.blit(self.background, (0, 0))
+            for surface, rect in calls:
+                screen.blit(surface, rect)
+            return [self.bounds]
+
+        changed: set[tuple] = drawn ^ self.drawn
+        self.drawn = drawn
+        if not changed:
+            return []
+
+        areas: set[tuple] = {
+            tuple(game.Rect(key[1:]).clip(self.bounds)) for key in changed
+        }
+        dirty: list[game.Rect] = [game.Rect(area) for area in areas if area[2] and area[3]]
+        rects: list[game.Rect] = [rect for _, rect in calls]
+        for area in dirty:
+            screen.set_clip(area)
+            screen.blit(self.background, area, area)
+            for i in area.collidelistall(rects):  # in drawing order
+                screen.blit(calls[i][0], rects[i])
+        screen.set_clip(None)
+        return dirty
@@ -0,0 +1,162 @@
+import atexit
+import os
+import numpy as np
+import pygame as game
+from pathlib import Path
+from typing import Callable
+
+# Integer luma weights (ITU-R BT.601, scaled to sum to 256)
+GRAY_WEIGHTS: np.ndarray = np.array([77, 150, 29], dtype=np.uint16)
+
+
+class FrameCapture:
+    """
+    Hands the frames drawn on a surface to a consumer as NumPy arrays, without
+    copying the surface. `frame()` is a view of the surface's own pixels
+    (`surfarray.pixels3d`, transposed to rows first). The downsampled variant is a
+    strided view of that view (nearest pixel, no copy). The grayscale variant is
+    computed in one vectorized pass into a buffer reused from frame to frame.
+    It works on any 24/32-bit surface, including the display of the SDL dummy
+    video driver, so frames can be recorded on a headless server.
+
+    A view locks the surface until it is released, so the surface cannot be
+    drawn on while a view is alive. `capture` hands the frame to the consumer
+    and releases it afterwards; a consumer that keeps frames must copy them.
+    """
+
+    def __init__(
+        self,
+        surface: game.Surface,
+        sink: Callable[[np.ndarray, int], None],
+        scale: int = 1,
+        grayscale: bool = False,
+    ):
+        """
+        :param surface: The surface the frames are drawn on (e.g. the display).
+        :param sink: Called with each frame (height x width x 3 RGB, or height x
+            width if grayscale) and the game tick; the array is only valid
+            during the call.
+        :param scale: Keep every `scale`-th pixel in both directions (1 = full size).
+        :param grayscale: Hand over luma instead of RGB.
+        """
+        self.surface: game.Surface = surface
+        self.sink: Callable[[np.ndarray, int], None] = sink
+        self.scale: int = max(1, int(scale))
+        self.grayscale: bool = grayscale
+        self.gray: np.ndarray | None = None  # reused weighted sums (uint16)
+        self.term: np.ndarray | None = None  # reused weighted channel (uint16)
+        self.gray_frame: np.ndarray | None = None  # reused luma frame (uint8)
+        self.frames: int = 0  # frames handed to the sink
+
+    def frame(self) -> np.ndarray:
+        """
+        The surface's pixels, downsampled if `scale` > 1, as a view (no copy).
+        Delete the view (or let it go out of scope) before drawing on the surface.
+
+        Returns:
+            np.ndarray: height x width x 3 uint8 RGB view of the surface.
+        """
+        pixels: np.ndarray = game.surfarray.pixels3d(self.surface).transpose(1, 0, 2)
+        if self.scale > 1:
+            pixels = pixels[:: self.scale, :: self.scale]
+        return pixels
+
+    def luma(self, pixels: np.ndarray) -> np.ndarray:
+        """
+        Grayscale version of an RGB frame.
+
+        :param pixels: height x width x 3 uint8 RGB frame (e.g. from `frame`).
+        Returns:
+            np.ndarray: height x width uint8 luma, in a buffer that the next
+            frame overwrites.
+        """
+        shape: tuple[int, int] = pixels.shape[:2]
+        if self.gray is None or self.gray.shape != shape:
+            self.gray = np.empty(shape, dtype=np.uint16)
+            self.term = np.empty(shape, dtype=np.uint16)
+            self.gray_frame = np.empty(shape, dtype=np.uint8)
+        gray: np.ndarray = self.gray
+        term: np.ndarray = self.term
+        # Weighted sum of the channels (at most 255 * 256), without temporaries
+        np.multiply(pixels[..., 0], GRAY_WEIGHTS[0], out=gray, dtype=np.uint16)
+        for channel in (1, 2):
+            np.multiply(pixels[..., channel], GRAY_WEIGHTS[channel], out=term, dtype=np.uint16)
+            gray += term
+        np.right_shift(gray, 8, out=self.gray_frame, casting="unsafe")
+        return self.gray_frame
+
+    def capture(self, tick: int = 0):
+        """
+        Hand the current frame to the sink, then release the surface.
+
+        :param tick: Game tick of the frame, passed on to the sink.
+        """
+        pixels: np.ndarray = self.frame()
+        try:
+            self.sink(self.luma(pixels) if self.grayscale else pixels, tick)
+        finally:
+            del pixels  # unlocks the surface
+        self.frames += 1
+
+
+class FrameWriter:
+    """
+    A FrameCapture sink that appends every frame to one file with `np.save` (read
+    them back by calling `np.load` on the open file until it runs out), and the
+    frame's tick, one per line, to a `.ticks` file next to it.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        :param path: File the frames are appended to (created with its folder).
+        """
+        self.path: Path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.frames = self.path.open("ab")
+        self.ticks = self.path.with_name(self.path.name + ".ticks").open("a")
+
+    def __call__(self, frame: np.ndarray, tick: int):
+        """
+        Append one frame (copied into the file, so the view can go right after).
+
+        :param frame: The frame handed over by FrameCapture.
+        :param tick: Game tick of the frame.
+        """
+        np.save(self.frames, frame)
+        self.ticks.write(f"{tick}\n")
+
+    def close(self):
+        """
+        Flush and close both files.
+        """
+        self.frames.close()
+        self.ticks.close()
+
+
+# Shared by every game of the process, so later rounds append to the same file
+_writer: FrameWriter | None = None
+
+
+def capture_from_env(surface: game.Surface) -> FrameCapture | None:
+    """
+    The capture asked for by the environment: GRUBSNAKE_CAPTURE=path.npy records
+    every changed frame there (see FrameWriter), GRUBSNAKE_CAPTURE_SCALE=N keeps
+    every Nth pixel and GRUBSNAKE_CAPTURE_GRAY=1 records luma instead of RGB.
+
+    :param surface: The surface the frames are drawn on (e.g. the display).
+    Returns:
+        FrameCapture | None: The capture, or None if GRUBSNAKE_CAPTURE is not set.
+    """
+    global _writer
+    path: str | None = os.environ.get("GRUBSNAKE_CAPTURE")
+    if not path:
+        return None
+    if _writer is None:
+        _writer = FrameWriter(path)
+        atexit.register(_writer.close)
+    return FrameCapture(
+        surface,
+        _writer,
+        scale=int(os.environ.get("GRUBSNAKE_CAPTURE_SCALE", 1)),
+        grayscale=os.environ.get("GRUBSNAKE_CAPTURE_GRAY", "0") != "0",
+    )
@@ -0,0 +1,75 @@
+import time
+import pygame as game
+
+
+class FramePacer:
+    """
+    Frame pacing for screens that mostly sit still, like the menus.
+    When nothing animates, the loop blocks on `event.wait` until there is
+    something to react to (or `idle_timeout` passes), so an idle menu costs
+    almost no CPU. While tweens run it renders at most `fps` frames a second.
+    When the window is minimized or has lost focus, it drops to
+    `background_fps` whatever is animating.
+    """
+
+    # Events that can only come from a focused window, so they also mean focus is back
+    FOCUS_EVENTS: tuple[int, ...] = (game.WINDOWFOCUSGAINED, game.KEYDOWN, game.MOUSEBUTTONDOWN)
+
+    def __init__(self, fps: int = 60, idle_timeout: int = 1000, background_fps: int = 5):
+        """
+        :param fps: Frame rate cap (always applies, also to bursts of input events).
+        :param idle_timeout: Longest wait for an event when idle, in milliseconds.
+        :param background_fps: Frame rate while minimized or out of focus.
+        """
+        self.fps: int = fps
+        self.idle_timeout: int = idle_timeout
+        self.background_fps: int = background_fps
+        self.enabled: bool = True  # False: no waiting at all (the old busy loop)
+        self.clock: game.time.Clock = game.time.Clock()
+        self.focused: bool = True  # tracked from the window events
+        self.frames: int = 0  # frames paced so far
+        self.waited_ns: int = 0  # time spent blocked or sleeping
+
+    def in_background(self) -> bool:
+        """
+        Returns:
+            bool: True if the window is minimized or out of focus.
+        """
+        return not self.focused or not game.display.get_active()
+
+    def events(self, animating: bool) -> list[game.event.Event]:
+        """
+        Wait until the next frame is due and take its events. Call it once per
+        frame, after the frame is on the display.
+
+        :param animating: True while something on screen changes by itself (tweens).
+        Returns:
+            list[game.event.Event]: The events to handle this frame.
+        """
+        start: int = time.perf_counter_ns()
+        if not self.enabled:
+            events: list[game.event.Event] = game.event.get()
+        elif self.in_background():
+            self.clock.tick(self.background_fps)
+            events = game.event.get()
+        elif animating:
+            self.clock.tick(self.fps)
+            events = game.event.get()
+        else:
+            first: game.event.Event = game.event.wait(self.idle_timeout)
+            self.clock.tick(self.fps)  # no faster than the cap, even for a flood of events
+            events = [] if first.type == game.NOEVENT else [first]
+            events += game.event.get()
+
+        for event in events:
+            if event.type == game.WINDOWFOCUSLOST:
+                self.focused = False
+            elif event.type in self.FOCUS_EVENTS:
+                self.focused = True
+        self.waited_ns += time.perf_counter_ns() - start
+        self.frames += 1
+        return events
+
+
+# Process-wide pacer shared by the menu screens (so the focus state carries over)
+MENU_PACER: FramePacer = FramePacer()
@@ -0,0 +1,60 @@
+import itertools
+import random
+
+_versions = itertools.count(1)  # every RNG state ever produced gets a unique number
+
+
+class GameRandom(random.Random):
+    """
+    The random source of one game session (same number stream as `random.Random`).
+    It tags its current state with a version that changes on every draw, so
+    `Main.snapshot` can skip copying the state (625 ints) when nothing was drawn
+    since the last snapshot, and `Main.restore` can skip putting it back when the
+    game never drew after the fork.
+    """
+
+    def __init__(self, seed: int | None = None):
+        """
+        :param seed: Seed of the stream.
+        """
+        self.version: int = 0
+        self._saved: tuple[int, tuple] | None = None  # (version, state) of last save
+        super().__init__(seed)
+
+    def seed(self, *args, **kwargs):
+        super().seed(*args, **kwargs)
+        self.version = next(_versions)
+
+    def setstate(self, state: tuple):
+        super().setstate(state)
+        self.version = next(_versions)
+
+    def random(self) -> float:
+        self.version = next(_versions)
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.version = next(_versions)
+        return super().getrandbits(k)
+
+    def save(self) -> tuple[int, tuple]:
+        """
+        Current state for `load`, reusing the last copy if nothing was drawn since.
+
+        Returns:
+            tuple[int, tuple]: (version, state).
+        """
+        if self._saved is None or self._saved[0] != self.version:
+            self._saved = (self.version, self.getstate())
+        return self._saved
+
+    def load(self, saved: tuple[int, tuple]):
+        """
+        Go back to a state returned by `save` (a no-op if it is still current).
+
+        :param saved: (version, state) returned by `save`.
+        """
+        version, state = saved
+        if version != self.version:
+            self.setstate(state)
+            self.version = version
@@ -0,0 +1,98 @@
+import pygame as game
+from settings.settings import CELL_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH, ZOOM_TIERS
+
+
+def zoom_tier(score: int) -> int:
+    """
+    The zoom tier a score belongs to.
+
+    :param score: Current score.
+    Returns:
+        int: Index into ZOOM_TIERS.
+    """
+    tier: int = 0
+    for index, (min_score, _) in enumerate(ZOOM_TIERS):
+        if score >= min_score:
+            tier = index
+    return tier
+
+
+class Geometry:
+    """
+    Board geometry at runtime: the cell size in pixels, how many cells fit on the
+    screen, and where the grid is drawn (centered, when the screen is not a whole
+    number of cells). The game shares one instance between everything it draws,
+    so a zoom change is a single `set_cell_size` call.
+    """
+
+    def __init__(
+        self,
+        cell_size: int = CELL_SIZE,
+        screen_width: int = SCREEN_WIDTH,
+        screen_height: int = SCREEN_HEIGHT,
+    ):
+        """
+        :param cell_size: Size of one grid cell in pixels.
+        :param screen_width: Width of the area the board is drawn in, in pixels.
+        :param screen_height: Height of the area the board is drawn in, in pixels.
+        """
+        self.screen_width: int = screen_width
+        self.screen_height: int = screen_height
+        self.cell_size: int = 0
+        self.columns: int = 0
+        self.rows: int = 0
+        self.origin_x: int = 0  # pixel position of the grid's top-left corner
+        self.origin_y: int = 0
+        self.set_cell_size(cell_size)
+
+    def set_cell_size(self, cell_size: int) -> tuple[int, int]:
+        """
+        Change the cell size; the grid gets as many cells as fit on the screen.
+
+        :param cell_size: New size of one grid cell in pixels.
+        Returns:
+            tuple[int, int]: (dx, dy) to add to a cell of the old grid to find the
+            same cell in the new one (the old grid stays centered in the new one).
+        """
+        columns: int = self.screen_width // cell_size
+        rows: int = self.screen_height // cell_size
+        offset: tuple[int, int] = (
+            (columns - self.columns) // 2 if self.columns else 0,
+            (rows - self.rows) // 2 if self.rows else 0,
+        )
+        self.cell_size = cell_size
+        self.columns = columns
+        self.rows = rows
+        self.origin_x = (self.screen_width - columns * cell_size) // 2
+        self.origin_y = (self.screen_height - rows * cell_size) // 2
+        return offset
+
+    def pixel(self, x: float, y: float) -> tuple[int, int]:
+        """
+        Screen position of a grid coordinate.
+
+        :param x: Grid column.
+        :param y: Grid row.
+        Returns:
+            tuple[int, int]: (x, y) in pixels of the cell's top-left corner.
+        """
+        return (
+            self.origin_x + int(x * self.cell_size),
+            self.origin_y + int(y * self.cell_size),
+        )
+
+    def cell_rect(self, x: int, y: int, width: int = 1, height: int = 1) -> game.Rect:
+        """
+        Screen rectangle covering `width` x `height` cells from (x, y).
+
+        :param x: Grid column.
+        :param y: Grid row.
+        :param width: Width in cells.
+        :param height: Height in cells.
+        Returns:
+            game.Rect: The rectangle in pixels.
+        """
+        size: int = self.cell_size
+        return game.Rect(
+            self.origin_x + x * size, self.origin_y + y * size, width * size, height * size
+        )
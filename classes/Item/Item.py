@@ -1,8 +1,9 @@
+import random
 import pygame as game
 from pygame import Vector2
-import random
-from settings.settings import CELL_SIZE, CELL_NUMBER_X, CELL_NUMBER_Y
-import globals.states.score as score_state  # for apples_eaten state tracking
+from classes.Board.Board import Board
+from classes.Geometry.Geometry import Geometry
+from renderers.assets import scaled_image
 
 
 class Item:
@@ -10,19 +11,32 @@ class Item:
     Class representing an item in the game, such as an apple or poison.
     """
 
-    def __init__(self, snake_body: list[Vector2], image_path: str):
+    def __init__(
+        self,
+        board: Board,
+        image_path: str,
+        rng: random.Random,
+        headless: bool = False,
+        geometry: Geometry | None = None,
+    ):
         """
         Initialize an item (like apple) at a valid position.
 
-        :param snake_body: List of Vector2 positions occupied by the snake.
+        :param board: Occupancy grid the item is placed on (as Board.APPLE).
         :param image_path: Path to the item's image file.
+        :param rng: Random source of the game session (picks the item's cells).
+        :param headless: If True, skip loading the image (logic-only item).
+        :param geometry: Cell size and grid position used for drawing (the base one if None).
         """
-        raw_image: game.Surface = game.image.load(image_path).convert_alpha()
-        self.image: game.Surface = game.transform.smoothscale(
-            raw_image, (CELL_SIZE, CELL_SIZE)
-        )
-        self.pos: Vector2 = Vector2(0, 0)
-        self.randomize_position(snake_body)
+        self.image_path: str = image_path
+        self.geometry: Geometry = geometry if geometry is not None else Geometry()
+        self.image: game.Surface | None = None
+        if not headless:
+            self.load_image()
+        self.board: Board = board
+        self.rng: random.Random = rng
+        self.pos: Vector2 | None = None
+        self.randomize_position()
 
     def draw(self, screen: game.Surface):
         """
@@ -30,75 +44,35 @@ class Item:
 
         :param screen: The game surface to draw the item on.
         """
-        rect: game.Rect = game.Rect(
-            int(self.pos.x * CELL_SIZE),
-            int(self.pos.y * CELL_SIZE),
-            CELL_SIZE,
-            CELL_SIZE,
-        )
-        screen.blit(self.image, rect)
+        if self.pos is None:  # not placed (board full)
+            return
+        if self.image.get_width() != self.geometry.cell_size:  # the zoom tier changed
+            self.load_image()
+        screen.blit(self.image, self.geometry.cell_rect(int(self.pos.x), int(self.pos.y)))
 
-    def randomize_position(self, snake_body: list[Vector2], forbidden_positions=None):
+    def load_image(self):
         """
-        Place item randomly, avoiding snake and forbidden positions.
-
-        :param snake_body: List of Vector2 positions occupied by the snake.
-        :param forbidden_positions: List of Vector2 positions to avoid.
+        Take the image for the current cell size from the asset cache.
         """
-        if forbidden_positions is None:
-            forbidden_positions: list[Vector2] = []
+        size: int = self.geometry.cell_size
+        self.image: game.Surface = scaled_image(self.image_path, (size, size), smooth=True)
 
-        while True:
-            x: int = random.randint(0, CELL_NUMBER_X - 1)
-            y: int = random.randint(0, CELL_NUMBER_Y - 1)
-            candidate: Vector2 = Vector2(x, y)
-            if candidate not in snake_body and candidate not in forbidden_positions:
-                self.pos: Vector2 = candidate
-                break
-
-    def spawn_poisons(
-        snake_body: list[Vector2], apple_pos: Vector2, level: str
-    ) -> list[Vector2]:
+    def randomize_position(self) -> bool:
         """
-        Spawn poisons at valid positions avoiding snake and apple.
+        Place item randomly, avoiding the snake and other items on the board.
 
-        :param snake_body: List of Vector2 positions occupied by the snake.
-        :param apple_pos: Vector2 position of the apple.
-        :param level: Current game level ("medium" or "hard").
         Returns:
-          list[Vector2]: List of Vector2 positions for poisons.
+            bool: False if there was no free cell left (the item is then off the board).
         """
-        if level not in ["medium", "hard"]:
-            return []
-
-        forbidden: set[tuple[int, int]] = {
-            (int(seg.x), int(seg.y)) for seg in snake_body
-        }  # positions occupied by the snake
-        forbidden.add((int(apple_pos.x), int(apple_pos.y)))  # position of the apple
-
-        apples_eaten: int = score_state.apples_eaten
-
-        if level == "medium":
-            base_min: int = 3
-            base_max: int = 5  # default max poisons
-            min_limit: int = base_min + apples_eaten  # increase min with apples eaten
-            max_limit: int = base_max + apples_eaten  # increase max with apples eaten
-            count: int = random.randint(min_limit, max_limit)
-        else:  # hard
-            count: int = random.randint(3, 8)
-
-        available: list[tuple[int, int]] = [
-            (x, y)
-            for x in range(CELL_NUMBER_X)  # Iterate over all possible x positions
-            for y in range(CELL_NUMBER_Y)  # Iterate over all possible y positions
-            if (x, y) not in forbidden  # Exclude forbidden positions
-        ]
-
-        chosen: list[tuple[int, int]] = random.sample(
-            available, min(count, len(available))
-        )
-        poisons: list[Vector2] = [
-            Vector2(x, y) for x, y in chosen
-        ]  # Convert to Vector2
-
-        return poisons
+        if self.pos is not None:  # free the previous cell
+            self.board.clear_item(int(self.pos.x), int(self.pos.y))
+
+        cell: tuple[int, int] | None = self.board.random_free_cell(self.rng)
+        if cell is None:  # board full
+            self.pos: Vector2 | None = None
+            return False
+
+        x, y = cell
+        self.pos: Vector2 = Vector2(x, y)
+        self.board.set_item(x, y, Board.APPLE)
+        return True
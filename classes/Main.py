@@ -1,17 +1,17 @@
+import math
 import pygame as game
 import random
 from pygame import Vector2
-from settings.settings import (
-    CELL_NUMBER_X,
-    CELL_NUMBER_Y,
-    CELL_SIZE,
-    LEVELS,
-    MOVE_EVENT,
-)
+from settings.settings import LEVELS, ZOOM_TIERS
+from classes.Board.Board import Board
+from classes.GameRandom.GameRandom import GameRandom
+from classes.Geometry.Geometry import Geometry, zoom_tier
 from classes.Snake.Snake import Snake
 from classes.Item.Item import Item
 from classes.Obstacle.Obstacle import Obstacle
+from classes.PoisonField.PoisonField import PoisonField
 from gui.Hud.Hud import HUD_Score as Score
+from renderers.assets import pack_atlas, scaled_image
 
 
 class Main:
@@ -25,54 +25,117 @@ class Main:
         poison_sound: game.mixer.Sound,
         game_over_sound: game.mixer.Sound,
         selected_level: str,
+        headless: bool = False,
+        seed: int | None = None,
+        persist_high_score: bool = True,
+        zoom: bool | None = None,
     ):
         """
         Initialize the main game with sounds and selected level settings.
 
-        :param eat_sound: Sound to play when the snake eats an apple.
-        :param poison_sound: Sound to play when the snake eats poison.
-        :param game_over_sound: Sound to play on game over.
+        :param eat_sound: Sound to play when the snake eats an apple (None when headless).
+        :param poison_sound: Sound to play when the snake eats poison (None when headless).
+        :param game_over_sound: Sound to play on game over (None when headless).
         :param selected_level: The selected difficulty level ('easy', 'medium', 'hard').
+        :param headless: If True, run only the game logic (no surfaces, sounds or timers).
+        :param seed: Seed of the session's RNG (a fresh one is drawn if None).
+        :param persist_high_score: If False, never write the high score file (replays).
+        :param zoom: Zoom out in score tiers (see ZOOM_TIERS). Defaults to the windowed
+            game only: headless games stay on the base grid, like `BatchGame`.
         """
 
-        self.snake: Snake = Snake()
+        self.headless: bool = headless
+        if not headless:
+            # snake, item and obstacle sprites of every zoom tier, once per process,
+            # so a zoom change mid-game never has to scale anything
+            for _, cell_size in ZOOM_TIERS:
+                pack_atlas(cell_size)
+        # Every random draw of the session comes from this RNG, so the seed plus the
+        # recorded inputs reproduce the whole game (see simulation/replay.py)
+        self.seed: int = random.getrandbits(32) if seed is None else seed
+        self.rng: GameRandom = GameRandom(self.seed)
+        self.tick: int = 0  # number of update_game calls so far
+        self.inputs: list[tuple[int, int, int]] = []  # (tick, dx, dy) of each turn
+        # Cell size and grid size, shared by everything on the board (see set_zoom)
+        self.geometry: Geometry = Geometry(ZOOM_TIERS[0][1])
+        self.zoom: bool = not headless if zoom is None else zoom
+        self.zoom_tier: int = 0  # index into ZOOM_TIERS
+        # occupancy grid shared by snake, items and obstacles
+        self.board: Board = Board(self.geometry.columns, self.geometry.rows)
+        self.snake: Snake = Snake(
+            headless=headless, board=self.board, geometry=self.geometry
+        )
         self.level: str = selected_level
-        self.apple: Item = Item(self.snake.body, "assets/graphics/items/apple.png")
+        self.apple: Item = Item(
+            self.board,
+            "assets/graphics/items/apple.png",
+            self.rng,
+            headless=headless,
+            geometry=self.geometry,
+        )
         self.obstacles: list[Obstacle] = [] if self.level == "hard" else None
 
         # Only medium or hard levels have poison
+        self.has_poisons: bool = self.level != "easy"
         self.poison_image: game.Surface | None = None
-        self.poisons: list[Item] = []
-        if self.level != "easy":
-            raw_image: game.Surface = game.image.load(
-                "assets/graphics/items/poison.png"
-            ).convert_alpha()
-            self.poison_image: game.Surface = game.transform.scale(
-                raw_image, (CELL_SIZE, CELL_SIZE)
-            )
+        self.poisons: PoisonField = PoisonField(self.board, self.rng)
+        if self.has_poisons:
+            if not headless:
+                self.load_poison_image()
 
             # Spawn random poisons initially
-            self.poisons: list[Item] = Item.spawn_poisons(
-                self.snake.body, self.apple.pos, self.level
-            )
+            self.poisons.respawn(self.level, apples_eaten=0)
+        # ms per tick (the screen's TickScheduler follows it)
         self.snake_speed: int = LEVELS[self.level]["move_interval"]
         self.eat_sound: game.mixer.Sound = eat_sound
         self.poison_sound: game.mixer.Sound = poison_sound
         self.game_over_sound: game.mixer.Sound = game_over_sound
-        self.score_HUD: Score = Score(self.level)
+        self.score_HUD: Score = Score(
+            self.level, headless=headless, persist=persist_high_score
+        )
         self.obstacle_spawn_interval: int = 120  # delay interval for obstacle spawning
         self._obstacle_spawn_timer: int = 0  # internal timer for obstacle spawning
 
-        # Movement speed (grid cells per MOVE_EVENT) for obstacles
+        # Movement speed (grid cells per tick) for obstacles
         self.obstacle_speed: float = 0.50
         self.obstacle_width: int = 2
         self.obstacle_height: int = 2
         self.obstacles_count: int = 4  # number of obstacles per row
 
+        # Result of the last finished round: None, "game_over" or "win" (board full)
+        self.outcome: str | None = None
+        self.death_cause: str | None = None  # "border", "self" or "obstacle"
+        self.round_score: int = 0  # score the last finished round ended with
+
+    def play_sound(self, sound: game.mixer.Sound | None):
+        """
+        Play a game sound unless running headless (or no sound was given).
+
+        :param sound: The sound to play.
+        """
+        if not self.headless and sound is not None:
+            sound.play()
+
+    def change_direction(self, direction: Vector2) -> bool:
+        """
+        Turn the snake, ignoring a turn straight back into its own neck.
+        Applied turns are recorded in `inputs` with the tick they take effect on.
+
+        :param direction: The new direction (a unit Vector2 along one axis).
+        Returns:
+            bool: True if the direction was applied.
+        """
+        if direction == -self.snake.direction:
+            return False
+        self.snake.direction = Vector2(direction)
+        self.inputs.append((self.tick, int(direction.x), int(direction.y)))
+        return True
+
     def update_game(self):
         """
         Update the game state: move the snake, check for collisions and game over.
         """
+        self.tick += 1
         self.snake.move_growth()
         self.check_collision_item()
         self.check_fail()
@@ -87,9 +150,20 @@ class Main:
 
         # Move existing obstacles down
         for obstacle in self.obstacles[:]:
+            old_y: float = obstacle.y
             obstacle.move(speed=self.obstacle_speed)
             if obstacle.is_off_screen():
+                self.board.remove_obstacle(
+                    obstacle.x, old_y, obstacle.width, obstacle.height
+                )
                 self.obstacles.remove(obstacle)  # Remove off-screen obstacles
+            elif math.floor(old_y) != math.floor(obstacle.y):  # entered a new grid row
+                self.board.remove_obstacle(
+                    obstacle.x, old_y, obstacle.width, obstacle.height
+                )
+                self.board.add_obstacle(
+                    obstacle.x, obstacle.y, obstacle.width, obstacle.height
+                )
 
         # Timer-based spawn: spawn rows periodically, only if top area is free
         self._obstacle_spawn_timer += 1
@@ -113,75 +187,73 @@ class Main:
             count=self.obstacles_count,
         )
 
-    def draw_elements(self, screen: game.Surface):
+    def draw_elements(self, screen: game.Surface, alpha: float | None = None):
         """
         Draw all game elements on the screen.
 
         :param screen: The game screen surface to draw on.
+        :param alpha: Elapsed fraction of the current tick, to draw the snake and
+            obstacles in between ticks (items never move between ticks); None
+            draws everything on its cells.
         """
         self.apple.draw(screen)
 
         # Draw all poisons
         if self.poison_image:
             for pos in self.poisons:
-                screen.blit(self.poison_image, (pos.x * CELL_SIZE, pos.y * CELL_SIZE))
+                screen.blit(self.poison_image, self.geometry.pixel(pos.x, pos.y))
 
-        self.snake.draw_snake(screen)
+        self.snake.draw_snake(screen, alpha)
         self.score_HUD.draw_score(screen, (20, 20))
 
         if self.obstacles:  # draw obstacles if any
             for obstacle in self.obstacles:
-                obstacle.draw(screen)  # draw each obstacle
+                obstacle.draw(screen, alpha)  # draw each obstacle
 
     def check_collision_item(self):
         """
         Check for collisions between the snake and items (apple and poison).
         """
-        head: Vector2 = self.snake.body[0]
+        x, y = self.snake.body.cell(0)  # head
+        if not self.board.in_bounds(x, y):
+            return  # off the board, check_fail will end the game
+        item: int = self.board.items[self.board.index(x, y)]
 
         # Apple collision
-        if head == self.apple.pos:
-            self.eat_sound.play()
+        if item == Board.APPLE:
+            self.play_sound(self.eat_sound)
             self.snake.grow()  # grow the snake on apple collision
             self.score_HUD.add_score(1)
+            self.update_zoom()  # before respawning, so the items can use the new cells
             # the delay interval of obstacle spawning decreases as score increases
             self.obstacle_spawn_interval = max(
                 0, self.obstacle_spawn_interval - 0.25
             )  # speed up obstacle spawn
             # the speed of obstacles increases as score increases
             self.obstacle_speed += 0.005  # increase obstacle speed
-            self.obstacles_count: int = random.randint(
+            self.obstacles_count: int = self.rng.randint(
                 4, 10
             )  # randomize number of obstacles
 
-            self.apple.randomize_position(
-                self.snake.body, forbidden_positions=self.poisons
-            )
+            if not self.apple.randomize_position():
+                self.poisons.clear()  # respawned below anyway, free their cells
+                if not self.apple.randomize_position():
+                    self.game_won()  # no free cell left: the snake fills the board
+                    return
 
             # medium level speed increases slightly with each apple eaten
             if self.level == "medium":
                 self.snake_speed = max(20.0, self.snake_speed - 0.05)
-                game.time.set_timer(
-                    MOVE_EVENT, int(self.snake_speed)
-                )  # update timer interval
-
-            Item.spawn_poisons(
-                self.snake.body,
-                self.apple.pos,
-                self.level,
-            )
 
-            if self.poison_image:
-                self.poisons: list[Vector2] = Item.spawn_poisons(
-                    self.snake.body, self.apple.pos, self.level
-                )
+            if self.has_poisons:
+                self.poisons.respawn(self.level, apples_eaten=self.score_HUD.score)
             return
 
         # Poison collision
-        if self.poison_image and head in self.poisons:
-            self.poison_sound.play()
+        if item == Board.POISON:
+            self.play_sound(self.poison_sound)
             self.score_HUD.subtract_score(1)
-            self.poisons.remove(head)
+            self.poisons.remove(x, y)
             self.snake.shrink()  # shrink the snake on poison collision
             # increase the delay interval but not above base 120
             self.obstacle_spawn_interval: int = min(
@@ -194,49 +266,61 @@ class Main:
                 self.snake_speed = min(  # decrease speed but not above base
                     LEVELS["medium"]["move_interval"], self.snake_speed + 0.05
                 )
-                game.time.set_timer(
-                    MOVE_EVENT, int(self.snake_speed)
-                )  # update timer interval
 
     def check_fail(self):
         """
         Check for game over conditions: border collision, self-collision, obstacle collision.
         """
-        head: Vector2 = self.snake.body[0]
+        x, y = self.snake.body.cell(0)  # head
 
         # Border collision
-        if (
-            head.x < 0
-            or head.x >= CELL_NUMBER_X
-            or head.y < 0
-            or head.y >= CELL_NUMBER_Y
-        ):
-            self.game_over()
+        if not self.board.in_bounds(x, y):
+            self.game_over("border")
             return
 
-        # Self collision
-        if head in self.snake.body[1:]:
-            self.game_over()
+        # Self collision (the head shares its cell with another segment)
+        if self.board.snake[self.board.index(x, y)] > 1:
+            self.game_over("self")
 
-        # Obstacle collision
-        if self.level == "hard" and self.obstacles is not None:
-            for obstacle in self.obstacles:
-                obstacle_cells: set[tuple[int, int]] = {
-                    (int(c.x), int(c.y)) for c in obstacle.get_cells()
-                }
-                for segment in self.snake.body:
-                    seg: tuple[int, int] = (int(segment.x), int(segment.y))
-                    if seg in obstacle_cells:
-                        self.game_over()
-                        return
+        # Obstacle collision (any snake segment under an obstacle)
+        if self.level == "hard" and self.board.obstacle_hits > 0:
+            self.game_over("obstacle")
+            return
+
+    def game_over(self, cause: str | None = None):
+        """
+        Handle game over: play sound and start a new round.
+
+        :param cause: What ended the round ("border", "self" or "obstacle").
+        """
+        self.outcome: str = "game_over"
+        self.death_cause: str | None = cause
+        self.round_score: int = self.score_HUD.score
+        self.play_sound(self.game_over_sound)
+        self.reset_round()
+
+    def game_won(self):
+        """
+        Handle a win (board full, no cell left for the apple): start a new round.
+        """
+        self.outcome: str = "win"
+        self.death_cause: str | None = None
+        self.round_score: int = self.score_HUD.score
+        self.play_sound(self.eat_sound)
+        self.reset_round()
 
-    def game_over(self):
+    def reset_round(self):
         """
-        Handle game over: play sound, reset snake, score, obstacles, and respawn items.
+        Reset snake, score, obstacles, speeds, zoom, and respawn items.
         """
-        self.game_over_sound.play()
+        if self.zoom_tier:
+            self.set_zoom(0)  # back to the base grid before the snake is re-centered
         self.snake.reset()
         self.score_HUD.reset()
+        for obstacle in self.obstacles or []:
+            self.board.remove_obstacle(
+                obstacle.x, obstacle.y, obstacle.width, obstacle.height
+            )
         self.obstacles: list[Obstacle] = (
             [] if self.level == "hard" else None
         )  # reset obstacles
@@ -244,10 +328,139 @@ class Main:
         self.obstacle_speed: float = 0.70  # reset obstacle speed
         self.obstacles_count: int = 4  # reset obstacle count
         self.snake_speed: int = LEVELS[self.level]["move_interval"]
-        game.time.set_timer(MOVE_EVENT, int(self.snake_speed))  # reset timer interval
 
-        self.apple.randomize_position(self.snake.body)  # respawn apple
-        if self.poison_image:  # respawn poisons
-            self.poisons: list[Item] = Item.spawn_poisons(
-                self.snake.body, self.apple.pos, self.level
-            )
+        self.poisons.clear()
+        self.apple.randomize_position()  # respawn apple
+        if self.has_poisons:  # respawn poisons
+            self.poisons.respawn(self.level, apples_eaten=0)
+
+    def snapshot(self) -> tuple:
+        """
+        Capture the logical game state (no surfaces or sounds) so a search can fork
+        the game and come back: snake, direction, growth, apple, poisons, obstacles
+        (with their fractional y), timers, speeds, score, tick and RNG state.
+
+        Returns:
+            tuple: Opaque state for `restore`.
+        """
+        return (
+            self.board.snapshot(),
+            self.snake.body.snapshot(),
+            self.snake.direction,
+            self.snake.new_block,
+            self.apple.pos,
+            self.poisons.snapshot(),
+            None
+            if self.obstacles is None
+            else [
+                (obstacle, obstacle.x, obstacle.y, obstacle.pos)
+                for obstacle in self.obstacles
+            ],
+            self.snake_speed,
+            self.obstacle_spawn_interval,
+            self._obstacle_spawn_timer,
+            self.obstacle_speed,
+            self.obstacles_count,
+            self.score_HUD.score,
+            self.tick,
+            len(self.inputs),
+            self.outcome,
+            self.death_cause,
+            self.round_score,
+            self.rng.save(),
+            self.zoom_tier,
+        )
+
+    def restore(self, snapshot: tuple):
+        """
+        Go back to a state captured by `snapshot`. Turns recorded since then are
+        dropped from the input log. The high score is left alone.
+
+        :param snapshot: The state returned by `snapshot`.
+        """
+        (
+            board,
+            body,
+            self.snake.direction,
+            self.snake.new_block,
+            apple,
+            poisons,
+            obstacles,
+            self.snake_speed,
+            self.obstacle_spawn_interval,
+            self._obstacle_spawn_timer,
+            self.obstacle_speed,
+            self.obstacles_count,
+            score,
+            self.tick,
+            inputs,
+            self.outcome,
+            self.death_cause,
+            self.round_score,
+            rng,
+            tier,
+        ) = snapshot
+        if tier != self.zoom_tier:
+            self.set_zoom(tier)  # resize the board first, its contents come next
+        self.board.restore(board)
+        self.apple.pos = apple
+        self.score_HUD.set_score(score)
+        self.snake.body.restore(body)
+        self.poisons.restore(poisons)
+        if obstacles is not None:
+            # Obstacles only ever move (down, or along with a zoom change), so the
+            # objects are reused with their old position
+            self.obstacles = []
+            for obstacle, x, y, pos in obstacles:
+                obstacle.x = x
+                obstacle.y = y
+                obstacle.pos = pos
+                self.obstacles.append(obstacle)
+        del self.inputs[inputs:]
+        self.rng.load(rng)
+
+    def load_poison_image(self):
+        """
+        Take the poison image for the current cell size from the asset cache.
+        """
+        size: int = self.geometry.cell_size
+        self.poison_image: game.Surface = scaled_image(
+            "assets/graphics/items/poison.png", (size, size)
+        )
+
+    def update_zoom(self):
+        """
+        Zoom out if the score reached a new tier (never back in during a round).
+        """
+        if not self.zoom:
+            return
+        tier: int = zoom_tier(self.score_HUD.score)
+        if tier > self.zoom_tier:
+            self.set_zoom(tier)
+
+    def set_zoom(self, tier: int):
+        """
+        Switch to a zoom tier: the board takes the grid size of the tier's cell
+        size, and snake, items and obstacles keep their cells relative to the
+        center (off-board ones are dropped when zooming back in). Costs one pass
+        over the board; the sprites of every tier are already in the asset cache.
+
+        :param tier: Index into ZOOM_TIERS.
+        """
+        old_width: int = self.board.width
+        dx, dy = self.geometry.set_cell_size(ZOOM_TIERS[tier][1])
+        self.zoom_tier = tier
+        self.board.remap(self.geometry.columns, self.geometry.rows, dx, dy)
+        self.snake.body.remap(dx, dy, capacity=self.board.size + 1)
+        self.poisons.remap(old_width, dx, dy)
+        if self.apple.pos is not None:
+            x: int = int(self.apple.pos.x) + dx
+            y: int = int(self.apple.pos.y) + dy
+            self.apple.pos = Vector2(x, y) if self.board.in_bounds(x, y) else None
+        for obstacle in self.obstacles or []:
+            obstacle.x += dx
+            obstacle.y += dy
+            obstacle.pos = Vector2(obstacle.x, obstacle.y)
+            self.board.add_obstacle(obstacle.x, obstacle.y, obstacle.width, obstacle.height)
+        if self.poison_image is not None:
+            self.load_poison_image()
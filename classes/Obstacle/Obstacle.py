@@ -1,7 +1,9 @@
 import math
 import pygame as game
 import random
-from settings.settings import CELL_NUMBER_X, CELL_SIZE, SCREEN_HEIGHT
+from settings.settings import CELL_NUMBER_X
+from classes.Geometry.Geometry import Geometry
+from renderers.assets import scaled_image
 
 
 class Obstacle:
@@ -11,43 +13,84 @@ class Obstacle:
     Optional `x` param to specify column; if None, chooses randomly.
     """
 
-    def __init__(self, image_path: str, width: int, height: int, x: int | None = None):
+    def __init__(
+        self,
+        image_path: str,
+        width: int,
+        height: int,
+        x: int | None = None,
+        headless: bool = False,
+        rng: random.Random | None = None,
+        geometry: Geometry | None = None,
+    ):
         """
         :param image_path: Path to the obstacle image.
         :param width: How many cells wide the obstacle is.
         :param height: How many cells high the obstacle is.
         :param x: optional fixed X column to spawn at (grid coordinate).
+        :param headless: If True, skip loading the image (logic-only obstacle).
+        :param rng: Random source picking `x` when it is None (module-level RNG if None).
+        :param geometry: Grid size, cell size and grid position (the base one if None).
         """
         # Clamp width and height to at least 1
         self.width: int = max(1, int(width))
         self.height: int = max(1, int(height))
+        self.image_path: str = image_path
+        self.geometry: Geometry = geometry if geometry is not None else Geometry()
 
-        raw_img: game.Surface = game.image.load(image_path).convert_alpha()
-        self.image: game.Surface = game.transform.scale(
-            raw_img, (CELL_SIZE * self.width, CELL_SIZE * self.height)
-        )
+        self.image: game.Surface | None = None
+        if not headless:
+            self.load_image()
 
         # Choose random X if not specified or out of bounds
+        columns: int = self.geometry.columns
         if x is None:
-            self.x: int = random.randint(0, max(0, CELL_NUMBER_X - self.width))
+            self.x: int = (rng or random).randint(0, max(0, columns - self.width))
         else:
             # clamp to valid range
-            self.x: int = max(0, min(x, max(0, CELL_NUMBER_X - self.width)))
+            self.x: int = max(0, min(x, max(0, columns - self.width)))
 
         # Start just above the visible screen so the row enters smoothly
         self.y: int = -self.height
         self.pos: game.math.Vector2 = game.math.Vector2(self.x, self.y)
+        # (y before, y after) the last move, for drawing it in between ticks
+        self.last_move: tuple[float, float] | None = None
 
-    def draw(self, screen: game.Surface):
+    def draw(self, screen: game.Surface, alpha: float | None = None):
         """
-        Draw the obstacle at its grid-aligned position (rounded y).
+        Draw the obstacle at its grid-aligned position (rounded y), or part way
+        through its last move.
 
         :param screen: Pygame surface to draw on.
+        :param alpha: Elapsed fraction of the current tick: the obstacle is drawn at
+            its fractional y, blended from before to after its last move (one tick
+            behind, like the snake). None draws it at its grid row.
 
         """
-        pixel_y: int = int(self.y) * CELL_SIZE
-        if pixel_y + (self.height * CELL_SIZE) >= 0 and pixel_y < SCREEN_HEIGHT:
-            screen.blit(self.image, (self.x * CELL_SIZE, pixel_y))
+        geometry: Geometry = self.geometry
+        if self.image.get_width() != geometry.cell_size * self.width:  # zoom changed
+            self.load_image()
+        y: float = int(self.y)
+        if alpha is not None:
+            y = self.y
+            if self.last_move is not None and self.last_move[1] == self.y:
+                y = self.last_move[0] + (self.y - self.last_move[0]) * alpha
+        pixel_y: int = int(y * geometry.cell_size)
+        if (
+            pixel_y + (self.height * geometry.cell_size) >= 0
+            and pixel_y < geometry.rows * geometry.cell_size
+        ):
+            screen.blit(self.image, geometry.pixel(self.x, y))
+
+    def load_image(self):
+        """
+        Take the image for the current cell size from the asset cache (a shared
+        surface: no disk I/O or scaling when a row spawns or the zoom changes).
+        """
+        size: int = self.geometry.cell_size
+        self.image: game.Surface = scaled_image(
+            self.image_path, (size * self.width, size * self.height)
+        )
 
     def move(self, speed: float):
         """
@@ -55,8 +98,10 @@ class Obstacle:
 
         :param speed: Speed in grid cells per update (can be fractional).
         """
+        old_y: float = self.y
         self.y += speed
         self.pos: game.math.Vector2 = game.math.Vector2(self.x, self.y)
+        self.last_move = (old_y, self.y)
 
     def get_cells(self) -> list[game.math.Vector2]:
         """
@@ -73,16 +118,20 @@ class Obstacle:
                 cells.append(game.math.Vector2(self.x + dx, base_y + dy))
         return cells
 
-    def spawn_obstacle_row(self, obstacle_width: int, obstacle_height: int, count: int):
+    @staticmethod
+    def row_columns(
+        obstacle_width: int, count: int, total_slots: int = CELL_NUMBER_X
+    ) -> list[int]:
         """
-        Spawn `count` obstacles distributed evenly across the top row.
+        Columns of `count` obstacles distributed evenly across a row.
 
         :param obstacle_width: Width of each obstacle in grid cells.
-        :param obstacle_height: Height of each obstacle in grid cells.
-        :param count: Number of obstacles to spawn in the row (will be clamped to fit).
+        :param count: Number of obstacles in the row (will be clamped to fit).
+        :param total_slots: Number of columns of the board.
+        Returns:
+            list[int]: The leftmost grid column of each obstacle.
         """
         width: int = max(1, int(obstacle_width))
-        total_slots: int = CELL_NUMBER_X
 
         # Use a layout width that cannot exceed the grid to avoid negative spacing.
         layout_width: int = min(width, total_slots)
@@ -100,6 +149,7 @@ class Obstacle:
         base_gap: int = leftover // gaps if gaps > 0 else 0
         extra: int = leftover % gaps if gaps > 0 else 0
 
+        columns: list[int] = []
         current_x: int = 0
         for i in range(count):
             # gap before this obstacle
@@ -108,25 +158,44 @@ class Obstacle:
                 extra -= 1
             current_x += gap_size
 
+            columns.append(current_x)
+
+            # move past this obstacle for next iteration
+            current_x += layout_width
+        return columns
+
+    def spawn_obstacle_row(self, obstacle_width: int, obstacle_height: int, count: int):
+        """
+        Spawn `count` obstacles distributed evenly across the top row.
+
+        :param obstacle_width: Width of each obstacle in grid cells.
+        :param obstacle_height: Height of each obstacle in grid cells.
+        :param count: Number of obstacles to spawn in the row (will be clamped to fit).
+        """
+        width: int = max(1, int(obstacle_width))
+        for current_x in Obstacle.row_columns(width, count, self.board.width):
             # instantiate obstacle at column current_x
             ob: Obstacle = Obstacle(
                 "assets/graphics/items/trap.png",
                 width=width,
                 height=obstacle_height,
                 x=current_x,
+                headless=self.headless,
+                rng=self.rng,
+                geometry=self.geometry,
             )
             self.obstacles.append(ob)
-
-            # move past this obstacle for next iteration
-            current_x += layout_width
+            self.board.add_obstacle(ob.x, ob.y, ob.width, ob.height)
 
     def is_off_screen(self) -> bool:
         """
         Return whether the obstacle has moved past the bottom edge of the screen.
-        An obstacle is considered off-screen if its top edge has reached or exceeded SCREEN_HEIGHT.
+        An obstacle is considered off-screen if its top edge has reached or exceeded the bottom of the grid.
 
         Returns:
             bool: True if the obstacle is off the bottom of the screen, False otherwise.
         """
 
-        return self.y * CELL_SIZE >= SCREEN_HEIGHT
+        # compared in pixels, like it always was, so the float rounding is unchanged
+        size: int = self.geometry.cell_size
+        return self.y * size >= self.geometry.rows * size
@@ -0,0 +1,139 @@
+import random
+from typing import Iterator
+from pygame import Vector2
+from classes.Board.Board import Board
+
+
+class PoisonField:
+    """
+    The poisons currently on the board.
+    Membership is the board's item layer (O(1)), removal is a swap-remove through
+    a cell -> slot map (O(1)), and respawning draws from the board's free-cell index,
+    so no operation scans the grid.
+    """
+
+    def __init__(self, board: Board, rng: random.Random):
+        """
+        Initialize an empty poison field.
+
+        :param board: Occupancy grid the poisons are marked on (as Board.POISON).
+        :param rng: Random source of the game session.
+        """
+        self.board: Board = board
+        self.rng: random.Random = rng
+        self.cells: list[int] = []  # cell index of each poison
+        self.slot: dict[int, int] = {}  # cell index -> position in self.cells
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __contains__(self, pos: Vector2) -> bool:
+        x: int = int(pos.x)
+        y: int = int(pos.y)
+        return (
+            self.board.in_bounds(x, y)
+            and self.board.items[self.board.index(x, y)] == Board.POISON
+        )
+
+    def __iter__(self) -> Iterator[Vector2]:
+        width: int = self.board.width
+        for i in self.cells:
+            yield Vector2(i % width, i // width)
+
+    def add(self, x: int, y: int):
+        """
+        Put a poison on a free cell.
+
+        :param x: Grid column.
+        :param y: Grid row.
+        """
+        i: int = self.board.index(x, y)
+        self.slot[i] = len(self.cells)
+        self.cells.append(i)
+        self.board.set_item(x, y, Board.POISON)
+
+    def remove(self, x: int, y: int):
+        """
+        Remove the poison on a cell (e.g. when the snake eats it).
+
+        :param x: Grid column.
+        :param y: Grid row.
+        """
+        i: int = self.board.index(x, y)
+        slot: int = self.slot.pop(i)
+        last: int = self.cells.pop()
+        if last != i:  # move the last poison into the freed slot
+            self.cells[slot] = last
+            self.slot[last] = slot
+        self.board.clear_item(x, y)
+
+    def clear(self):
+        """
+        Remove every poison from the board.
+        """
+        width: int = self.board.width
+        for i in self.cells:
+            self.board.clear_item(i % width, i // width)
+        self.cells.clear()
+        self.slot.clear()
+
+    def snapshot(self) -> list[int]:
+        """
+        Copy the poison cells (their order matters for later swap-removes).
+
+        Returns:
+            list[int]: Cell index of each poison.
+        """
+        return self.cells[:]
+
+    def restore(self, cells: list[int]):
+        """
+        Put back the poisons copied by `snapshot` (the board is restored separately).
+
+        :param cells: Cell index of each poison.
+        """
+        self.cells[:] = cells
+        self.slot = {i: slot for slot, i in enumerate(cells)}
+
+    def remap(self, old_width: int, dx: int, dy: int):
+        """
+        Follow a `Board.remap`: re-index the poisons for the new board width,
+        dropping those that ended up off the board.
+
+        :param old_width: Board width the cell indexes were computed for.
+        :param dx: Columns added in front of the old board's cells.
+        :param dy: Rows added above the old board's cells.
+        """
+        cells: list[int] = []
+        for i in self.cells:
+            x: int = i % old_width + dx
+            y: int = i // old_width + dy
+            if self.board.in_bounds(x, y):
+                cells.append(self.board.index(x, y))
+        self.restore(cells)
+
+    def respawn(self, level: str, apples_eaten: int = 0):
+        """
+        Replace the poisons with a new random set, avoiding snake and items.
+        Each poison takes one O(1) draw from the free-cell index; taking a cell
+        removes it from the index, so the draws never repeat.
+
+        :param level: Current game level ("medium" or "hard").
+        :param apples_eaten: Apples eaten this round (raises the count on medium).
+        """
+        self.clear()
+        if level not in ["medium", "hard"]:
+            return
+
+        if level == "medium":
+            base_min: int = 3
+            base_max: int = 5  # default max poisons
+            min_limit: int = base_min + apples_eaten  # increase min with apples eaten
+            max_limit: int = base_max + apples_eaten  # increase max with apples eaten
+            count: int = self.rng.randint(min_limit, max_limit)
+        else:  # hard
+            count: int = self.rng.randint(3, 8)
+
+        for _ in range(min(count, self.board.free_count())):
+            x, y = self.board.random_free_cell(self.rng)
+            self.add(x, y)
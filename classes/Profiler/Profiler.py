@@ -0,0 +1,233 @@
+import atexit
+import csv
+import functools
+import json
+import os
+import time
+from array import array
+from pathlib import Path
+from typing import Callable
+
+
+def percentile_us(recent: list[int], q: float) -> float:
+    """
+    Percentile of sorted nanosecond samples (nearest rank), in microseconds.
+
+    :param recent: The samples, sorted.
+    :param q: Quantile between 0 and 1 (e.g. 0.95).
+    Returns:
+        float: The percentile in microseconds (0.0 without samples).
+    """
+    if not recent:
+        return 0.0
+    return recent[min(len(recent) - 1, int(q * len(recent)))] / 1000
+
+
+class Span:
+    """
+    Timings of one named phase, kept in a fixed-size ring buffer (the most recent
+    `size` samples) plus all-time count, total and max.
+    """
+
+    def __init__(self, size: int):
+        """
+        :param size: Number of recent samples kept for percentiles.
+        """
+        self.samples: array = array("q", [0]) * size  # nanoseconds
+        self.next: int = 0  # slot the next sample goes to
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+
+    def add(self, ns: int):
+        """
+        Record one sample.
+
+        :param ns: Duration in nanoseconds.
+        """
+        self.samples[self.next] = ns
+        self.next = (self.next + 1) % len(self.samples)
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: count, then mean, p50, p95, p99 (recent samples) and max in microseconds.
+        """
+        recent: list[int] = sorted(self.samples[: min(self.count, len(self.samples))])
+        mean: float = self.total / self.count / 1000 if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_us": round(mean, 3),
+            "p50_us": percentile_us(recent, 0.50),
+            "p95_us": percentile_us(recent, 0.95),
+            "p99_us": percentile_us(recent, 0.99),
+            "max_us": self.max / 1000,
+        }
+
+
+class Profiler:
+    """
+    Named timing spans around functions and methods.
+    Spans are added by swapping the function for a timing wrapper when the profiler
+    is enabled, and swapping the original back when it is disabled, so a disabled
+    profiler costs nothing at all on the instrumented calls.
+    """
+
+    def __init__(self, size: int = 4096):
+        """
+        :param size: Samples kept per span (ring buffer size).
+        """
+        self.size: int = size
+        self.enabled: bool = False
+        self.spans: dict[str, Span] = {}
+        # stats measured elsewhere, read when the stats are (e.g. the tick jitter)
+        self.gauges: dict[str, Callable[[], dict]] = {}
+        self._patched: list[tuple[object, str, object]] = []  # (owner, attr, original)
+
+    def record(self, name: str, ns: int):
+        """
+        Add a sample to a span (creating it on first use).
+
+        :param name: Span name.
+        :param ns: Duration in nanoseconds.
+        """
+        span: Span | None = self.spans.get(name)
+        if span is None:
+            span = self.spans[name] = Span(self.size)
+        span.add(ns)
+
+    def gauge(self, name: str, read: Callable[[], dict]):
+        """
+        Report stats kept by someone else next to the spans (replacing an earlier
+        gauge of the same name), e.g. `TickScheduler.jitter`.
+
+        :param name: Name of the entry in the stats.
+        :param read: Returns the current stats as a flat dict.
+        """
+        self.gauges[name] = read
+
+    def instrument(self, owner: object, attr: str, name: str | None = None):
+        """
+        Time every call of `owner.attr` (a method on a class, or a module function)
+        under the span `name`, until `disable` is called.
+
+        :param owner: Class or module holding the function.
+        :param attr: Name of the function on `owner`.
+        :param name: Span name (defaults to `attr`).
+        """
+        original = getattr(owner, attr)
+        record = self.record
+        span: str = name or attr
+        clock = time.perf_counter_ns
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start: int = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(span, clock() - start)
+
+        setattr(owner, attr, timed)
+        self._patched.append((owner, attr, original))
+
+    def enable(self, dump_path: str | Path | None = None):
+        """
+        Start timing the game's phases (see `GAME_SPANS`).
+
+        :param dump_path: If given, write the stats there (.json or .csv) at exit.
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        import pygame as game
+        from classes.Main import Main
+        from classes.Snake.Snake import Snake
+        from gui.Hud.Hud import HUD_Score
+
+        owners: dict[str, object] = {
+            "Main": Main,
+            "Snake": Snake,
+            "HUD_Score": HUD_Score,
+            "display": game.display,
+        }
+        for owner, attr, name in GAME_SPANS:
+            self.instrument(owners[owner], attr, name)
+        if dump_path is not None:
+            atexit.register(self.dump, dump_path)
+
+    def disable(self):
+        """
+        Put every instrumented function back (recorded stats are kept).
+        """
+        for owner, attr, original in reversed(self._patched):
+            setattr(owner, attr, original)
+        self._patched.clear()
+        self.enabled = False
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Returns:
+            dict[str, dict]: Span name -> `Span.stats()`, then gauge name -> its stats.
+        """
+        stats: dict[str, dict] = {
+            name: span.stats() for name, span in self.spans.items()
+        }
+        stats.update((name, read()) for name, read in self.gauges.items())
+        return stats
+
+    def dump(self, path: str | Path):
+        """
+        Write the stats to a file, as JSON or (for a .csv path) CSV.
+        In CSV, the gauges follow the spans as (gauge, field, value) rows.
+
+        :param path: Destination file.
+        """
+        path = Path(path)
+        stats: dict[str, dict] = self.stats()
+        if path.suffix.lower() == ".csv":
+            with path.open("w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["span", *SPAN_FIELDS])
+                for name in self.spans:
+                    entry: dict = stats[name]
+                    writer.writerow([name, *(entry[field] for field in SPAN_FIELDS)])
+                if self.gauges:
+                    writer.writerow([])
+                    writer.writerow(["gauge", "field", "value"])
+                    for name in self.gauges:
+                        for field, value in stats[name].items():
+                            writer.writerow([name, field, value])
+        else:
+            path.write_text(json.dumps(stats, indent=2))
+
+
+SPAN_FIELDS: tuple[str, ...] = (
+    "count",
+    "mean_us",
+    "p50_us",
+    "p95_us",
+    "p99_us",
+    "max_us",
+)
+
+# Phases timed when profiling the game: (owner, function, span name)
+GAME_SPANS: list[tuple[str, str, str]] = [
+    ("Main", "update_game", "tick"),
+    ("Main", "update_obstacles", "update_obstacles"),
+    ("Main", "check_collision_item", "check_collision_item"),
+    ("Main", "check_fail", "check_fail"),
+    ("Main", "draw_elements", "draw"),
+    ("Snake", "draw_snake", "draw_snake"),
+    ("HUD_Score", "draw_score", "draw_score"),
+    ("display", "update", "display.update"),
+]
+
+# Process-wide profiler; set GRUBSNAKE_PROFILE=stats.json (or .csv) to turn it on
+PROFILER: Profiler = Profiler()
+if os.environ.get("GRUBSNAKE_PROFILE"):
+    PROFILER.enable(os.environ["GRUBSNAKE_PROFILE"])
@@ -0,0 +1,440 @@
+import bisect
+import math
+import struct
+import zlib
+from array import array
+from pathlib import Path
+from pygame import Vector2
+from settings.settings import CELL_NUMBER_X, CELL_NUMBER_Y
+from classes.Main import Main
+from classes.Obstacle.Obstacle import Obstacle
+
+LEVEL_CODES: dict[str, int] = {"easy": 0, "medium": 1, "hard": 2}
+DIRECTION_CODES: dict[tuple[int, int], int] = {(0, -1): 0, (0, 1): 1, (-1, 0): 2, (1, 0): 3}
+CODE_DIRECTIONS: list[tuple[int, int]] = list(DIRECTION_CODES)
+
+# magic, version, level, zoom flag, grid width, grid height, seed, ticks,
+# keyframe interval, input count, keyframe count
+HEADER: struct.Struct = struct.Struct("<4sHB?HHQIIII")
+# keyframe tick, inputs before it, byte offset and size of its compressed state
+INDEX_ENTRY: struct.Struct = struct.Struct("<IIII")
+# tick, direction, growth flag, score, snake speed, spawn interval, obstacle speed,
+# spawn timer, obstacles per row, obstacle hits, apple cell (-1 if none), gauss_next,
+# zoom tier
+STATE: struct.Struct = struct.Struct("<I2b?i3d3iidB")
+OBSTACLE: struct.Struct = struct.Struct("<3hd")
+
+
+def pack_state(main: Main) -> bytes:
+    """
+    Serialize the logical state of a game (everything `update_game` reads), so a
+    keyframe restores the game exactly, RNG and free-cell order included.
+
+    :param main: The game to serialize.
+    Returns:
+        bytes: The zlib-compressed state.
+    """
+    board = main.board
+    snake = main.snake
+    apple: Vector2 | None = main.apple.pos
+    version, internal, gauss_next = main.rng.getstate()
+    parts: list[bytes] = [
+        STATE.pack(
+            main.tick,
+            int(snake.direction.x),
+            int(snake.direction.y),
+            snake.new_block,
+            main.score_HUD.score,
+            main.snake_speed,
+            main.obstacle_spawn_interval,
+            main.obstacle_speed,
+            main._obstacle_spawn_timer,
+            main.obstacles_count,
+            board.obstacle_hits,
+            -1 if apple is None else board.index(int(apple.x), int(apple.y)),
+            math.nan if gauss_next is None else gauss_next,
+            main.zoom_tier,
+        )
+    ]
+
+    def section(data: bytes):
+        parts.append(struct.pack("<I", len(data)))
+        parts.append(data)
+
+    section(array("h", [c for cell in snake.body.cells() for c in cell]).tobytes())
+    section(bytes(board.snake))
+    section(bytes(board.obstacles))
+    section(bytes(board.items))
+    section(array("H", board.free_cells).tobytes())
+    section(array("H", main.poisons.cells).tobytes())
+    section(
+        b"".join(
+            OBSTACLE.pack(ob.x, ob.width, ob.height, ob.y) for ob in main.obstacles or []
+        )
+    )
+    section(array("I", internal).tobytes())
+    return zlib.compress(b"".join(parts))
+
+
+def unpack_state(main: Main, data: bytes):
+    """
+    Overwrite a game's logical state with one serialized by `pack_state`.
+    The input log is left alone (see `ReplayPlayer.seek`).
+
+    :param main: A game of the same level and base grid size.
+    :param data: The compressed state.
+    """
+    raw: bytes = zlib.decompress(data)
+    (
+        main.tick,
+        dx,
+        dy,
+        new_block,
+        score,
+        main.snake_speed,
+        main.obstacle_spawn_interval,
+        main.obstacle_speed,
+        main._obstacle_spawn_timer,
+        main.obstacles_count,
+        obstacle_hits,
+        apple,
+        gauss_next,
+        tier,
+    ) = STATE.unpack_from(raw)
+    if tier != main.zoom_tier:
+        main.set_zoom(tier)  # size the board (and sprites) like the recorded game
+
+    sections: list[bytes] = []
+    offset: int = STATE.size
+    while offset < len(raw):
+        (size,) = struct.unpack_from("<I", raw, offset)
+        sections.append(raw[offset + 4 : offset + 4 + size])
+        offset += 4 + size
+    body, snake_grid, obstacle_grid, items, free_cells, poisons, obstacles, internal = (
+        sections
+    )
+
+    board = main.board
+    board.snake[:] = snake_grid
+    board.obstacles[:] = obstacle_grid
+    board.items[:] = items
+    board.obstacle_hits = obstacle_hits
+    # in place, like Board.restore (the lists may be shared)
+    board.free_cells[:] = array("H", free_cells).tolist()
+    board.free_slot[:] = [-1] * board.size
+    for slot, i in enumerate(board.free_cells):
+        board.free_slot[i] = slot
+
+    cells: list[int] = array("h", body).tolist()
+    main.snake.body.clear()
+    for k in range(len(cells) - 2, -1, -2):  # tail first, each push becomes the head
+        main.snake.body.push_head(cells[k], cells[k + 1])
+    main.snake.direction = Vector2(dx, dy)
+    main.snake.new_block = new_block
+    main.score_HUD.set_score(score)
+
+    width: int = board.width
+    main.apple.pos = None if apple < 0 else Vector2(apple % width, apple // width)
+    main.poisons.restore(array("H", poisons).tolist())
+
+    if main.obstacles is not None:
+        main.obstacles = []
+        for x, w, h, y in OBSTACLE.iter_unpack(obstacles):
+            obstacle: Obstacle = Obstacle(
+                "assets/graphics/items/trap.png",
+                w,
+                h,
+                x=x,
+                headless=main.headless,
+                geometry=main.geometry,
+            )
+            obstacle.y = y
+            obstacle.pos = Vector2(x, y)
+            main.obstacles.append(obstacle)
+
+    main.rng.setstate(
+        (3, tuple(array("I", internal)), None if math.isnan(gauss_next) else gauss_next)
+    )
+
+
+def encode_inputs(inputs: list[tuple[int, int, int]]) -> bytes:
+    """
+    Delta-encode an input log: one varint per turn holding the ticks since the
+    previous turn (shifted left by 2) and the 2-bit direction code.
+
+    :param inputs: (tick, dx, dy) of each turn, in order.
+    Returns:
+        bytes: The encoded stream.
+    """
+    out: bytearray = bytearray()
+    previous: int = 0
+    for tick, dx, dy in inputs:
+        value: int = (tick - previous) << 2 | DIRECTION_CODES[(dx, dy)]
+        previous = tick
+        while value >= 0x80:
+            out.append(value & 0x7F | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def decode_inputs(data: bytes, count: int) -> list[tuple[int, int, int]]:
+    """
+    Decode an input stream written by `encode_inputs`.
+
+    :param data: The encoded stream.
+    :param count: Number of turns in it.
+    Returns:
+        list[tuple[int, int, int]]: (tick, dx, dy) of each turn.
+    """
+    inputs: list[tuple[int, int, int]] = []
+    tick: int = 0
+    pos: int = 0
+    for _ in range(count):
+        value: int = 0
+        shift: int = 0
+        while True:
+            byte: int = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        tick += value >> 2
+        dx, dy = CODE_DIRECTIONS[value & 3]
+        inputs.append((tick, dx, dy))
+    return inputs
+
+
+class Replay:
+    """
+    A recorded session: level, seed and input log (enough to re-simulate it, see
+    `Main.inputs`), plus full-state keyframes every `keyframe_interval` ticks so a
+    player can jump to any tick by restoring a keyframe and simulating at most one
+    interval.
+
+    File layout (little endian): HEADER, one INDEX_ENTRY per keyframe, the
+    delta-encoded inputs, then the compressed keyframe states.
+    """
+
+    MAGIC: bytes = b"GRPL"
+    VERSION: int = 1
+
+    def __init__(
+        self,
+        level: str,
+        seed: int,
+        ticks: int,
+        inputs: list[tuple[int, int, int]],
+        keyframe_interval: int,
+        keyframes: list[tuple[int, int, bytes]],
+        width: int = CELL_NUMBER_X,
+        height: int = CELL_NUMBER_Y,
+        zoom: bool = False,
+    ):
+        """
+        :param level: The difficulty level the session was played on.
+        :param seed: `Main.seed` of the session.
+        :param ticks: Length of the session in ticks.
+        :param inputs: `Main.inputs` of the session.
+        :param keyframe_interval: Ticks between two keyframes.
+        :param keyframes: (tick, inputs before it, `pack_state` data), by tick.
+        :param width: Grid width the session started on (before any zoom).
+        :param height: Grid height the session started on (before any zoom).
+        :param zoom: `Main.zoom` of the session (play it back on a game with the same).
+        """
+        self.level: str = level
+        self.seed: int = seed
+        self.ticks: int = ticks
+        self.inputs: list[tuple[int, int, int]] = inputs
+        self.keyframe_interval: int = keyframe_interval
+        self.keyframes: list[tuple[int, int, bytes]] = keyframes
+        self.keyframe_ticks: list[int] = [tick for tick, _, _ in keyframes]
+        self.width: int = width
+        self.height: int = height
+        self.zoom: bool = zoom
+
+    @classmethod
+    def record(
+        cls,
+        level: str,
+        seed: int,
+        inputs: list[tuple[int, int, int]],
+        ticks: int,
+        keyframe_interval: int = 256,
+        zoom: bool = False,
+    ) -> "Replay":
+        """
+        Build a replay of a finished session by re-simulating it headlessly from
+        its seed and inputs (so playing the game costs nothing extra).
+
+        :param level: The difficulty level of the session.
+        :param seed: `Main.seed` of the session.
+        :param inputs: `Main.inputs` of the session.
+        :param ticks: `Main.tick` at the end of the session.
+        :param keyframe_interval: Ticks between two keyframes.
+        :param zoom: `Main.zoom` of the session.
+        Returns:
+            Replay: The replay, ready to save.
+        """
+        main: Main = Main(None, None, None, level, headless=True, seed=seed, zoom=zoom)
+        keyframes: list[tuple[int, int, bytes]] = []
+        cursor: int = 0
+        while True:
+            if main.tick % keyframe_interval == 0:
+                keyframes.append((main.tick, cursor, pack_state(main)))
+            while cursor < len(inputs) and inputs[cursor][0] == main.tick:
+                _, dx, dy = inputs[cursor]
+                main.change_direction(Vector2(dx, dy))
+                cursor += 1
+            if main.tick >= ticks:
+                break
+            main.update_game()
+        return cls(
+            level, seed, ticks, list(inputs), keyframe_interval, keyframes, zoom=zoom
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the replay in the file layout described on the class.
+
+        Returns:
+            bytes: The replay file contents.
+        """
+        stream: bytes = encode_inputs(self.inputs)
+        offset: int = (
+            HEADER.size + INDEX_ENTRY.size * len(self.keyframes) + len(stream)
+        )
+        index: list[bytes] = []
+        for tick, cursor, data in self.keyframes:
+            index.append(INDEX_ENTRY.pack(tick, cursor, offset, len(data)))
+            offset += len(data)
+        header: bytes = HEADER.pack(
+            self.MAGIC,
+            self.VERSION,
+            LEVEL_CODES[self.level],
+            self.zoom,
+            self.width,
+            self.height,
+            self.seed,
+            self.ticks,
+            self.keyframe_interval,
+            len(self.inputs),
+            len(self.keyframes),
+        )
+        return b"".join(
+            [header, *index, stream, *(data for _, _, data in self.keyframes)]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Parse a replay file.
+
+        :param data: The replay file contents.
+        Returns:
+            Replay: The parsed replay.
+        """
+        (
+            magic,
+            version,
+            level_code,
+            zoom,
+            width,
+            height,
+            seed,
+            ticks,
+            keyframe_interval,
+            input_count,
+            keyframe_count,
+        ) = HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("not a GrubSnake replay (or an unsupported version)")
+
+        keyframes: list[tuple[int, int, bytes]] = []
+        for k in range(keyframe_count):
+            tick, cursor, offset, size = INDEX_ENTRY.unpack_from(
+                data, HEADER.size + k * INDEX_ENTRY.size
+            )
+            keyframes.append((tick, cursor, data[offset : offset + size]))
+        stream_start: int = HEADER.size + keyframe_count * INDEX_ENTRY.size
+        inputs: list[tuple[int, int, int]] = decode_inputs(
+            data[stream_start:], input_count
+        )
+        level: str = list(LEVEL_CODES)[level_code]
+        return cls(
+            level, seed, ticks, inputs, keyframe_interval, keyframes, width, height, zoom
+        )
+
+    def save(self, path: str | Path):
+        """
+        Write the replay to a file (creating its folder if needed).
+
+        :param path: Destination file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Replay":
+        """
+        Read a replay file.
+
+        :param path: The replay file.
+        Returns:
+            Replay: The parsed replay.
+        """
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class ReplayPlayer:
+    """
+    Drives a `Main` through a replay: step tick by tick, or seek to any tick by
+    restoring the nearest keyframe at or before it and simulating the rest.
+    """
+
+    def __init__(self, replay: Replay, main: Main):
+        """
+        :param replay: The replay to play.
+        :param main: A game of the replay's level to play it on (headless or not);
+            it zooms like the recorded session did, whatever it was created with.
+        """
+        self.replay: Replay = replay
+        self.main: Main = main
+        main.zoom = replay.zoom
+        _, self.cursor, data = replay.keyframes[0]  # next input to apply
+        unpack_state(main, data)
+
+    @property
+    def finished(self) -> bool:
+        """True once the game reached the last tick of the replay."""
+        return self.main.tick >= self.replay.ticks
+
+    def step(self):
+        """
+        Apply the inputs of the current tick and advance the game by one tick.
+        """
+        main: Main = self.main
+        inputs: list[tuple[int, int, int]] = self.replay.inputs
+        while self.cursor < len(inputs) and inputs[self.cursor][0] == main.tick:
+            _, dx, dy = inputs[self.cursor]
+            main.change_direction(Vector2(dx, dy))
+            self.cursor += 1
+        main.update_game()
+
+    def seek(self, tick: int):
+        """
+        Jump to a tick (clamped to the replay) in O(keyframe interval) ticks.
+
+        :param tick: Target tick.
+        """
+        tick = max(0, min(tick, self.replay.ticks))
+        k: int = bisect.bisect_right(self.replay.keyframe_ticks, tick) - 1
+        if tick < self.main.tick or self.main.tick < self.replay.keyframe_ticks[k]:
+            _, self.cursor, data = self.replay.keyframes[k]
+            unpack_state(self.main, data)
+            self.main.inputs = self.replay.inputs[: self.cursor]
+            self.main.outcome = None
+        while self.main.tick < tick:
+            self.step()
@@ -1,41 +1,71 @@
+from collections import deque
+from itertools import islice
 from pygame.math import Vector2  # For the draw of the snake with vectors
 import pygame as game
-from settings.settings import CELL_SIZE
-from settings.settings import CELL_NUMBER_X, CELL_NUMBER_Y
+from classes.Board.Board import Board
+from classes.Geometry.Geometry import Geometry
+from classes.SnakeBody.SnakeBody import SnakeBody
+from renderers.assets import scaled_image
 
 
 class Snake:
     """
     Handles drawing (head/body/tail sprites), movement, direction, growth, reset.
-     Body positions are on the grid (`Vector2` of cell coordinates).
+     Body positions are on the grid, stored in a `SnakeBody` ring buffer (head first).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        headless: bool = False,
+        board: Board | None = None,
+        geometry: Geometry | None = None,
+    ):
         """
         Initialize the snake's position and body.
+
+        :param headless: If True, skip loading the sprites (logic-only snake).
+        :param board: Occupancy grid to keep in sync with the body (a private one if None).
+        :param geometry: Cell size and grid position used for drawing (the base one if None).
         """
-        # Calculate center position based on settings
-        center_x: int = CELL_NUMBER_X // 2
-        center_y: int = CELL_NUMBER_Y // 2
-        self.body: list[Vector2] = [
-            Vector2(center_x, center_y),
-            Vector2(center_x - 1, center_y),
-            Vector2(center_x - 2, center_y),
-        ]  # body of the snake, starting with 3 segments in the center
+        self.board: Board = board if board is not None else Board()
+        self.geometry: Geometry = geometry if geometry is not None else Geometry()
+        self.body: SnakeBody = SnakeBody(self.board.size + 1)
+        self.place_start_body()  # starting with 3 segments in the center
         self.direction: Vector2 = Vector2(1, 0)  # the snake starts moving right
         self.new_block: bool = False  # To manage the growth of the snake
 
+        self.sprite_size: int = 0  # cell size the sprites below are scaled to
+        # (sprite, screen rect) of each segment, head first, once drawn (see draw_snake)
+        self.segments: deque[tuple[game.Surface, game.Rect]] | None = None
+        self.segments_version: int = -1  # body.version the segments match
+        # (body.version after the last move, tail cell it left or None if it grew),
+        # for drawing the move in between ticks (see draw_interpolated)
+        self.motion: tuple[int, tuple[int, int] | None] | None = None
+        # strips of sprites drawn part way through a move, by (sprite, area)
+        self.strips: dict[tuple[game.Surface, tuple], game.Surface] = {}
+        if headless:
+            return  # no display available, sprites are never drawn
+        self.load_sprites()
+
+    def load_sprites(self):
+        """
+        Take the sprites for the current cell size from the asset cache (the
+        atlas of every zoom tier is packed up front, so this never rescales).
+        """
+        size: int = self.geometry.cell_size
+        self.sprite_size: int = size
+        self.strips.clear()
+
         def load_sprite(path: str) -> game.Surface:
             """
-            Load and scale a sprite from the given path.
+            Get a sprite scaled to one cell (shared, loaded once per process).
 
             :param path: The file path to the sprite image.
 
             Returns:
                game.Surface: The loaded and scaled sprite image.
             """
-            img: game.Surface = game.image.load(path).convert_alpha()
-            return game.transform.smoothscale(img, (CELL_SIZE, CELL_SIZE))
+            return scaled_image(path, (size, size), smooth=True)
 
         # Loading sprites of the Snake
         self.head_up: game.Surface = load_sprite(
@@ -83,94 +113,238 @@ class Snake:
             "assets/graphics/snake_sprites/body_bottom_left.png"
         )
 
-    def update_head_graphics(self):
+    def segment_sprite(self, index: int) -> game.Surface:
         """
-        Update the graphics for the snake's head based on its direction.
+        The sprite of one segment, from its neighbours: head and tail face away
+        from the next segment, body segments are straight or a corner.
+
+        :param index: Segment index (0 = head, -1 or len - 1 = tail).
+        Returns:
+            game.Surface: The sprite to draw for the segment.
         """
-        relation: Vector2 = self.body[0] - self.body[1]
-        if relation == Vector2(1, 0):
-            self.head_graphics: game.Surface = self.head_right  # Right
-        elif relation == Vector2(-1, 0):
-            self.head_graphics: game.Surface = self.head_left  # Left
-        elif relation == Vector2(0, 1):
-            self.head_graphics: game.Surface = self.head_down  # Down
-        else:  # Vector2(0, -1)
-            self.head_graphics: game.Surface = self.head_up  # Up
+        body: SnakeBody = self.body
+        last: int = len(body) - 1
+        if index < 0:
+            index += len(body)
+        x, y = body.cell(index)
+
+        if index == 0 or index == last:
+            # direction away from the neighbour (the neck, or the segment before the tail)
+            other_x, other_y = body.cell(1 if index == 0 else last - 1)
+            relation: tuple[int, int] = (x - other_x, y - other_y)
+            return self.end_sprite(index == 0, *relation)
 
-    def update_body_graphics(self):
+        # offsets to the previous (towards tail) and next (towards head) blocks
+        prev_x, prev_y = body.cell(index + 1)
+        next_x, next_y = body.cell(index - 1)
+        return self.body_sprite(prev_x - x, prev_y - y, next_x - x, next_y - y)
+
+    def end_sprite(self, head: bool, away_x: int, away_y: int) -> game.Surface:
         """
-        Update the graphics for the snake's body based on its segments.
+        The head or tail sprite facing away from its neighbour.
+
+        :param head: True for a head sprite, False for a tail sprite.
+        :param away_x: Column offset from the neighbour to the segment.
+        :param away_y: Row offset from the neighbour to the segment.
+        Returns:
+            game.Surface: The sprite to draw for the segment.
         """
-        relation: Vector2 = self.body[-1] - self.body[-2]
-        if relation == Vector2(1, 0):
-            self.tail_graphics: game.Surface = self.tail_right
-        elif relation == Vector2(-1, 0):
-            self.tail_graphics: game.Surface = self.tail_left
-        elif relation == Vector2(0, 1):
-            self.tail_graphics: game.Surface = self.tail_down
-        else:  # Vector2(0, -1)
-            self.tail_graphics: game.Surface = self.tail_up
+        if head:
+            sprites = (self.head_right, self.head_left, self.head_down, self.head_up)
+        else:
+            sprites = (self.tail_right, self.tail_left, self.tail_down, self.tail_up)
+        if (away_x, away_y) == (1, 0):
+            return sprites[0]
+        if (away_x, away_y) == (-1, 0):
+            return sprites[1]
+        if (away_x, away_y) == (0, 1):
+            return sprites[2]
+        return sprites[3]
+
+    def body_sprite(self, prev_x: int, prev_y: int, next_x: int, next_y: int) -> game.Surface:
+        """
+        The sprite of a body segment: straight or a corner, from its neighbours.
+
+        :param prev_x: Column offset of the neighbour towards the tail.
+        :param prev_y: Row offset of the neighbour towards the tail.
+        :param next_x: Column offset of the neighbour towards the head.
+        :param next_y: Row offset of the neighbour towards the head.
+        Returns:
+            game.Surface: The sprite to draw for the segment.
+        """
+        if prev_x == next_x:
+            return self.body_vertical
+        if prev_y == next_y:
+            return self.body_horizontal
+        # corners
+        if (prev_x == -1 and next_y == -1) or (next_x == -1 and prev_y == -1):
+            return self.body_tl
+        if (prev_x == -1 and next_y == 1) or (next_x == -1 and prev_y == 1):
+            return self.body_bl
+        if (prev_x == 1 and next_y == -1) or (next_x == 1 and prev_y == -1):
+            return self.body_tr
+        return self.body_br  # (prev_x == 1 and next_y == 1) or the mirror case
+
+    def rebuild_segments(self):
+        """
+        Pick the sprite and screen rect of every segment (after the body was
+        replaced as a whole, e.g. reset, restore or a zoom change).
+        """
+        cell_rect = self.geometry.cell_rect
+        self.segments: deque[tuple[game.Surface, game.Rect]] = deque(
+            (self.segment_sprite(index), cell_rect(x, y))
+            for index, (x, y) in enumerate(self.body.cells())
+        )
+        self.segments_version: int = self.body.version
 
-    def draw_snake(self, screen: game.Surface):
+    def draw_snake(self, screen: game.Surface, alpha: float | None = None):
         """
         Method class for drawing the snake on the screen.
+        The (sprite, rect) of every segment is cached in `segments`, which moving,
+        growing and shrinking keep up to date at the head, neck and tail only, so
+        drawing is a single walk over the cached pairs.
 
         :param screen: The game screen where the snake will be drawn.
+        :param alpha: Elapsed fraction of the current tick, to draw the last move
+            in progress (see `draw_interpolated`); None draws the cells as they are.
         """
-        self.update_head_graphics()
-        self.update_body_graphics()
-
-        for index, block in enumerate(self.body):
-            x_pos: int = int(block.x * CELL_SIZE)
-            y_pos: int = int(block.y * CELL_SIZE)
-            rect: game.Rect = game.Rect(x_pos, y_pos, CELL_SIZE, CELL_SIZE)
-
-            if index == 0:  # head
-                screen.blit(self.head_graphics, rect)
-            elif index == len(self.body) - 1:  # tail
-                screen.blit(self.tail_graphics, rect)
-            else:  # body segment
-                prev_block: Vector2 = self.body[index + 1] - block
-                next_block: Vector2 = self.body[index - 1] - block
-
-                if prev_block.x == next_block.x:
-                    screen.blit(self.body_vertical, rect)
-                elif prev_block.y == next_block.y:
-                    screen.blit(self.body_horizontal, rect)
-                else:
-                    # corners
-                    if (prev_block.x == -1 and next_block.y == -1) or (
-                        next_block.x == -1 and prev_block.y == -1
-                    ):
-                        screen.blit(self.body_tl, rect)
-                    elif (prev_block.x == -1 and next_block.y == 1) or (
-                        next_block.x == -1 and prev_block.y == 1
-                    ):
-                        screen.blit(self.body_bl, rect)
-                    elif (prev_block.x == 1 and next_block.y == -1) or (
-                        next_block.x == 1 and prev_block.y == -1
-                    ):
-                        screen.blit(self.body_tr, rect)
-                    elif (prev_block.x == 1 and next_block.y == 1) or (
-                        next_block.x == 1 and prev_block.y == 1
-                    ):
-                        screen.blit(self.body_br, rect)
+        if self.sprite_size != self.geometry.cell_size:  # the zoom tier changed
+            self.load_sprites()
+            self.segments = None
+        if self.segments is None or self.segments_version != self.body.version:
+            self.rebuild_segments()  # the body was changed from outside
+        if (
+            alpha is not None
+            and self.motion is not None
+            and self.motion[0] == self.body.version
+        ):
+            self.draw_interpolated(screen, alpha, self.motion[1])
+        else:
+            screen.blits(self.segments, doreturn=False)
+
+    def draw_interpolated(
+        self, screen: game.Surface, alpha: float, tail_from: tuple[int, int] | None
+    ):
+        """
+        Draw the snake part way through its last move, one tick behind the game:
+        at alpha 0 its cells are those of the previous tick, at 1 the current ones.
+        Only the ends move. The head slides from the neck's cell into its own while
+        the neck is uncovered behind it; the tail slides from the cell it left into
+        its own, over the body piece that was there.
+
+        :param screen: The game screen where the snake will be drawn.
+        :param alpha: Elapsed fraction of the current tick (0..1).
+        :param tail_from: Cell the tail left on the last move (None if it grew).
+        """
+        segments: deque[tuple[game.Surface, game.Rect]] = self.segments
+        last: int = len(segments) - 1
+        size: int = self.geometry.cell_size
+        # pixels the ends have moved, shared by the sliding sprites and the strips
+        # they uncover, so the two always meet exactly
+        moved: int = round(size * min(max(alpha, 0.0), 1.0))
+        screen.blits(islice(segments, 2, last), doreturn=False)  # cells that stay put
+
+        # Tail: the body piece it has not reached yet, then the tail on top
+        tail_sprite, tail_rect = segments[last]
+        if tail_from is None or moved == size:  # grew (did not move), or arrived
+            screen.blit(tail_sprite, tail_rect)
+        else:
+            tail_x, tail_y = self.body.cell(last)
+            from_x, from_y = tail_from
+            ahead_x, ahead_y = self.body.cell(last - 1)
+            step_x: int = tail_x - from_x
+            step_y: int = tail_y - from_y
+            piece: game.Surface = self.body_sprite(
+                -step_x, -step_y, ahead_x - tail_x, ahead_y - tail_y
+            )
+            self.blit_strip(screen, piece, tail_rect, step_x, step_y, size - moved)
+            screen.blit(
+                self.end_sprite(False, -step_x, -step_y),  # facing along the move
+                tail_rect.move(step_x * (moved - size), step_y * (moved - size)),
+            )
+
+        # Neck, uncovered as the head leaves its cell, then the head
+        head_sprite, _ = segments[0]
+        neck_sprite, neck_rect = segments[1]
+        head_x, head_y = self.body.cell(0)
+        neck_x, neck_y = self.body.cell(1)
+        step_x = head_x - neck_x
+        step_y = head_y - neck_y
+        self.blit_strip(screen, neck_sprite, neck_rect, -step_x, -step_y, moved)
+        screen.blit(head_sprite, neck_rect.move(step_x * moved, step_y * moved))
+
+    def blit_strip(
+        self,
+        screen: game.Surface,
+        sprite: game.Surface,
+        rect: game.Rect,
+        side_x: int,
+        side_y: int,
+        thickness: int,
+    ):
+        """
+        Draw the strip of a cell's sprite along one of its sides.
+
+        :param screen: The game screen.
+        :param sprite: The cell's sprite.
+        :param rect: The cell's screen rect.
+        :param side_x: -1 or 1 for the left or right side (0 if side_y is set).
+        :param side_y: -1 or 1 for the top or bottom side (0 if side_x is set).
+        :param thickness: Thickness of the strip in pixels.
+        """
+        size: int = rect.width
+        if thickness <= 0:
+            return
+        if thickness >= size:
+            screen.blit(sprite, rect)
+            return
+        if side_x:
+            area: game.Rect = game.Rect(
+                size - thickness if side_x > 0 else 0, 0, thickness, size
+            )
+        else:
+            area = game.Rect(0, size - thickness if side_y > 0 else 0, size, thickness)
+        # a subsurface, since the dirty-rect renderer records whole surfaces only;
+        # kept, so a strip drawn again compares equal and is not redrawn
+        key: tuple[game.Surface, tuple] = (sprite, tuple(area))
+        strip: game.Surface | None = self.strips.get(key)
+        if strip is None:
+            strip = self.strips[key] = sprite.subsurface(area)
+        screen.blit(strip, rect.move(area.topleft))
 
     def move_growth(self):
         """
         Method class for moving the snake in the current direction. Handles growth if needed.
         """
+        # sprite cache in step with the body (never set up when headless)
+        cached: bool = (
+            self.segments is not None and self.segments_version == self.body.version
+        )
+        growing: bool = self.new_block
         if not self.new_block:  # If the snake is not growing
-            body_copy: list[Vector2] = self.body[
-                :-1
-            ]  # Copy the body except the last block
-        else:  # If the snake is growing
-            body_copy: list[Vector2] = self.body[:]  # Copy the entire body
+            tail_x, tail_y = self.body.pop_tail()  # Drop the last block
+            self.board.remove_snake(tail_x, tail_y)  # tail leaves its cell
+        else:  # If the snake is growing, keep the tail where it is
             self.new_block: bool = False  # Reset the growth flag
 
-        new_head: Vector2 = self.body[0] + self.direction  # Calculate new head position
-        body_copy.insert(0, new_head)  # Insert new head into the body
-        self.body: list[Vector2] = body_copy  # Update the snake's body
+        head_x, head_y = self.body.cell(0)
+        new_x: int = head_x + int(self.direction.x)  # Calculate new head position
+        new_y: int = head_y + int(self.direction.y)
+        self.body.push_head(new_x, new_y)  # Insert new head into the body
+        self.board.add_snake(new_x, new_y)
+
+        if cached:
+            segments: deque[tuple[game.Surface, game.Rect]] = self.segments
+            if not growing:
+                segments.pop()
+            segments.appendleft(
+                (self.segment_sprite(0), self.geometry.cell_rect(new_x, new_y))
+            )
+            segments[1] = (self.segment_sprite(1), segments[1][1])  # old head: neck
+            if not growing:
+                segments[-1] = (self.segment_sprite(-1), segments[-1][1])  # new tail
+            self.segments_version = self.body.version
+            self.motion = (self.body.version, None if growing else (tail_x, tail_y))
 
     def grow(self):
         """
@@ -183,18 +357,36 @@ class Snake:
         Method class for removing a block from the snake. (Shrink the Snake)
         """
         if len(self.body) > 3:  # Ensure the snake has more than the minimum length
-            self.body.pop()  # Remove the last block of the snake
+            cached: bool = (
+                self.segments is not None
+                and self.segments_version == self.body.version
+            )
+            tail_x, tail_y = self.body.pop_tail()  # Remove the last block of the snake
+            self.board.remove_snake(tail_x, tail_y)
+            if cached:
+                self.segments.pop()
+                self.segments[-1] = (self.segment_sprite(-1), self.segments[-1][1])
+                if self.motion is not None and self.motion[0] == self.segments_version:
+                    self.motion = (self.body.version, None)  # the tail jumped, the head still moves
+                self.segments_version = self.body.version
 
     def reset(self):
         """
         Method class for resetting the snake to its initial state.
         """
-        center_x: int = CELL_NUMBER_X // 2
-        center_y: int = CELL_NUMBER_Y // 2
-        self.body: list[Vector2] = [
-            Vector2(center_x, center_y),
-            Vector2(center_x - 1, center_y),
-            Vector2(center_x - 2, center_y),
-        ]  # Reset to initial 3 segments in the center
+        for x, y in self.body.cells():
+            self.board.remove_snake(x, y)
+        self.body.clear()
+        self.place_start_body()  # Reset to initial 3 segments in the center
         self.direction: Vector2 = Vector2(1, 0)  # Reset direction to right
         self.new_block: bool = False  # Reset growth flag
+
+    def place_start_body(self):
+        """
+        Lay out the initial 3 segments in the center of the board, facing right.
+        """
+        center_x: int = self.board.width // 2
+        center_y: int = self.board.height // 2
+        for x in (center_x - 2, center_x - 1, center_x):  # pushed tail first
+            self.body.push_head(x, center_y)
+            self.board.add_snake(x, center_y)
@@ -0,0 +1,155 @@
+from typing import Iterator
+from pygame.math import Vector2
+from settings.settings import CELL_NUMBER_X, CELL_NUMBER_Y
+
+
+class SnakeBody:
+    """
+    Array-backed ring buffer holding the snake segments, head first.
+    Pushing a new head, popping the tail, growing and shrinking are all O(1),
+    and any segment can still be read by index (0 = head, -1 = tail).
+    """
+
+    def __init__(self, capacity: int = CELL_NUMBER_X * CELL_NUMBER_Y + 1):
+        """
+        Initialize an empty body.
+
+        :param capacity: Maximum number of segments (a full board plus the colliding head).
+        """
+        self.capacity: int = capacity
+        self.xs: list[int] = [0] * capacity  # grid x of each slot
+        self.ys: list[int] = [0] * capacity  # grid y of each slot
+        self.start: int = 0  # slot of the head
+        self.length: int = 0  # number of segments
+        self.version: int = 0  # bumped by every change, so caches can tell they are stale
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> Vector2:
+        """
+        Segment at `index` as a Vector2 (0 = head, negative indexes count from the tail).
+
+        :param index: Segment index.
+        Returns:
+            Vector2: The segment's grid position.
+        """
+        x, y = self.cell(index)
+        return Vector2(x, y)
+
+    def __iter__(self) -> Iterator[Vector2]:
+        for x, y in self.cells():
+            yield Vector2(x, y)
+
+    def cell(self, index: int) -> tuple[int, int]:
+        """
+        Segment at `index` as an (x, y) tuple of ints, without allocating a Vector2.
+
+        :param index: Segment index (0 = head, negative indexes count from the tail).
+        Returns:
+            tuple[int, int]: The segment's grid position.
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("snake body index out of range")
+        slot: int = (self.start + index) % self.capacity
+        return self.xs[slot], self.ys[slot]
+
+    def cells(self) -> Iterator[tuple[int, int]]:
+        """
+        Walk the segments in order from head to tail.
+
+        Returns:
+            Iterator[tuple[int, int]]: (x, y) of each segment.
+        """
+        xs: list[int] = self.xs
+        ys: list[int] = self.ys
+        capacity: int = self.capacity
+        slot: int = self.start
+        for _ in range(self.length):
+            yield xs[slot], ys[slot]
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+    def push_head(self, x: int, y: int):
+        """
+        Add a new head segment in front of the current one.
+
+        :param x: Grid x of the new head.
+        :param y: Grid y of the new head.
+        """
+        if self.length == self.capacity:
+            raise OverflowError("snake body is full")
+        self.start = (self.start - 1) % self.capacity
+        self.xs[self.start] = x
+        self.ys[self.start] = y
+        self.length += 1
+        self.version += 1
+
+    def pop_tail(self) -> tuple[int, int]:
+        """
+        Remove the tail segment.
+
+        Returns:
+            tuple[int, int]: (x, y) of the removed segment.
+        """
+        if not self.length:
+            raise IndexError("pop from an empty snake body")
+        self.length -= 1
+        self.version += 1
+        slot: int = (self.start + self.length) % self.capacity
+        return self.xs[slot], self.ys[slot]
+
+    def snapshot(self) -> tuple[list[int], list[int]]:
+        """
+        Copy the segments, head first (only the `length` live slots are copied).
+
+        Returns:
+            tuple[list[int], list[int]]: x and y of every segment.
+        """
+        end: int = self.start + self.length
+        if end <= self.capacity:
+            return self.xs[self.start : end], self.ys[self.start : end]
+        end -= self.capacity  # the body wraps around the end of the buffer
+        return (
+            self.xs[self.start :] + self.xs[:end],
+            self.ys[self.start :] + self.ys[:end],
+        )
+
+    def restore(self, snapshot: tuple[list[int], list[int]]):
+        """
+        Put back the segments copied by `snapshot`.
+
+        :param snapshot: x and y of every segment, head first.
+        """
+        xs, ys = snapshot
+        self.start: int = 0
+        self.length: int = len(xs)
+        self.xs[: self.length] = xs
+        self.ys[: self.length] = ys
+        self.version += 1
+
+    def remap(self, dx: int, dy: int, capacity: int | None = None):
+        """
+        Move every segment by (dx, dy), e.g. when the board grows around the snake.
+
+        :param dx: Columns to add to each segment.
+        :param dy: Rows to add to each segment.
+        :param capacity: New maximum number of segments (unchanged if None).
+        """
+        xs, ys = self.snapshot()
+        if capacity is not None:
+            self.capacity = max(capacity, self.length)
+            self.xs = [0] * self.capacity
+            self.ys = [0] * self.capacity
+        self.restore(([x + dx for x in xs], [y + dy for y in ys]))
+
+    def clear(self):
+        """
+        Remove every segment.
+        """
+        self.start: int = 0
+        self.length: int = 0
+        self.version += 1
@@ -0,0 +1,83 @@
+import pygame as game
+from collections import OrderedDict
+from renderers.font import render_font
+
+
+class TextCache:
+    """
+    Least-recently-used cache of rendered text surfaces, keyed by (text, color, size).
+    The pixels kept are bounded by a memory budget: when a new surface pushes the
+    total over it, the surfaces used longest ago are dropped. The hit/miss counters
+    show whether a frame rendered any text (a steady menu or HUD frame only hits).
+
+    Cached surfaces are shared by every caller and must not be drawn on.
+    """
+
+    def __init__(self, budget: int = 4 * 1024 * 1024):
+        """
+        :param budget: Maximum number of bytes of pixels kept.
+        """
+        self.budget: int = budget
+        self.surfaces: OrderedDict[tuple, game.Surface] = OrderedDict()  # oldest first
+        self.used: int = 0  # bytes of pixels held by self.surfaces
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, text: str, color, size: int) -> game.Surface:
+        """
+        The antialiased rendering of `text`, rendered only the first time it is asked for.
+
+        :param text: The text to render.
+        :param color: The text color (anything pygame.Color accepts).
+        :param size: The font size.
+        Returns:
+            game.Surface: The shared text surface (do not draw on it).
+        """
+        key: tuple = (text, color if isinstance(color, (str, tuple)) else tuple(color), size)
+        surface: game.Surface | None = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = render_font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        self.used += self.weight(surface)
+        while self.used > self.budget and len(self.surfaces) > 1:
+            _, oldest = self.surfaces.popitem(last=False)
+            self.used -= self.weight(oldest)
+        return surface
+
+    @staticmethod
+    def weight(surface: game.Surface) -> int:
+        """
+        Memory taken by a surface's pixels.
+
+        :param surface: The surface.
+        Returns:
+            int: Size of its pixels in bytes.
+        """
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Counters for checking the cache is doing its job.
+
+        Returns:
+            dict[str, int]: hits, misses, entries and bytes used.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.surfaces),
+            "bytes": self.used,
+        }
+
+    def clear(self):
+        """
+        Drop every cached surface (the counters are kept).
+        """
+        self.surfaces.clear()
+        self.used = 0
@@ -0,0 +1,86 @@
+import time
+from collections import deque
+
+
+class TickScheduler:
+    """
+    Fixed-timestep scheduler that owns simulation time.
+    Each frame, `advance` adds the real time elapsed (perf_counter, sub-millisecond)
+    to an accumulator and returns how many ticks of `interval` ms are due. So tick
+    timing does not depend on the event queue or on fractional intervals being
+    truncated to whole milliseconds. At most `max_catch_up` ticks run per frame; older
+    backlog after a long stall is dropped (and counted) rather than replayed in a burst.
+    """
+
+    def __init__(self, interval: float, max_catch_up: int = 5, samples: int = 256):
+        """
+        :param interval: Milliseconds per tick (may be fractional and change later).
+        :param max_catch_up: Maximum number of ticks run in one frame.
+        :param samples: How many recent ticks the jitter statistics cover.
+        """
+        self.interval: float = interval
+        self.max_catch_up: int = max_catch_up
+        self.accumulator: float = 0.0  # ms of simulation time not yet ticked
+        self.last: float | None = None  # perf_counter of the previous advance
+        self.ticks: int = 0  # ticks handed out so far
+        self.dropped: int = 0  # ticks skipped by the catch-up cap
+        # How late each recent tick ran (ms after it was due)
+        self.lateness: deque[float] = deque(maxlen=samples)
+
+    def reset(self):
+        """
+        Forget the elapsed time (e.g. after a blocking fade), without running ticks.
+        """
+        self.accumulator: float = 0.0
+        self.last: float | None = None
+
+    def advance(self, now: float | None = None) -> int:
+        """
+        Account for the time since the previous call and take out the due ticks.
+
+        :param now: Current time in seconds (perf_counter if None).
+        Returns:
+            int: Number of ticks to run this frame.
+        """
+        if now is None:
+            now = time.perf_counter()
+        if self.last is not None:
+            self.accumulator += (now - self.last) * 1000
+        self.last = now
+
+        due: int = 0
+        while self.accumulator >= self.interval and due < self.max_catch_up:
+            self.lateness.append(self.accumulator - self.interval)
+            self.accumulator -= self.interval
+            due += 1
+        if self.accumulator >= self.interval:  # too far behind: drop the backlog
+            behind: int = int(self.accumulator // self.interval)
+            self.dropped += behind
+            self.accumulator -= behind * self.interval
+        self.ticks += due
+        return due
+
+    @property
+    def alpha(self) -> float:
+        """
+        Fraction of the current tick that has elapsed (0..1), for interpolation.
+        """
+        return min(1.0, self.accumulator / self.interval) if self.interval else 0.0
+
+    def jitter(self) -> dict:
+        """
+        Measured tick timing over the recent ticks.
+
+        Returns:
+            dict: mean/max lateness in ms (how long after being due ticks ran),
+            jitter in ms (mean change of lateness between consecutive ticks) and
+            the total of dropped ticks.
+        """
+        lateness: list[float] = list(self.lateness)
+        changes: list[float] = [abs(b - a) for a, b in zip(lateness, lateness[1:])]
+        return {
+            "mean_late_ms": sum(lateness) / len(lateness) if lateness else 0.0,
+            "max_late_ms": max(lateness, default=0.0),
+            "jitter_ms": sum(changes) / len(changes) if changes else 0.0,
+            "dropped": self.dropped,
+        }
@@ -80,15 +80,17 @@ def handle_keydown_snake_movement(
 
     """
 
-    if event.key in (game.K_UP, game.K_w) and main_game.snake.direction.y != 1:
-        main_game.snake.direction = game.Vector2(0, -1)
-        MOVE_SNAKE_SOUND.play()
-    elif event.key in (game.K_DOWN, game.K_s) and main_game.snake.direction.y != -1:
-        main_game.snake.direction = game.Vector2(0, 1)
-        MOVE_SNAKE_SOUND.play()
-    elif event.key in (game.K_LEFT, game.K_a) and main_game.snake.direction.x != -1:
-        main_game.snake.direction = game.Vector2(-1, 0)
-        MOVE_SNAKE_SOUND.play()
-    elif event.key in (game.K_RIGHT, game.K_d) and main_game.snake.direction.x != 1:
-        main_game.snake.direction = game.Vector2(1, 0)
-        MOVE_SNAKE_SOUND.play()
+    directions: dict[int, tuple[int, int]] = {
+        game.K_UP: (0, -1),
+        game.K_w: (0, -1),
+        game.K_DOWN: (0, 1),
+        game.K_s: (0, 1),
+        game.K_LEFT: (-1, 0),
+        game.K_a: (-1, 0),
+        game.K_RIGHT: (1, 0),
+        game.K_d: (1, 0),
+    }
+    if event.key in directions:
+        # Main.change_direction rejects reversals and records the turn for replays
+        if main_game.change_direction(game.Vector2(directions[event.key])):
+            MOVE_SNAKE_SOUND.play()
@@ -0,0 +1,39 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # frames are drawn offscreen, no window
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import time
+from screens.gameplay import LAST_REPLAY_PATH
+from simulation.export import FORMATS, export_replay
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Render a recorded game to a PNG sequence, gif or mp4, "
+        "re-simulating it in parallel across all cores."
+    )
+    parser.add_argument("path", nargs="?", default=str(LAST_REPLAY_PATH))
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument(
+        "--out", default=None, help="frame folder (png) or output file (gif/mp4)"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--every", type=int, default=1, help="draw one frame every N ticks")
+    parser.add_argument("--scale", type=float, default=1.0, help="frame size factor")
+    parser.add_argument(
+        "--fps", type=float, default=None, help="gif/mp4 frame rate (real time if unset)"
+    )
+    args = parser.parse_args()
+
+    out: str = args.out or (
+        "data/exports/frames" if args.format == "png" else f"data/exports/replay.{args.format}"
+    )
+    start: float = time.perf_counter()
+    frames: int = export_replay(
+        args.path, out, args.format, args.workers, args.every, args.scale, args.fps
+    )
+    elapsed: float = time.perf_counter() - start
+    print(f"{frames} frames to {out} in {elapsed:.2f}s ({frames / elapsed:,.1f} frames/s)")
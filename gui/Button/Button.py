@@ -1,7 +1,8 @@
 import pygame as game
 from pathlib import Path
 from renderers.text import render_text
-from animations.easing import ease_in_out
+from classes.Animator.Animator import ANIMATOR, Tween
+from renderers.assets import scaled_image
 
 
 class Button:
@@ -32,21 +33,11 @@ class Button:
 
         """
 
-        # Load button images
-        self.default_image: game.Surface = game.image.load(
-            default_img_path
-        ).convert_alpha()
-        self.selected_image: game.Surface = game.image.load(
-            selected_img_path
-        ).convert_alpha()
-
-        if size:
-            self.default_image: game.Surface = game.transform.scale(
-                self.default_image, size
-            )
-            self.selected_image: game.Surface = game.transform.scale(
-                self.selected_image, size
-            )
+        # Button images (shared by every button, loaded once per process)
+        self.default_image: game.Surface = scaled_image(default_img_path, size or None)
+        self.selected_image: game.Surface = scaled_image(
+            selected_img_path, size or None
+        )
 
         self.image: game.Surface = self.default_image
         self.rect: game.Rect = self.image.get_rect(center=pos)
@@ -68,22 +59,28 @@ class Button:
         )  # Center text
 
         self.cursor_state: bool = False  # To manage cursor state
-        self.animator: None = None  # To hold animation generator
         self.target_image: game.Surface = self.image  # Target image for animation
+        self.tween: Tween | None = None  # Running hover transition
+        # Copy of the previous image, faded out over the new one with set_alpha
+        self.fade_image: game.Surface | None = None
 
     def update(self, screen: game.Surface):
         """
-        Method that draws the button and its text on the screen.
+        Method that draws the button and its text on the screen
+        (the hover transition is advanced by ANIMATOR.update(), once per frame).
 
             :param screen: The surface to draw the button on.
         """
-        if self.animator:  # If animation is running
-            try:
-                self.image: game.Surface = next(self.animator)
-            except StopIteration:
-                self.animator: None = None
-
         screen.blit(self.image, self.rect)
+
+        if self.tween is not None:  # If animation is running
+            if self.tween.done:
+                self.tween = None
+                self.fade_image = None
+            else:
+                self.fade_image.set_alpha(int(255 * (1 - self.tween.value)))
+                screen.blit(self.fade_image, self.rect)
+
         screen.blit(self.text_surface, self.text_rect)
 
     def change_cursor(self, state: bool, hovering_sound: game.mixer.Sound):
@@ -142,8 +139,12 @@ class Button:
         )
 
         if self.target_image != target_image:  # State change
-            self.target_image = target_image
-            self.animator: None = ease_in_out(self.image, self.target_image, duration)
+            if self.tween is not None:
+                ANIMATOR.cancel(self.tween)
+            # The images are shared between buttons, so fade out a copy of the old one
+            self.fade_image = self.image.copy()
+            self.image = self.target_image = target_image
+            self.tween = ANIMATOR.add(duration)
 
         # Always update text color
         self.text_surface: game.Surface = render_text(
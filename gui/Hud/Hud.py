@@ -2,6 +2,7 @@ import pygame as game
 import os
 from pathlib import Path
 from renderers.text import render_text
+from renderers.assets import load_image
 import globals.states.score as score_state
 
 
@@ -10,23 +11,33 @@ class HUD_Score:
     Class to manage and display the player's score and high score.
     """
 
-    def __init__(self, level: str):
+    def __init__(self, level: str, headless: bool = False, persist: bool = True):
         """
         Constructor for the Score class.
 
         Initializes the score, high score, font, and apple icon.
 
         :param level: The current game level (used for high score tracking).
+        :param headless: If True, skip the icon and never read/write the high score file.
+        :param persist: If False, read the high score but never write it (e.g. replays).
         """
 
         self.score: int = 0
         self.level: str = level
-        self.apple_icon: game.Surface = game.image.load(
+        self.headless: bool = headless
+        self.persist: bool = persist and not headless
+        self.surface: game.Surface | None = None  # composed HUD, None when outdated
+        self.icon: game.Surface | None = None  # apple icon scaled to the text, made once
+
+        if headless:
+            self.high_score: int = 0  # simulated runs keep the high score in memory
+            return
+
+        self.apple_icon: game.Surface = load_image(
             Path("assets/graphics/items/apple.png")
         )
 
         # --- Trim transparent padding from the icon so centering uses visible pixels
-        self.apple_icon: game.Surface = self.apple_icon.convert_alpha()
         bounds: game.Rect = self.apple_icon.get_bounding_rect()
         self.apple_icon: game.Surface = self.apple_icon.subsurface(bounds).copy()
         self.icon_size: tuple[int, int] = self.apple_icon.get_size()
@@ -52,6 +63,7 @@ class HUD_Score:
         """Reset the score when the game ends."""
         self.score: int = 0
         score_state.apples_eaten = 0
+        self.surface = None
 
     def add_score(self, amount: int = 1):
         """Add to the current score.
@@ -62,7 +74,9 @@ class HUD_Score:
         score_state.apples_eaten = self.score  # update module-level score state
         if self.score > self.high_score:
             self.high_score: int = self.score
-            self.save_high_score()  # save high score immediately when updated
+            if self.persist:
+                self.save_high_score()  # save high score immediately when updated
+        self.surface = None
 
     def subtract_score(self, amount: int = 1):
         """Subtract from the current score.
@@ -74,13 +88,32 @@ class HUD_Score:
         if self.score < 0:
             self.score = 0  # prevent negative scores
             score_state.apples_eaten = 0
+        self.surface = None
+
+    def set_score(self, score: int):
+        """Set the score directly (restoring a saved game state).
+
+        :param score: The score to show.
+        """
+        self.score = score
+        self.surface = None
 
     def draw_score(self, screen: game.Surface, pos=(20, 20)):
-        """Draw the score HUD.
+        """Draw the score HUD (one blit of the cached surface, see `render_hud`).
 
         :param screen: The surface to draw the HUD on.
         :param pos: The top-left position to draw the HUD.
         """
+        if self.surface is None:  # the score changed since the last draw
+            self.surface = self.render_hud()
+        screen.blit(self.surface, pos)
+
+    def render_hud(self) -> game.Surface:
+        """Compose the HUD box: apple icon, score and high score.
+
+        Returns:
+            game.Surface: A new surface with the HUD.
+        """
         text: str = f"{self.score}   HI {self.high_score}"
         text_surface: game.Surface = render_text(
             text, self.text_color, type="label", return_surface=True
@@ -90,12 +123,14 @@ class HUD_Score:
         icon_height: int = int(text_surface.get_height() * 1.4)
         desired_icon_size: tuple[int, int] = (icon_height, icon_height)
 
-        if self.apple_icon.get_size() != desired_icon_size:
-            icon: game.Surface = game.transform.smoothscale(
-                self.apple_icon, desired_icon_size
-            )
-        else:
-            icon: game.Surface = self.apple_icon
+        if self.icon is None or self.icon.get_size() != desired_icon_size:
+            if self.apple_icon.get_size() != desired_icon_size:
+                self.icon: game.Surface = game.transform.smoothscale(
+                    self.apple_icon, desired_icon_size
+                )
+            else:
+                self.icon: game.Surface = self.apple_icon
+        icon: game.Surface = self.icon
 
         # Content (icon + spacing + text)
         content_w: int = desired_icon_size[0] + self.spacing + text_surface.get_width()
@@ -124,8 +159,7 @@ class HUD_Score:
         # Blit
         box.blit(icon, icon_rect)
         box.blit(text_surface, text_rect)
-
-        screen.blit(box, pos)
+        return box
 
     def load_high_score(self) -> int:
         """
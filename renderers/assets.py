@@ -0,0 +1,147 @@
+import pygame as game
+from pathlib import Path
+from settings.settings import CELL_SIZE
+
+# Process-wide caches: every file is decoded once, every scaled variant made once
+_images: dict[tuple[str, bool], game.Surface] = {}
+_scaled: dict[tuple[str, tuple[int, int], bool, bool], game.Surface] = {}
+_atlases: dict[int, "SpriteAtlas"] = {}
+
+SNAKE_SPRITES: str = "assets/graphics/snake_sprites"
+
+# Sprites packed into the game atlas: (path, width in cells, height in cells, smooth)
+ATLAS_SPRITES: list[tuple[str, int, int, bool]] = [
+    *(
+        (f"{SNAKE_SPRITES}/{name}.png", 1, 1, True)
+        for name in (
+            "head_up",
+            "head_down",
+            "head_left",
+            "head_right",
+            "tail_up",
+            "tail_down",
+            "tail_left",
+            "tail_right",
+            "body_vertical",
+            "body_horizontal",
+            "body_top_right",
+            "body_top_left",
+            "body_bottom_right",
+            "body_bottom_left",
+        )
+    ),
+    ("assets/graphics/items/apple.png", 1, 1, True),
+    ("assets/graphics/items/poison.png", 1, 1, False),
+    ("assets/graphics/items/trap.png", 2, 2, False),
+]
+
+
+def load_image(path: str | Path, alpha: bool = True) -> game.Surface:
+    """
+    Load and convert an image file, once per process.
+
+    :param path: The image file.
+    :param alpha: True for convert_alpha (per-pixel alpha), False for convert.
+    Returns:
+        game.Surface: The shared surface (do not draw on it).
+    """
+    key: tuple[str, bool] = (str(path), alpha)
+    image: game.Surface | None = _images.get(key)
+    if image is None:
+        raw: game.Surface = game.image.load(Path(path))
+        image = raw.convert_alpha() if alpha else raw.convert()
+        _images[key] = image
+    return image
+
+
+def scaled_image(
+    path: str | Path,
+    size: tuple[int, int] | None,
+    smooth: bool = False,
+    alpha: bool = True,
+) -> game.Surface:
+    """
+    An image scaled to `size`, loaded and scaled once per process and size.
+
+    :param path: The image file.
+    :param size: Target (width, height) in pixels, or None for the original size.
+    :param smooth: True for smoothscale, False for scale.
+    :param alpha: True for convert_alpha (per-pixel alpha), False for convert.
+    Returns:
+        game.Surface: The shared surface (do not draw on it).
+    """
+    if size is None:
+        return load_image(path, alpha)
+    key: tuple[str, tuple[int, int], bool, bool] = (
+        str(path),
+        (int(size[0]), int(size[1])),
+        smooth,
+        alpha,
+    )
+    image: game.Surface | None = _scaled.get(key)
+    if image is None:
+        scale = game.transform.smoothscale if smooth else game.transform.scale
+        image = scale(load_image(path, alpha), key[1])
+        _scaled[key] = image
+    return image
+
+
+class SpriteAtlas:
+    """
+    Several sprites packed into one surface (rows of sprites, left to right).
+    Each sprite is handed out as a subsurface of the atlas, so the sprites share
+    one allocation instead of one surface each.
+    """
+
+    def __init__(
+        self, sprites: list[tuple[str, tuple[int, int], bool]], max_width: int = 512
+    ):
+        """
+        :param sprites: (path, size in pixels, smooth) of each sprite.
+        :param max_width: Width at which a new row of sprites is started.
+        """
+        places: list[tuple[tuple[str, tuple[int, int], bool], game.Rect]] = []
+        x: int = 0
+        y: int = 0
+        row_height: int = 0
+        for path, size, smooth in sprites:
+            if x and x + size[0] > max_width:
+                x, y, row_height = 0, y + row_height, 0
+            places.append(((path, size, smooth), game.Rect((x, y), size)))
+            x += size[0]
+            row_height = max(row_height, size[1])
+
+        width: int = max((rect.right for _, rect in places), default=1)
+        height: int = max((rect.bottom for _, rect in places), default=1)
+        self.surface: game.Surface = game.Surface((width, height), game.SRCALPHA)
+        self.sprites: dict[tuple[str, tuple[int, int], bool], game.Surface] = {}
+        for key, rect in places:
+            image: game.Surface = scaled_image(key[0], key[1], key[2])
+            # Adding onto the zeroed atlas copies the pixels exactly (a normal blit
+            # would blend the semi-transparent edges against transparent black)
+            self.surface.blit(image, rect, special_flags=game.BLEND_RGBA_ADD)
+            self.sprites[key] = self.surface.subsurface(rect)
+
+
+def pack_atlas(cell_size: int = CELL_SIZE) -> SpriteAtlas:
+    """
+    Pack the snake, item and obstacle sprites at `cell_size` into one atlas (once
+    per cell size). From then on `scaled_image` hands out the atlas sprites for
+    those files and sizes, so nothing drawn during a game touches the disk.
+
+    :param cell_size: Size of one grid cell in pixels.
+    Returns:
+        SpriteAtlas: The atlas.
+    """
+    atlas: SpriteAtlas | None = _atlases.get(cell_size)
+    if atlas is None:
+        atlas = SpriteAtlas(
+            [
+                (path, (cell_size * width, cell_size * height), smooth)
+                for path, width, height, smooth in ATLAS_SPRITES
+            ]
+        )
+        for (path, size, smooth), sprite in atlas.sprites.items():
+            _scaled[(path, size, smooth, True)] = sprite
+        _atlases[cell_size] = atlas
+    return atlas
@@ -1,6 +1,7 @@
 import pygame as game
 from pathlib import Path
 from settings.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from renderers.assets import scaled_image
 
 
 def render_background(path: str) -> game.Surface:
@@ -14,9 +15,8 @@ def render_background(path: str) -> game.Surface:
         game.Surface: The scaled background image surface.
 
     """
-    background: game.Surface = game.image.load(Path(path)).convert()
-    background: game.Surface = game.transform.scale(
-        background, (SCREEN_WIDTH, SCREEN_HEIGHT)
-    )  # to adjust the window size
+    background: game.Surface = scaled_image(
+        Path(path), (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False
+    )  # to adjust the window size (loaded once per process)
 
     return background
@@ -1,14 +1,32 @@
 import pygame as game
 
+FONT_PATH: str = "assets/font/PressStart2P_font.ttf"
+
+# Process-wide cache: the font file is opened and parsed once per size
+_fonts: dict[int, game.font.Font] = {}
+
 
 def render_font(size: int) -> game.font.Font:
     """
-    Render a font object from a file path and size.
+    Render a font object from a file path and size (loaded once per size).
 
     :param size: Size of the font.
 
     Returns:
-        game.font.Font: The rendered font object.
+        game.font.Font: The shared font object.
     """
+    font: game.font.Font | None = _fonts.get(size)
+    if font is None:
+        font = game.font.Font(FONT_PATH, size)
+        _fonts[size] = font
+    return font
 
-    return game.font.Font("assets/font/PressStart2P_font.ttf", size)
+
+def loaded_fonts() -> int:
+    """
+    Number of font objects created so far (one per size ever asked for).
+
+    Returns:
+        int: How many times the font file was opened.
+    """
+    return len(_fonts)
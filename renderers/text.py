@@ -1,5 +1,8 @@
 import pygame as game
-from renderers.font import render_font
+from classes.TextCache.TextCache import TextCache
+
+# Process-wide cache of rendered text: steady frames re-blit the same surfaces
+TEXT_CACHE: TextCache = TextCache()
 
 
 def render_text(
@@ -13,6 +16,7 @@ def render_text(
 ) -> game.Surface | None:
     """
     Renders a label text on the screen or returns the surface if requested.
+    Surfaces come from TEXT_CACHE, so the same text is only rendered once.
 
 
     :param text: The text to render.
@@ -23,14 +27,14 @@ def render_text(
     :param offset: Shadow offset for "title".
     :param return_surface: If True, return a text Surface instead of blitting (default False).
     Returns:
-        game.Surface: The rendered text surface if return_surface is True, else None.
+        game.Surface: The rendered text surface if return_surface is True, else None
+        (shared with other callers, do not draw on it).
     """
 
     font_size: int = 60 if type == "title" else 20 if type == "input" else 13
-    FONT: game.Font = render_font(size=font_size)
 
-    # Always render a surface
-    text_surface: game.Surface = FONT.render(text, True, color)
+    # Always get a surface (rendered only on a cache miss)
+    text_surface: game.Surface = TEXT_CACHE.get(text, color, font_size)
 
     if return_surface:
         return text_surface
@@ -40,7 +44,7 @@ def render_text(
 
     if type == "title":
         if effect == "shadow":
-            shadow_surface: game.Surface = FONT.render(text, True, color)
+            shadow_surface: game.Surface = text_surface  # same text, same pixels
             shadow_rect: game.Rect = shadow_surface.get_rect(
                 center=(
                     SCREEN.get_width() // 2 + offset[0],
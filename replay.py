@@ -0,0 +1,18 @@
+import argparse
+from PIL import Image
+import pygame as game
+from settings.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from renderers.icon import render_icon
+from screens.gameplay import LAST_REPLAY_PATH
+from screens.replay import replay_screen
+
+parser = argparse.ArgumentParser(description="Watch a recorded GrubSnake game.")
+parser.add_argument("path", nargs="?", default=str(LAST_REPLAY_PATH))
+args = parser.parse_args()
+
+game.init()
+SCREEN: game.Surface = game.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+game.display.set_caption("GRUBSNAKE - REPLAY")
+render_icon(icon_path="assets/Icon.ico", Image=Image)
+
+replay_screen(SCREEN, args.path)
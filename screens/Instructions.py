@@ -1,4 +1,5 @@
 import pygame as game
+from classes.FramePacer.FramePacer import MENU_PACER
 
 
 def instructions_screen(SCREEN: game.Surface):
@@ -11,11 +12,10 @@ def instructions_screen(SCREEN: game.Surface):
     while True:
 
         SCREEN.fill((0, 0, 0))  # Clear the screen with a black background
+        game.display.update()
 
-        for event in game.event.get():
+        for event in MENU_PACER.events(animating=False):  # nothing animates here
             if event.type == game.QUIT:
                 game.quit()
                 exit()
             print("INSTRUCTIONS SCREEN")
-
-        game.display.update()
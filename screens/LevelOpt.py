@@ -9,7 +9,9 @@ from gui.Button.Button import Button
 from events.keyboard import handle_keydown_navigation
 from events.mouse import handle_mouse_navigation
 from screens.gameplay import gameplay_screen
-from animations.fading import fade_in
+from classes.FramePacer.FramePacer import MENU_PACER
+from classes.Animator.Animator import ANIMATOR, Tween
+from animations.fading import start_fade, draw_fade
 
 
 def level_opt_screen(SCREEN: game.Surface):
@@ -36,39 +38,46 @@ def level_opt_screen(SCREEN: game.Surface):
         ),
     ]
 
+    fade: Tween | None = None  # fade-in, drawn over the first frames
     # Initialize selected index if it doesn't exist
     if not hasattr(level_opt_screen, "selected_idx"):
         level_opt_screen.selected_idx = 0  # Default to the first button / To manage the state of the selected button
+        fade = start_fade(duration=550)
 
-        # TODO : REFACTOR THIS CODE TO INCLUDE THE RENDER UI ELEMENTS WITH A FUNCTION HELPER
+    # TODO : REFACTOR THIS CODE TO INCLUDE THE RENDER UI ELEMENTS WITH A FUNCTION HELPER
 
-        def render_level_options():
-            """Helper function to draw the entire level options screen."""
-            SCREEN.blit(BG, (0, 0))
+    def render_level_options():
+        """Helper function to draw the entire level options screen."""
+        SCREEN.blit(BG, (0, 0))
 
-            render_text(
-                text="CHOOSE THE LEVEL TO PLAY",
-                color="#005f1a",
-                SCREEN=SCREEN,
-                type="input",
-                effect="none",
-            )
+        render_text(
+            text="CHOOSE THE LEVEL TO PLAY",
+            color="#005f1a",
+            SCREEN=SCREEN,
+            type="input",
+            effect="none",
+        )
 
-            render_buttons(
-                buttons=BUTTONS,
-                screen=SCREEN,
-                menu_mouse_pos=game.mouse.get_pos(),
-                selected_idx=level_opt_screen.selected_idx,
-                hovering_sound=SELECT_BTN_SOUND,
-            )
-
-        fade_in(SCREEN, render_level_options, duration=550)
+        render_buttons(
+            buttons=BUTTONS,
+            screen=SCREEN,
+            menu_mouse_pos=game.mouse.get_pos(),
+            selected_idx=level_opt_screen.selected_idx,
+            hovering_sound=SELECT_BTN_SOUND,
+        )
 
     while True:
+        ANIMATOR.update()  # advance the fade and button transitions to this frame
         render_level_options()
+        if fade is not None:  # the fade no longer blocks input
+            draw_fade(SCREEN, fade)
+            if fade.done:
+                fade = None
+
+        game.display.update()
 
-        # Event handling
-        for event in game.event.get():
+        # Event handling (waits for the next frame, see FramePacer)
+        for event in MENU_PACER.events(animating=ANIMATOR.active):
             if event.type == game.QUIT:
                 game.quit()
                 sys.exit()
@@ -94,5 +103,3 @@ def level_opt_screen(SCREEN: game.Surface):
                     mouse_pos=game.mouse.get_pos(),
                     SCREEN=SCREEN,
                 )
-
-        game.display.update()
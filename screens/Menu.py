@@ -6,6 +6,8 @@ from renderers.text import render_text
 from renderers.sounds import MENU_MUSIC_SOUND, SELECT_BTN_SOUND
 from renderers.buttons import render_buttons
 from gui.Button.Button import Button
+from classes.FramePacer.FramePacer import MENU_PACER
+from classes.Animator.Animator import ANIMATOR
 from screens.Instructions import instructions_screen
 from screens.LevelOpt import level_opt_screen
 from events.keyboard import handle_keydown_navigation
@@ -44,6 +46,7 @@ def main_menu_screen(SCREEN: game.Surface):
     MENU_MUSIC_SOUND.play(loops=-1)
 
     while True:
+        ANIMATOR.update()  # advance the button transitions to this frame
         SCREEN.blit(BG, (0, 0))
         MENU_MOUSE_POS: tuple[int, int] = game.mouse.get_pos()
 
@@ -73,8 +76,10 @@ def main_menu_screen(SCREEN: game.Surface):
             hovering_sound=SELECT_BTN_SOUND,
         )
 
-        # Event handling
-        for event in game.event.get():
+        game.display.update()
+
+        # Event handling (waits for the next frame, see FramePacer)
+        for event in MENU_PACER.events(animating=ANIMATOR.active):
             if event.type == game.QUIT:
                 game.quit()
                 sys.exit()
@@ -100,5 +105,3 @@ def main_menu_screen(SCREEN: game.Surface):
                     mouse_pos=MENU_MOUSE_POS,
                     SCREEN=SCREEN,
                 )
-
-        game.display.update()
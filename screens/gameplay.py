@@ -1,8 +1,15 @@
 import pygame as game
 import sys
+import time
 from pathlib import Path
 from classes.Main import Main
-from settings.settings import LEVELS, MOVE_EVENT
+from classes.Autopilot.Autopilot import Autopilot
+from classes.DirtyRenderer.DirtyRenderer import DirtyRenderer
+from classes.FrameCapture.FrameCapture import FrameCapture, capture_from_env
+from classes.Replay.Replay import Replay
+from classes.TickScheduler.TickScheduler import TickScheduler
+from classes.Profiler.Profiler import PROFILER
+from classes.Animator.Animator import ANIMATOR, Tween
 from renderers.sounds import (
     MENU_MUSIC_SOUND,
     EAT_APPLE_SOUND,
@@ -10,17 +17,27 @@ from renderers.sounds import (
     GAME_OVER_SOUND,
 )
 from renderers.background import render_background
+from settings.settings import INTERPOLATED_RENDER
 from events.keyboard import handle_keydown_snake_movement
-from animations.fading import fade_in
+from animations.fading import start_fade, draw_fade
 
+LAST_REPLAY_PATH: Path = Path("data/replays/last.grpl")
 
-def gameplay_screen(SCREEN: game.Surface, chosen_level: str):
+
+def gameplay_screen(
+    SCREEN: game.Surface, chosen_level: str, capture: FrameCapture | None = None
+):
     """
     Renders the gameplay screen for the selected difficulty level.
 
     :param SCREEN: The main game surface where elements are drawn.
     :param chosen_level: The difficulty level chosen by the player.
+    :param capture: Receives every frame that changed, as a NumPy view of SCREEN
+        (e.g. to record gameplay for training, see FrameCapture). Defaults to the
+        one set up by GRUBSNAKE_CAPTURE, if any (see capture_from_env).
     """
+    if capture is None:
+        capture = capture_from_env(SCREEN)
     BG: game.Surface = render_background(Path("assets/backgrounds/game_bg.png"))
     MENU_MUSIC_SOUND.stop()
 
@@ -31,30 +48,88 @@ def gameplay_screen(SCREEN: game.Surface, chosen_level: str):
         selected_level=chosen_level,
     )
 
-    def render_fade_in():
-        SCREEN.blit(BG, (0, 0))
-        main_game.draw_elements(SCREEN)
-
     clock: game.time.Clock = game.time.Clock()  # Control the frame rate
+    autopilot: Autopilot | None = None  # toggled with P
+    # Fade-in over the first frames; the snake starts moving once it is over
+    fade: Tween | None = start_fade(duration=1550)
 
-    fade_in(SCREEN, render_fade_in, duration=1550)
-
-    game.time.set_timer(
-        MOVE_EVENT, int(round(LEVELS[chosen_level]["move_interval"]))
-    )  # Set snake movement timer
+    # Snake movement ticks, timed by the scheduler instead of a MOVE_EVENT timer
+    scheduler: TickScheduler = TickScheduler(main_game.snake_speed)
+    if PROFILER.enabled:
+        PROFILER.gauge("tick_jitter", scheduler.jitter)  # lateness of the ticks
+    # Only the cells and HUD areas that changed are redrawn and sent to the display
+    renderer: DirtyRenderer = DirtyRenderer(SCREEN, BG)
+    last_step: tuple[int, int] | None = None  # (tick, pixels moved) last drawn
 
     while True:
-        SCREEN.blit(BG, (0, 0))  # Clear screen each frame
+        frame_start: int = time.perf_counter_ns()
+        ANIMATOR.update()  # advance the fade-in to this frame
 
         for event in game.event.get():
             if event.type == game.QUIT:
+                # Seed + inputs are enough to rebuild the session (see replay.py)
+                Replay.record(
+                    chosen_level,
+                    main_game.seed,
+                    main_game.inputs,
+                    main_game.tick,
+                    zoom=main_game.zoom,
+                ).save(LAST_REPLAY_PATH)
                 game.quit()
                 sys.exit()
+            if event.type == game.WINDOWEXPOSED:
+                renderer.invalidate()  # the window contents were lost
             if event.type == game.KEYDOWN:
-                handle_keydown_snake_movement(event, main_game=main_game)
-            elif event.type == MOVE_EVENT:  #  Snake movement event
-                main_game.update_game()
+                if event.key == game.K_p:
+                    autopilot = Autopilot(main_game) if autopilot is None else None
+                    scheduler.reset()  # the new driver starts on a fresh tick
+                else:
+                    handle_keydown_snake_movement(event, main_game=main_game)
+
+        due: int = scheduler.advance() if fade is None else 0
+        for _ in range(due):
+            if autopilot is not None:
+                direction: game.Vector2 | None = autopilot.decide()
+                if direction is not None:
+                    main_game.change_direction(direction)
+            main_game.outcome = None
+            main_game.update_game()
+            scheduler.interval = main_game.snake_speed  # medium speeds up per apple
+            if main_game.outcome is not None:
+                # a new round starts on a fresh tick, without the old round's backlog
+                scheduler.reset()
+                break
 
-        main_game.draw_elements(SCREEN)
-        game.display.update()
+        # Everything on screen moves with the ticks. Drawn in between them, the snake
+        # ends move by whole pixels, so a frame is only drawn once they would move
+        alpha: float | None = None
+        moved: bool = False
+        if INTERPOLATED_RENDER:
+            alpha = scheduler.alpha
+            step: tuple[int, int] = (
+                main_game.tick,
+                round(alpha * main_game.geometry.cell_size),
+            )
+            moved, last_step = step != last_step, step
+        updated: bool = False
+        if fade is not None:  # whole frames under the overlay, outside the renderer
+            SCREEN.blit(BG, (0, 0))
+            main_game.draw_elements(SCREEN)
+            draw_fade(SCREEN, fade)
+            game.display.update()
+            updated = True
+            if fade.done:
+                fade = None
+                renderer.invalidate()
+        elif due or moved or renderer.full:
+            dirty: list[game.Rect] = renderer.render(
+                lambda surface: main_game.draw_elements(surface, alpha)
+            )
+            if dirty:
+                game.display.update(dirty)
+                updated = True
+        if updated and capture is not None:
+            capture.capture(main_game.tick)
+        if PROFILER.enabled:  # frame work, without the wait for the next frame
+            PROFILER.record("frame", time.perf_counter_ns() - frame_start)
         clock.tick(60)
@@ -0,0 +1,113 @@
+import pygame as game
+import sys
+from pathlib import Path
+from classes.Main import Main
+from classes.Replay.Replay import Replay, ReplayPlayer
+from classes.TickScheduler.TickScheduler import TickScheduler
+from renderers.background import render_background
+from renderers.text import render_text
+from renderers.sounds import MENU_MUSIC_SOUND
+
+REPLAY_SPEEDS: dict[int, int] = {game.K_1: 1, game.K_2: 8, game.K_3: 64}
+BAR_HEIGHT: int = 6  # seek bar at the bottom of the screen
+
+
+def replay_screen(SCREEN: game.Surface, path: str | Path):
+    """
+    Plays back a recorded game (see `classes.Replay.Replay`).
+
+    Controls: SPACE pause, 1/2/3 play at 1x/8x/64x, LEFT/RIGHT seek one keyframe
+    interval, HOME/END jump to the start/end, click the bar to seek anywhere,
+    S toggle skip-render (simulate as fast as possible without drawing the game).
+
+    :param SCREEN: The main game surface where elements are drawn.
+    :param path: The replay file to play.
+    """
+    replay: Replay = Replay.load(path)
+    BG: game.Surface = render_background(Path("assets/backgrounds/game_bg.png"))
+    MENU_MUSIC_SOUND.stop()
+
+    main_game: Main = Main(
+        eat_sound=None,
+        poison_sound=None,
+        game_over_sound=None,
+        selected_level=replay.level,
+        seed=replay.seed,
+        persist_high_score=False,  # watching a replay never sets a high score
+    )
+    player: ReplayPlayer = ReplayPlayer(replay, main_game)
+
+    clock: game.time.Clock = game.time.Clock()
+    speed: int = 1
+    paused: bool = False
+    skip_render: bool = False
+    # 64x on hard is ~1200 ticks/s, so allow a whole frame's worth of catch-up
+    scheduler: TickScheduler = TickScheduler(main_game.snake_speed, max_catch_up=64)
+
+    def seek(tick: int):
+        player.seek(tick)
+        scheduler.reset()  # play on from the new tick, not the time the seek took
+
+    while True:
+        for event in game.event.get():
+            if event.type == game.QUIT:
+                game.quit()
+                sys.exit()
+            if event.type == game.KEYDOWN:
+                if event.key == game.K_ESCAPE:
+                    return
+                if event.key == game.K_SPACE:
+                    paused = not paused
+                    scheduler.reset()  # resume on a fresh tick, not the paused time
+                elif event.key in REPLAY_SPEEDS:
+                    speed = REPLAY_SPEEDS[event.key]
+                elif event.key == game.K_s:
+                    skip_render = not skip_render
+                elif event.key == game.K_LEFT:
+                    seek(main_game.tick - replay.keyframe_interval)
+                elif event.key == game.K_RIGHT:
+                    seek(main_game.tick + replay.keyframe_interval)
+                elif event.key == game.K_HOME:
+                    seek(0)
+                elif event.key == game.K_END:
+                    seek(replay.ticks)
+            elif (
+                event.type == game.MOUSEBUTTONDOWN
+                and event.pos[1] >= SCREEN.get_height() - BAR_HEIGHT * 3
+            ):
+                seek(replay.ticks * event.pos[0] // SCREEN.get_width())
+
+        clock.tick(60)
+        scheduler.interval = main_game.snake_speed / speed
+        due: int = scheduler.advance()
+        if skip_render and not paused:
+            # Run the simulation flat out for most of a frame, then show progress only
+            deadline: int = game.time.get_ticks() + 14
+            while not player.finished and game.time.get_ticks() < deadline:
+                player.step()
+        elif not paused:
+            for _ in range(due):
+                if player.finished:
+                    break
+                player.step()
+
+        SCREEN.blit(BG, (0, 0))
+        if not skip_render:
+            main_game.draw_elements(SCREEN)
+
+        status: str = "SKIP" if skip_render else f"{speed}X"
+        if paused:
+            status += " PAUSED"
+        render_text(
+            f"REPLAY {replay.level.upper()}  TICK {main_game.tick}/{replay.ticks}  {status}",
+            "#ffffff",
+            SCREEN,
+            type="label",
+        )
+        progress: int = SCREEN.get_width() * main_game.tick // max(1, replay.ticks)
+        game.draw.rect(
+            SCREEN,
+            "#285f25",
+            (0, SCREEN.get_height() - BAR_HEIGHT, progress, BAR_HEIGHT),
+        )
+        game.display.update()
@@ -1,16 +1,11 @@
-import pygame as game
-
 SCREEN_WIDTH: int = 950
 SCREEN_HEIGHT: int = 600
 
 # TODO:
-# THE CELL_SIZE SHOULD BE ADJUSTABLE WHILE THE SCORE INCREASES (TO A LIMIT) FOR A DECREASE VIEW OF THE MAP EFFECT TO BE POSSIBLE TO REACH HIGH SCORES VALUES
-# THIS WILL REQUIRE ADJUSTMENTS IN THE SPAWNING OF ITEMS AND OBSTACLES TO AVOID IMPOSSIBLE SITUATIONS
-# IT SHOULD HAVE A MINIMUM AND A MAXIMUM CELL SIZE
 # IT SHOULD HAVE A MAXIMUM SCORE VALUE TO REACH (E.G., 1000 POINTS) TO WIN THE GAME
 
 
-# Snake & items size of the game
+# Snake & items size of the game (at the start of a round, see ZOOM_TIERS)
 CELL_SIZE: int = 23  # the size of each cell in pixels
 
 # Auto-calculate grid
@@ -20,7 +15,12 @@ CELL_NUMBER_Y: int = SCREEN_HEIGHT // CELL_SIZE
 SCREEN_WIDTH: int = CELL_NUMBER_X * CELL_SIZE
 SCREEN_HEIGHT: int = CELL_NUMBER_Y * CELL_SIZE
 
-MOVE_EVENT: int = game.USEREVENT + 1
+# Zoom tiers: (score from which the tier applies, cell size in pixels).
+# The board zooms out as the score climbs, so more cells fit on the screen and
+# high scores stay reachable; it only zooms back in when a new round starts.
+# Only the windowed game zooms by default: headless games (simulations, agents,
+# BatchGame) play on the base grid, and replays record which of the two they are.
+ZOOM_TIERS: list[tuple[int, int]] = [(0, CELL_SIZE), (15, 20), (30, 17), (50, 15)]
 
 # level settings with game speed and difficulty
 LEVELS: dict[str, dict[str, int]] = {
@@ -34,3 +34,10 @@ LEVELS: dict[str, dict[str, int]] = {
         "move_interval": 55,
     },
 }
+
+# Draw the snake and the obstacles between their positions of the previous and
+# the current tick (blended by how much of the tick has elapsed), so they move
+# smoothly at any frame rate; the simulation still runs at the level's interval.
+# Off by default: then frames without a tick redraw nothing (see DirtyRenderer),
+# while interpolation redraws the moving ends on most frames.
+INTERPOLATED_RENDER: bool = False
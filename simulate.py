@@ -0,0 +1,139 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import random
+import time
+from pygame import Vector2
+from settings.settings import LEVELS
+from classes.Main import Main
+
+
+def run_batch(level: str, ticks: int, games: int) -> float:
+    """
+    Step a vectorized batch of games with random actions.
+
+    :param level: The difficulty level to simulate ('easy', 'medium', 'hard').
+    :param ticks: How many steps to run (each step advances every game once).
+    :param games: How many games to step in lockstep.
+
+    Returns:
+        float: Elapsed wall time in seconds.
+    """
+    import numpy as np
+    from classes.BatchGame.BatchGame import BatchGame
+
+    batch: BatchGame = BatchGame(level, games, seed=0)
+    rng: np.random.Generator = np.random.default_rng(1)
+
+    start: float = time.perf_counter()
+    for _ in range(ticks):
+        batch.step(rng.integers(0, 5, size=games))
+    return time.perf_counter() - start
+
+
+def run_simulation(level: str, ticks: int, turn_chance: float) -> float:
+    """
+    Run the game logic headlessly for a number of ticks.
+
+    :param level: The difficulty level to simulate ('easy', 'medium', 'hard').
+    :param ticks: How many game ticks (snake moves) to run.
+    :param turn_chance: Probability of turning left/right on each tick.
+
+    Returns:
+        float: Elapsed wall time in seconds.
+    """
+    main_game: Main = Main(
+        eat_sound=None,
+        poison_sound=None,
+        game_over_sound=None,
+        selected_level=level,
+        headless=True,
+    )
+
+    start: float = time.perf_counter()
+    for _ in range(ticks):
+        if random.random() < turn_chance:  # random perpendicular turn
+            direction: Vector2 = main_game.snake.direction
+            main_game.snake.direction = random.choice(
+                (Vector2(direction.y, direction.x), Vector2(-direction.y, -direction.x))
+            )
+        main_game.update_game()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run GrubSnake headlessly and report ticks per second."
+    )
+    parser.add_argument("--level", choices=list(LEVELS), default="easy")
+    parser.add_argument("--ticks", type=int, default=100_000)
+    parser.add_argument("--turn-chance", type=float, default=0.1)
+    parser.add_argument(
+        "--batch", type=int, default=0, help="step this many games with NumPy"
+    )
+    parser.add_argument(
+        "--parity",
+        action="store_true",
+        help="check the batch engine against the scalar one and exit",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="time the game phases and write the stats to PATH (.json or .csv)",
+    )
+    parser.add_argument(
+        "--forks",
+        action="store_true",
+        help="benchmark Main.snapshot/restore at several snake lengths and exit",
+    )
+    parser.add_argument(
+        "--replay-check",
+        action="store_true",
+        help="check that a recorded game replays bit for bit and exit",
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        from classes.Profiler.Profiler import PROFILER
+
+        PROFILER.enable(args.profile)
+
+    if args.forks:
+        from simulation.forks import bench_forks, check_fork
+
+        for length in (3, 50, 200, 500, 1000):
+            check_fork(args.level, length)
+            snapshots, restores = bench_forks(args.level, length)
+            print(
+                f"level={args.level} length={length:4d} "
+                f"snapshots/s={snapshots:,.0f} restores/s={restores:,.0f}"
+            )
+    elif args.replay_check:
+        from simulation.replay import check_replay, check_replay_file
+
+        inputs: int = check_replay(args.level, ticks=min(args.ticks, 20_000))
+        size: int = check_replay_file(args.level, ticks=min(args.ticks, 20_000))
+        print(
+            f"level={args.level} replay ok ({inputs} inputs replayed, "
+            f"{size:,} byte replay file seeks exactly)"
+        )
+    elif args.parity:
+        from simulation.parity import check_parity
+
+        rounds: int = check_parity(args.level, ticks=min(args.ticks, 3000))
+        print(f"level={args.level} parity ok ({rounds} rounds finished)")
+    elif args.batch:
+        elapsed: float = run_batch(args.level, args.ticks, args.batch)
+        steps: int = args.ticks * args.batch
+        print(
+            f"level={args.level} games={args.batch} ticks={args.ticks} "
+            f"elapsed={elapsed:.3f}s board-steps/s={steps / elapsed:,.0f}"
+        )
+    else:
+        elapsed: float = run_simulation(args.level, args.ticks, args.turn_chance)
+        print(
+            f"level={args.level} ticks={args.ticks} "
+            f"elapsed={elapsed:.3f}s ticks/s={args.ticks / elapsed:,.0f}"
+        )
@@ -0,0 +1,103 @@
+import random
+from typing import Callable
+from weakref import WeakKeyDictionary
+from pygame import Vector2
+from classes.Main import Main
+from classes.Autopilot.Autopilot import Autopilot
+
+TURNS: tuple[Vector2, ...] = (
+    Vector2(0, -1),
+    Vector2(0, 1),
+    Vector2(-1, 0),
+    Vector2(1, 0),
+)
+
+
+def random_agent(main: Main, rng: random.Random) -> Vector2 | None:
+    """
+    Keep going straight, turning left or right at random one tick in ten.
+
+    :param main: The game to play.
+    :param rng: The agent's own random source.
+    Returns:
+        Vector2 | None: The new direction, or None to keep the current one.
+    """
+    if rng.random() >= 0.1:
+        return None
+    direction: Vector2 = main.snake.direction
+    return rng.choice(
+        (Vector2(direction.y, direction.x), Vector2(-direction.y, -direction.x))
+    )
+
+
+def greedy_agent(main: Main, rng: random.Random) -> Vector2 | None:
+    """
+    Step towards the apple, avoiding the border, the snake, poisons and obstacles
+    on the next cell when possible (no lookahead beyond one move).
+
+    :param main: The game to play.
+    :param rng: The agent's own random source (breaks ties).
+    Returns:
+        Vector2 | None: The new direction, or None to keep the current one.
+    """
+    board = main.board
+    head_x, head_y = main.snake.body.cell(0)
+    apple: Vector2 | None = main.apple.pos
+    best: tuple[tuple[int, float], Vector2] | None = None
+    for direction in TURNS:
+        if direction == -main.snake.direction:
+            continue
+        x: int = head_x + int(direction.x)
+        y: int = head_y + int(direction.y)
+        if not board.in_bounds(x, y):
+            danger: int = 3
+        else:
+            i: int = board.index(x, y)
+            if board.snake[i] or board.obstacles[i]:
+                danger: int = 2
+            else:
+                danger: int = 1 if board.items[i] == board.POISON else 0
+        distance: float = abs(x - apple.x) + abs(y - apple.y) if apple is not None else 0
+        key: tuple[int, float] = (danger, distance + rng.random())
+        if best is None or key < best[0]:
+            best = (key, direction)
+    return best[1]
+
+
+# One autopilot per game, so its distance field stays cached between ticks
+_autopilots: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def autopilot_agent(main: Main, rng: random.Random) -> Vector2 | None:
+    """
+    Follow the cached BFS distance field to the apple (see `Autopilot`).
+
+    :param main: The game to play.
+    :param rng: Unused (the autopilot is deterministic).
+    Returns:
+        Vector2 | None: The new direction, or None to keep the current one.
+    """
+    pilot: Autopilot | None = _autopilots.get(main)
+    if pilot is None:
+        pilot = _autopilots[main] = Autopilot(main)
+    return pilot.decide()
+
+
+def agent_stats(main: Main) -> dict:
+    """
+    Planning statistics of the agent that played a game, if it keeps any.
+
+    :param main: The game.
+    Returns:
+        dict: `Autopilot.stats()` for autopilot games, else an empty dict.
+    """
+    pilot: Autopilot | None = _autopilots.get(main)
+    return pilot.stats() if pilot is not None else {}
+
+
+# Agents playable by name (tournament jobs only carry the name across processes)
+AGENTS: dict[str, Callable[[Main, random.Random], Vector2 | None]] = {
+    "random": random_agent,
+    "greedy": greedy_agent,
+    "autopilot": autopilot_agent,
+}
@@ -0,0 +1,417 @@
+import json
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+import pygame as game
+from pygame import Vector2
+from settings.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from classes.Board.Board import Board
+from classes.Main import Main
+from classes.Obstacle.Obstacle import Obstacle
+from classes.Snake.Snake import Snake
+
+BASELINE_PATH: Path = Path("simulation/bench_baseline.json")
+
+# Values each parameter is swept over (the other parameters stay at their default)
+SWEEPS: dict[str, tuple[int, ...]] = {
+    "length": (3, 32, 128, 512, 1050),  # up to a full 41x26 board (room for items)
+    "poisons": (4, 16, 64, 256),
+    "obstacles": (1, 4, 16, 64, 200),
+}
+DEFAULTS: dict[str, int] = {"length": 3, "poisons": 8, "obstacles": 0}
+
+
+def board_cycle(board: Board) -> list[tuple[int, int]]:
+    """
+    A closed path through every cell of the board: along the top row, back and
+    forth over columns 1.. of the other rows, then up column 0. A snake laid on it
+    can move along it forever without dying, at any length.
+
+    :param board: The board (its height must be even for the path to close).
+    Returns:
+        list[tuple[int, int]]: The cells in path order.
+    """
+    width: int = board.width
+    cycle: list[tuple[int, int]] = [(x, 0) for x in range(width)]
+    for y in range(1, board.height):
+        columns: range = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        cycle.extend((x, y) for x in columns)
+    cycle.extend((0, y) for y in range(board.height - 1, 0, -1))
+    return cycle
+
+
+def lay_snake(snake: Snake, length: int) -> list[Vector2]:
+    """
+    Replace the body of `snake` with `length` segments on the board cycle (the
+    tail on the first cell), heading along the cycle.
+
+    :param snake: The snake to modify (its board is kept in sync).
+    :param length: Number of segments.
+    Returns:
+        list[Vector2]: For each cell index, the direction that follows the cycle.
+    """
+    board: Board = snake.board
+    cycle: list[tuple[int, int]] = board_cycle(board)
+    for x, y in snake.body.cells():
+        board.remove_snake(x, y)
+    snake.body.clear()
+    for x, y in cycle[:length]:  # each push becomes the head
+        snake.body.push_head(x, y)
+        board.add_snake(x, y)
+
+    follow: list[Vector2] = [Vector2()] * board.size
+    for (x, y), (nx, ny) in zip(cycle, cycle[1:] + cycle[:1]):
+        follow[board.index(x, y)] = Vector2(nx - x, ny - y)
+    snake.direction = follow[board.index(*snake.body.cell(0))]
+    snake.new_block = False
+    return follow
+
+
+def make_game(length: int, poisons: int, obstacles: int) -> Main:
+    """
+    A headless game in a given state: the snake on the board cycle, `poisons`
+    poisons, and `obstacles` 2x2 obstacles in a grid below the top rows (on hard,
+    so that the obstacle checks run). The snake only fills the top row at the
+    default length, so it never lies under an obstacle.
+
+    :param length: Number of snake segments.
+    :param poisons: Number of poisons on the board.
+    :param obstacles: Number of obstacles on the board (at most 220).
+    Returns:
+        Main: The game.
+    """
+    main: Main = Main(
+        None, None, None, "hard" if obstacles else "medium", headless=True, seed=0
+    )
+    board: Board = main.board
+    lay_snake(main.snake, length)
+    main.poisons.clear()
+    main.apple.randomize_position()
+    for _ in range(min(poisons, board.free_count())):
+        main.poisons.add(*board.random_free_cell(main.rng))
+
+    slots: list[tuple[int, int]] = [
+        (x, y) for y in range(4, board.height - 1, 2) for x in range(0, board.width - 1, 2)
+    ]
+    main.obstacles = [] if obstacles else None
+    for x, y in slots[:obstacles]:
+        obstacle: Obstacle = Obstacle("", 2, 2, x=x, headless=True)
+        obstacle.y = y
+        obstacle.pos = Vector2(x, y)
+        board.add_obstacle(x, y, obstacle.width, obstacle.height)
+        main.obstacles.append(obstacle)
+    return main
+
+
+def time_call(call: Callable[[], object], budget: float = 0.02, repeat: int = 5) -> float:
+    """
+    Time a call the way timeit does: find a loop count that runs for about
+    `budget` seconds, then keep the best of `repeat` runs.
+
+    :param call: The function to time (called with no arguments).
+    :param budget: Seconds per timed run.
+    :param repeat: Number of timed runs.
+    Returns:
+        float: Nanoseconds per call.
+    """
+    number: int = 1
+    while True:
+        start: int = time.perf_counter_ns()
+        for _ in range(number):
+            call()
+        elapsed: int = time.perf_counter_ns() - start
+        if elapsed >= budget * 1e9 or number >= 1 << 24:
+            break
+        number *= max(2, min(10, int(budget * 1e9 / max(elapsed, 1))))
+
+    best: float = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            call()
+        best = min(best, (time.perf_counter_ns() - start) / number)
+    return best
+
+
+def bench_move_growth(length: int, poisons: int, obstacles: int) -> Callable:
+    """
+    One move of a snake of `length` along the board cycle.
+
+    :param length: Number of snake segments.
+    :param poisons: Number of poisons.
+    :param obstacles: Number of obstacles.
+    Returns:
+        Callable: The call to time.
+    """
+    main: Main = make_game(length, poisons, obstacles)
+    snake: Snake = main.snake
+    board: Board = main.board
+    follow: list[Vector2] = lay_snake(snake, length)
+
+    def call():
+        x, y = snake.body.cell(0)
+        snake.direction = follow[board.index(x, y)]
+        snake.move_growth()
+
+    return call
+
+
+def bench_check_fail(length: int, poisons: int, obstacles: int) -> Callable:
+    """
+    The per-tick game over check (with nothing to report).
+
+    :param length: Number of snake segments.
+    :param poisons: Number of poisons.
+    :param obstacles: Number of obstacles.
+    Returns:
+        Callable: The call to time.
+    """
+    return make_game(length, poisons, obstacles).check_fail
+
+
+def bench_check_collision_item(length: int, poisons: int, obstacles: int) -> Callable:
+    """
+    The per-tick item check.
+
+    :param length: Number of snake segments.
+    :param poisons: Number of poisons.
+    :param obstacles: Number of obstacles.
+    Returns:
+        Callable: The call to time.
+    """
+    # the head is never on an item here: this is the per-tick cost of a miss
+    return make_game(length, poisons, obstacles).check_collision_item
+
+
+def bench_randomize_position(length: int, poisons: int, obstacles: int) -> Callable:
+    """
+    Moving the apple to a random free cell.
+
+    :param length: Number of snake segments.
+    :param poisons: Number of poisons.
+    :param obstacles: Number of obstacles.
+    Returns:
+        Callable: The call to time.
+    """
+    return make_game(length, poisons, obstacles).apple.randomize_position
+
+
+def bench_poison_respawn(length: int, poisons: int, obstacles: int) -> Callable:
+    """
+    Replacing the poisons with about `poisons` new ones (on medium).
+
+    :param length: Number of snake segments.
+    :param poisons: Number of poisons.
+    :param obstacles: Number of obstacles.
+    Returns:
+        Callable: The call to time.
+    """
+    main: Main = make_game(length, poisons, obstacles)
+    # on medium, apples eaten raise the count to apples + 3 .. apples + 5
+    apples: int = max(0, poisons - 4)
+    return lambda: main.poisons.respawn("medium", apples_eaten=apples)
+
+
+def bench_get_cells(length: int, poisons: int, obstacles: int) -> Callable:
+    """
+    `Obstacle.get_cells` of every obstacle.
+
+    :param length: Number of snake segments.
+    :param poisons: Number of poisons.
+    :param obstacles: Number of obstacles.
+    Returns:
+        Callable: The call to time.
+    """
+    main: Main = make_game(length, poisons, obstacles)
+    placed: list[Obstacle] = main.obstacles or []
+
+    def call():
+        for obstacle in placed:
+            obstacle.get_cells()
+
+    return call
+
+
+def bench_draw_snake(length: int, poisons: int, obstacles: int) -> Callable:
+    """
+    Drawing a snake of `length` onto an offscreen surface.
+
+    :param length: Number of snake segments.
+    :param poisons: Number of poisons.
+    :param obstacles: Number of obstacles.
+    Returns:
+        Callable: The call to time.
+    """
+    # needs a display mode set (the dummy video driver will do) for the sprites
+    snake: Snake = Snake(board=Board())
+    lay_snake(snake, length)
+    screen: game.Surface = game.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return lambda: snake.draw_snake(screen)
+
+
+# name -> (factory of the timed call, parameters swept)
+BENCHMARKS: dict[str, tuple[Callable, tuple[str, ...]]] = {
+    "move_growth": (bench_move_growth, ("length",)),
+    "check_fail": (bench_check_fail, ("length", "obstacles")),
+    "check_collision_item": (bench_check_collision_item, ("length", "poisons")),
+    "randomize_position": (bench_randomize_position, ("length", "poisons")),
+    # Item.spawn_poisons became PoisonField.respawn
+    "poison_respawn": (bench_poison_respawn, ("poisons", "length")),
+    "get_cells": (bench_get_cells, ("obstacles",)),
+    "draw_snake": (bench_draw_snake, ("length",)),
+}
+
+
+def growth_exponent(points: list[tuple[int, float]]) -> float:
+    """
+    Least-squares slope of log(time) over log(parameter): about 0 for O(1),
+    1 for O(n), 2 for O(n²) (lower at small n, where fixed costs dominate).
+
+    :param points: (parameter value, ns per call) pairs.
+    Returns:
+        float: The fitted exponent.
+    """
+    xs: list[float] = [math.log(n) for n, _ in points]
+    ys: list[float] = [math.log(max(ns, 1e-3)) for _, ns in points]
+    mean_x: float = sum(xs) / len(xs)
+    mean_y: float = sum(ys) / len(ys)
+    spread: float = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def run_benchmarks(names: list[str] | None = None, budget: float = 0.02) -> dict:
+    """
+    Run the benchmarks over their sweeps.
+
+    :param names: Benchmarks to run (all of `BENCHMARKS` if None).
+    :param budget: Seconds per timed run (see `time_call`).
+    Returns:
+        dict: "name[parameter]" -> {"param", "points": [[value, ns per call], ...],
+        "exponent"}.
+    """
+    results: dict[str, dict] = {}
+    for name in names or list(BENCHMARKS):
+        factory, params = BENCHMARKS[name]
+        for param in params:
+            points: list[tuple[int, float]] = []
+            for value in SWEEPS[param]:
+                setup: dict[str, int] = {**DEFAULTS, param: value}
+                call: Callable = factory(**setup)
+                points.append((value, round(time_call(call, budget), 1)))
+            results[f"{name}[{param}]"] = {
+                "param": param,
+                "points": [list(point) for point in points],
+                "exponent": round(growth_exponent(points), 3),
+            }
+    return results
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    max_growth: float = 0.5,
+    max_slowdown: float = 3.0,
+) -> list[str]:
+    """
+    Check results against a baseline. A benchmark regresses if its growth
+    exponent rose by more than `max_growth` (e.g. O(n) became O(n²)), or if its
+    largest case got more than `max_slowdown` times slower.
+
+    :param results: Result of `run_benchmarks`.
+    :param baseline: An earlier result of `run_benchmarks`.
+    :param max_growth: Allowed increase of the exponent.
+    :param max_slowdown: Allowed time ratio at the largest parameter value.
+    Returns:
+        list[str]: One message per regression (empty if none).
+    """
+    failures: list[str] = []
+    for key, entry in results.items():
+        base: dict | None = baseline.get(key)
+        if base is None:
+            continue  # new benchmark, nothing to compare with
+        if entry["exponent"] - base["exponent"] > max_growth:
+            failures.append(
+                f"{key}: growth exponent {base['exponent']:.2f} -> {entry['exponent']:.2f}"
+            )
+        slowdown: float = entry["points"][-1][1] / max(base["points"][-1][1], 1e-3)
+        if slowdown > max_slowdown:
+            failures.append(
+                f"{key}: {slowdown:.1f}x slower at {entry['param']}="
+                f"{entry['points'][-1][0]}"
+            )
+    return failures
+
+
+def load_baseline(path: str | Path = BASELINE_PATH) -> dict | None:
+    """
+    :param path: The baseline file.
+    Returns:
+        dict | None: The stored results, or None if there is no baseline yet.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())["results"]
+
+
+def save_baseline(results: dict, path: str | Path = BASELINE_PATH):
+    """
+    :param results: Result of `run_benchmarks`.
+    :param path: The baseline file.
+    """
+    Path(path).write_text(json.dumps({"results": results}, indent=2) + "\n")
+
+
+def menu_idle_run(seconds: float, paced: bool) -> dict:
+    """
+    Leave the main menu alone for `seconds` and measure the CPU it uses. The
+    menu shuts pygame down when it quits, so run this in a fresh process (see
+    `measure_menu_idle`).
+
+    :param seconds: How long the menu runs.
+    :param paced: False to turn frame pacing off (the old busy loop).
+    Returns:
+        dict: paced, wall seconds, CPU use in percent of one core, frames and fps.
+    """
+    from classes.FramePacer.FramePacer import MENU_PACER
+    from screens.Menu import main_menu_screen
+
+    game.init()
+    screen: game.Surface = game.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    MENU_PACER.enabled = paced
+    game.time.set_timer(game.QUIT, int(seconds * 1000), loops=1)
+    cpu: float = time.process_time()
+    wall: float = time.perf_counter()
+    try:
+        main_menu_screen(screen)
+    except SystemExit:  # the menu exits on QUIT
+        pass
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    return {
+        "paced": paced,
+        "seconds": round(wall, 3),
+        "cpu_percent": round(100 * cpu / wall, 1),
+        "frames": MENU_PACER.frames,
+        "fps": round(MENU_PACER.frames / wall, 1),
+    }
+
+
+def measure_menu_idle(seconds: float = 3.0) -> list[dict]:
+    """
+    CPU use of the idle main menu with and without frame pacing, each in a
+    fresh worker process.
+
+    :param seconds: How long each run lasts.
+    Returns:
+        list[dict]: The result of `menu_idle_run`, paced first.
+    """
+    results: list[dict] = []
+    for paced in (True, False):
+        with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+            results.append(pool.submit(menu_idle_run, seconds, paced).result())
+    return results
@@ -0,0 +1,407 @@
+import io
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterator
+import pygame as game
+from settings.settings import LEVELS, SCREEN_HEIGHT, SCREEN_WIDTH
+from classes.Main import Main
+from classes.Replay.Replay import Replay, ReplayPlayer
+from renderers.background import render_background
+
+FORMATS: tuple[str, ...] = ("png", "gif", "mp4")
+
+
+def init_worker():
+    """
+    Set up pygame in an export worker: no window or sound, but a (dummy) display
+    mode so the sprites can be converted. Frames are drawn on offscreen surfaces.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    game.init()
+    game.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def split_chunks(replay: Replay, chunks: int) -> list[tuple[int, int]]:
+    """
+    Split the timeline of a replay into about `chunks` ranges that start on
+    keyframes, so each can be simulated on its own from its first keyframe.
+
+    :param replay: The replay to split.
+    :param chunks: Wanted number of ranges (fewer if there are fewer keyframes).
+    Returns:
+        list[tuple[int, int]]: (first tick, tick after the last) of each range, in order.
+    """
+    starts: list[int] = replay.keyframe_ticks
+    per_chunk: int = max(1, -(-len(starts) // max(1, chunks)))  # keyframes per range
+    bounds: list[int] = starts[::per_chunk] + [replay.ticks + 1]
+    return list(zip(bounds, bounds[1:]))
+
+
+def range_best_score(path: str, start: int, end: int) -> int:
+    """
+    Best score reached in one range of a replay, simulated headlessly (runs in a
+    worker). The HUD shows the best score so far as the high score, but keyframes
+    do not hold it, so the ranges first report their own best, and each range then
+    starts from the best of the ranges before it (see `export_replay`).
+
+    :param path: The replay file.
+    :param start: First tick of the range (a keyframe tick).
+    :param end: Tick after the last one of the range (the score there counts too,
+        since the next range starts with it).
+    Returns:
+        int: The best score at any tick from `start` to `end`.
+    """
+    replay: Replay = Replay.load(path)
+    main: Main = Main(None, None, None, replay.level, headless=True, seed=replay.seed)
+    player: ReplayPlayer = ReplayPlayer(replay, main)
+    player.seek(start)
+    best: int = main.score_HUD.score
+    while main.tick < min(end, replay.ticks):
+        player.step()
+        best = max(best, main.score_HUD.score)
+    return best
+
+
+def frame_size(scale: float) -> tuple[int, int]:
+    """
+    :param scale: Size of the frames relative to the screen.
+    Returns:
+        tuple[int, int]: Width and height of the exported frames.
+    """
+    return max(1, round(SCREEN_WIDTH * scale)), max(1, round(SCREEN_HEIGHT * scale))
+
+
+def chunk_frames(
+    replay: Replay, start: int, end: int, every: int, scale: float, high_score: int = 0
+) -> Iterator[tuple[int, game.Surface]]:
+    """
+    Re-simulate one range of a replay from its keyframe and draw its frames.
+
+    :param replay: The replay.
+    :param start: First tick of the range (a keyframe tick).
+    :param end: Tick after the last one of the range.
+    :param every: Draw one frame every `every` ticks (counted from tick 0).
+    :param scale: Size of the frames relative to the screen.
+    :param high_score: Best score reached before `start` (see `range_best_score`).
+    Returns:
+        Iterator[tuple[int, game.Surface]]: (tick, frame) in order; the frame
+        surface is reused, so use it before taking the next one.
+    """
+    main: Main = Main(
+        None, None, None, replay.level, seed=replay.seed, persist_high_score=False
+    )
+    player: ReplayPlayer = ReplayPlayer(replay, main)
+    player.seek(start)
+    main.score_HUD.high_score = max(main.score_HUD.high_score, high_score)
+
+    background: game.Surface = render_background("assets/backgrounds/game_bg.png")
+    frame: game.Surface = game.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))  # offscreen
+    size: tuple[int, int] = frame_size(scale)
+    scaled: game.Surface | None = game.Surface(size) if scale != 1 else None
+
+    for tick in range(start, end):
+        if tick > main.tick:
+            player.step()
+        if tick % every:
+            continue
+        frame.blit(background, (0, 0))
+        main.draw_elements(frame)
+        if scaled is None:
+            yield tick, frame
+        else:
+            game.transform.smoothscale(frame, size, scaled)
+            yield tick, scaled
+
+
+def render_chunk(
+    path: str,
+    start: int,
+    end: int,
+    out: str,
+    fmt: str,
+    every: int,
+    scale: float,
+    fps: float,
+    high_score: int,
+) -> tuple[int, str | None]:
+    """
+    Export one range of a replay (runs in a worker process).
+
+    :param path: The replay file.
+    :param start: First tick of the range (a keyframe tick).
+    :param end: Tick after the last one of the range.
+    :param out: png: the frame folder; gif/mp4: the range's file to write (its
+        GIF image blocks for gif, see `write_gif_frames`; a video segment for mp4).
+    :param fmt: "png", "gif" or "mp4".
+    :param every: Draw one frame every `every` ticks.
+    :param scale: Size of the frames relative to the screen.
+    :param fps: Frame rate of the gif/mp4.
+    :param high_score: Best score reached before `start`.
+    Returns:
+        tuple[int, str | None]: Number of frames, and the range's file (gif/mp4;
+        None for png, written straight to the folder, or if the range had no frame).
+    """
+    replay: Replay = Replay.load(path)
+    frames: Iterator[tuple[int, game.Surface]] = chunk_frames(
+        replay, start, end, every, scale, high_score
+    )
+    count: int = 0
+    if fmt == "png":
+        for tick, frame in frames:
+            game.image.save(frame, str(Path(out) / f"frame_{tick:07d}.png"))
+            count += 1
+        return count, None
+
+    if fmt == "gif":  # palettes, crops and encoding happen here; the parent only joins
+        with open(out, "wb") as blocks:
+            count = write_gif_frames(blocks, frames, fps)
+        return count, out if count else None
+
+    encoder: subprocess.Popen | None = None
+    for _, frame in frames:
+        if encoder is None:
+            width, height = frame.get_size()
+            encoder = subprocess.Popen(
+                [
+                    "ffmpeg", "-loglevel", "error", "-y",
+                    "-f", "rawvideo", "-pix_fmt", "rgb24",
+                    "-s", f"{width}x{height}", "-r", f"{fps:g}", "-i", "-",
+                    # yuv420p needs even sizes (the screen is 943 pixels wide)
+                    "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                    "-c:v", "libx264", "-pix_fmt", "yuv420p", out,
+                ],
+                stdin=subprocess.PIPE,
+            )
+        try:
+            encoder.stdin.write(game.image.tobytes(frame, "RGB"))
+        except BrokenPipeError:
+            break  # ffmpeg gave up, its exit status says so below
+        count += 1
+    if encoder is not None:
+        try:
+            encoder.stdin.close()
+        except BrokenPipeError:
+            pass
+        if encoder.wait():
+            raise RuntimeError(f"ffmpeg failed on ticks {start}-{end}")
+    return count, out if encoder is not None else None
+
+
+def export_replay(
+    path: str | Path,
+    out: str | Path,
+    fmt: str = "png",
+    workers: int | None = None,
+    every: int = 1,
+    scale: float = 1.0,
+    fps: float | None = None,
+) -> int:
+    """
+    Render a recorded game offline: the timeline is split at keyframes, the
+    ranges are re-simulated and drawn in a process pool, and their output is
+    stitched in order. Export time goes down with the number of workers instead
+    of being tied to the length of the game in real time.
+
+    :param path: The replay file.
+    :param out: png: folder for the frames; gif/mp4: the output file.
+    :param fmt: "png" (frame_<tick>.png sequence), "gif", or "mp4" (needs ffmpeg).
+    :param workers: Number of worker processes (one per core if None).
+    :param every: Draw one frame every `every` ticks.
+    :param scale: Size of the frames relative to the screen.
+    :param fps: Frame rate of the gif/mp4 (real-time speed of the level if None).
+    Returns:
+        int: Number of frames written.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown export format {fmt!r} (one of {', '.join(FORMATS)})")
+    if fmt == "mp4" and shutil.which("ffmpeg") is None:
+        raise RuntimeError("mp4 export needs ffmpeg on the PATH (use png or gif)")
+    path = str(path)
+    out = Path(out)
+    replay: Replay = Replay.load(path)
+    workers = workers or os.cpu_count() or 1
+    if fps is None:
+        fps = 1000 / LEVELS[replay.level]["move_interval"] / every
+    # a few ranges per worker, so one slow range does not leave the others idle
+    chunks: list[tuple[int, int]] = split_chunks(replay, workers * 4)
+
+    if fmt == "png":
+        out.mkdir(parents=True, exist_ok=True)
+    else:
+        out.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as segments, ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker
+    ) as pool:
+        # the best score of each range, simulated headlessly in parallel, so each
+        # range starts with the high score the HUD showed at its first tick
+        bests: list[int] = [
+            future.result()
+            for future in [
+                pool.submit(range_best_score, path, start, end) for start, end in chunks
+            ]
+        ]
+        highs: list[int] = list(accumulate(bests[:-1], max, initial=0))
+        futures = [
+            pool.submit(
+                render_chunk,
+                path,
+                start,
+                end,
+                str(out) if fmt == "png" else str(Path(segments) / f"{k:05d}.{fmt}"),
+                fmt,
+                every,
+                scale,
+                fps,
+                high,
+            )
+            for k, ((start, end), high) in enumerate(zip(chunks, highs))
+        ]
+        results: list[tuple[int, str | None]] = [
+            future.result() for future in futures  # in timeline order
+        ]
+        if fmt == "gif":
+            write_gif(out, [file for _, file in results if file], frame_size(scale))
+        elif fmt == "mp4":
+            concat_mp4(out, [file for _, file in results if file], segments)
+    return sum(count for count, _ in results)
+
+
+def write_gif_frames(
+    file, frames: Iterator[tuple[int, game.Surface]], fps: float
+) -> int:
+    """
+    Encode frames as GIF image blocks (without the header and trailer, see
+    `write_gif`), holding only the current and previous frame in memory. Each frame
+    is the area that changed since the previous one, with its own palette; a frame
+    that changed nothing lengthens the previous one instead (which is why frames are
+    written one behind). The first frame is whole: the range starts on its own.
+
+    :param file: Binary file to write the blocks to.
+    :param frames: (tick, frame) in order, e.g. from `chunk_frames`.
+    :param fps: Frame rate of the gif.
+    Returns:
+        int: Number of frames taken (unchanged ones included).
+    """
+    from PIL import Image, ImageChops
+
+    duration: int = round(1000 / fps)
+    previous: Image.Image | None = None
+    pending: list | None = None  # [image, offset, duration] not written yet
+    count: int = 0
+    for _, surface in frames:
+        frame: Image.Image = Image.frombytes(
+            "RGB", surface.get_size(), game.image.tobytes(surface, "RGB")
+        )
+        count += 1
+        box: tuple[int, int, int, int] | None = (
+            (0, 0, *frame.size)
+            if previous is None
+            else ImageChops.difference(frame, previous).getbbox()
+        )
+        previous = frame
+        if box is None:
+            pending[2] += duration
+            continue
+        if pending is not None:
+            file.write(gif_image(*pending))
+        pending = [frame.crop(box), box[:2], duration]
+    if pending is not None:
+        file.write(gif_image(*pending))
+    return count
+
+
+def gif_image(image, offset: tuple[int, int], duration: int) -> bytes:
+    """
+    One gif frame as blocks that can follow any other frame: its graphic control
+    extension and its image, placed at `offset`, with a local palette. Pillow
+    encodes it as a one-frame gif, with the palette as the file's global table;
+    the blocks are taken out of that file and given the table as their own.
+
+    :param image: The frame (an RGB PIL image).
+    :param offset: Position of the frame on the gif's screen.
+    :param duration: How long the frame shows, in milliseconds.
+    Returns:
+        bytes: The frame's blocks.
+    """
+    from PIL import Image
+
+    buffer: io.BytesIO = io.BytesIO()
+    image.convert("P", palette=Image.Palette.ADAPTIVE).save(
+        buffer,
+        "GIF",
+        duration=duration,
+        disposal=1,  # keep the frame, the next one draws over it
+    )
+    data: bytes = buffer.getvalue()
+    flags: int = data[10]  # of the logical screen descriptor, after "GIF89a"
+    table: bytes = b""
+    position: int = 13
+    if flags & 0x80:
+        table = data[position : position + (3 << ((flags & 0x07) + 1))]
+        position += len(table)
+
+    def skip_sub_blocks(i: int) -> int:
+        while data[i]:  # each sub-block starts with its length; 0 ends them
+            i += data[i] + 1
+        return i + 1
+
+    blocks: bytearray = bytearray()
+    while data[position] != 0x3B:  # trailer
+        if data[position] == 0x21:  # extension: introducer, label, sub-blocks
+            end: int = skip_sub_blocks(position + 2)
+            blocks += data[position:end]
+        else:  # image descriptor, then the LZW code size and the image sub-blocks
+            descriptor: bytearray = bytearray(data[position : position + 10])
+            struct.pack_into("<HH", descriptor, 1, *offset)
+            if table and not descriptor[9] & 0x80:
+                descriptor[9] |= 0x80 | (flags & 0x07)  # local table, same size
+                descriptor += table
+            end: int = skip_sub_blocks(position + 11)
+            blocks += descriptor + data[position + 10 : end]
+        position = end
+    return bytes(blocks)
+
+
+def write_gif(out: Path, chunks: list[str], size: tuple[int, int]):
+    """
+    Stitch the GIF image blocks of every range, in order, into one looping gif
+    (only copies: the workers already encoded every frame).
+
+    :param out: The gif file.
+    :param chunks: Image block files of each range, in timeline order.
+    :param size: Width and height of the frames.
+    """
+    with open(out, "wb") as gif:
+        # logical screen without a global palette (every frame has its own)
+        gif.write(b"GIF89a" + struct.pack("<HHBBB", *size, 0, 0, 0))
+        gif.write(b"!\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")  # loop forever
+        for chunk in chunks:
+            with open(chunk, "rb") as blocks:
+                shutil.copyfileobj(blocks, gif)
+        gif.write(b";")  # trailer
+
+
+def concat_mp4(out: Path, segments: list[str], folder: str):
+    """
+    Join the video segments of every range, in order, without re-encoding.
+
+    :param out: The mp4 file.
+    :param segments: Segment files in timeline order.
+    :param folder: Scratch folder for the segment list.
+    """
+    listing: Path = Path(folder) / "segments.txt"
+    listing.write_text("".join(f"file '{segment}'\n" for segment in segments))
+    subprocess.run(
+        [
+            "ffmpeg", "-loglevel", "error", "-y",
+            "-f", "concat", "-safe", "0", "-i", str(listing), "-c", "copy", str(out),
+        ],
+        check=True,
+    )
@@ -0,0 +1,107 @@
+import time
+from pygame import Vector2
+from classes.Main import Main
+
+
+def place_snake(main: Main, length: int):
+    """
+    Replace the snake with one of `length` segments laid out row by row
+    (boustrophedon), then re-place the items around it.
+
+    :param main: The game to modify.
+    :param length: Number of segments (at most the board size).
+    """
+    board = main.board
+    width: int = board.width
+    path: list[tuple[int, int]] = [
+        (x if y % 2 == 0 else width - 1 - x, y)
+        for y in range(board.height)
+        for x in range(width)
+    ][:length]
+
+    for x, y in main.snake.body.cells():
+        board.remove_snake(x, y)
+    main.snake.body.clear()
+    for x, y in path:  # each push becomes the head, so the last cell leads
+        main.snake.body.push_head(x, y)
+        board.add_snake(x, y)
+    (hx, hy), (nx, ny) = path[-1], path[-2]
+    main.snake.direction = Vector2(hx - nx, hy - ny)
+
+    main.poisons.clear()
+    main.apple.randomize_position()
+    if main.has_poisons:
+        main.poisons.respawn(main.level, apples_eaten=main.score_HUD.score)
+
+
+def make_game(level: str, length: int, seed: int = 0) -> Main:
+    """
+    A headless game with a snake of `length` segments (and, on hard, a few
+    obstacle rows already on the board).
+
+    :param level: The difficulty level ('easy', 'medium', 'hard').
+    :param length: Number of snake segments.
+    :param seed: Seed of the game.
+    Returns:
+        Main: The game.
+    """
+    main: Main = Main(None, None, None, level, headless=True, seed=seed)
+    if main.obstacles is not None:
+        for _ in range(600):  # let a few rows spawn and fall
+            main.update_obstacles()
+    place_snake(main, length)
+    return main
+
+
+def check_fork(level: str, length: int, ticks: int = 300):
+    """
+    Assert that restoring a snapshot and replaying the same turns gives the same
+    game again (so search bots can trust their forks).
+
+    :param level: The difficulty level to check.
+    :param length: Number of snake segments at the fork.
+    :param ticks: Ticks played on each branch.
+    """
+    from classes.Replay.Replay import pack_state
+
+    main: Main = make_game(level, length)
+    fork: tuple = main.snapshot()
+    before: bytes = pack_state(main)
+
+    def play() -> bytes:
+        for tick in range(ticks):
+            if tick % 7 == 0:
+                direction: Vector2 = main.snake.direction
+                main.change_direction(Vector2(direction.y, direction.x))
+            main.update_game()
+        return pack_state(main)
+
+    first: bytes = play()
+    main.restore(fork)
+    assert pack_state(main) == before, f"restore differs ({level} length {length})"
+    assert play() == first, f"forked game diverged ({level} length {length})"
+
+
+def bench_forks(level: str, length: int, repeat: int = 20_000) -> tuple[float, float]:
+    """
+    Time `Main.snapshot` and `Main.restore` on a game with a snake of `length`.
+
+    :param level: The difficulty level ('easy', 'medium', 'hard').
+    :param length: Number of snake segments.
+    :param repeat: Number of snapshots (and restores) to time.
+    Returns:
+        tuple[float, float]: Snapshots per second and restores per second.
+    """
+    main: Main = make_game(level, length)
+
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        fork: tuple = main.snapshot()
+    snapshot_time: float = time.perf_counter() - start
+
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        main.restore(fork)
+    restore_time: float = time.perf_counter() - start
+
+    return repeat / snapshot_time, repeat / restore_time
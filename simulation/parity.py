@@ -0,0 +1,210 @@
+import random
+import numpy as np
+from pygame import Vector2
+from classes.Board.Board import Board
+from classes.Main import Main
+from simulation.agents import greedy_agent
+from classes.BatchGame.BatchGame import (
+    BatchGame,
+    NOOP,
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+    PLAYING,
+    GAME_OVER,
+    WIN,
+)
+
+OUTCOMES: dict[str | None, int] = {None: PLAYING, "game_over": GAME_OVER, "win": WIN}
+DIRECTIONS: dict[int, tuple[int, int]] = {
+    UP: (0, -1),
+    DOWN: (0, 1),
+    LEFT: (-1, 0),
+    RIGHT: (1, 0),
+}
+ACTIONS: dict[tuple[int, int], int] = {
+    vector: action for action, vector in DIRECTIONS.items()
+}
+
+
+def policy_action(main: Main, rng: random.Random) -> int:
+    """
+    The greedy agent's move as a batch action, with some noise (exercises growth,
+    poisons, obstacles and every kind of game over).
+
+    :param main: The scalar game to steer.
+    :param rng: Random source of the agent and the noise.
+    Returns:
+        int: One of NOOP/UP/DOWN/LEFT/RIGHT.
+    """
+    direction: Vector2 | None = greedy_agent(main, rng)
+    if direction is None or rng.random() < 0.02:
+        return NOOP
+    return ACTIONS[(int(direction.x), int(direction.y))]
+
+
+def steer(main: Main, action: int):
+    """
+    Apply a batch action to a scalar game (reversals are ignored by both engines).
+
+    :param main: The scalar game to steer.
+    :param action: One of NOOP/UP/DOWN/LEFT/RIGHT.
+    """
+    if action != NOOP:
+        main.change_direction(Vector2(DIRECTIONS[action]))
+
+
+def compare(batch: BatchGame, index: int, main: Main, outcome: int, tick: int):
+    """
+    Assert that one batch slot holds the same deterministic state as a scalar game.
+
+    :param batch: The batch engine.
+    :param index: Slot of the batch to compare.
+    :param main: The scalar game it mirrors.
+    :param outcome: Outcome reported by the batch for this slot.
+    :param tick: Current tick (for the error message).
+    """
+    where: str = f"{batch.level} game {index} tick {tick}"
+    length: int = int(batch.length[index])
+    slots: np.ndarray = (batch.start[index] + np.arange(length)) % batch.capacity
+    cells: list[tuple[int, int]] = list(
+        zip(batch.body_x[index, slots].tolist(), batch.body_y[index, slots].tolist())
+    )
+    assert cells == list(main.snake.body.cells()), f"snake body differs ({where})"
+    assert tuple(batch.direction[index]) == (
+        int(main.snake.direction.x),
+        int(main.snake.direction.y),
+    ), f"direction differs ({where})"
+    assert batch.new_block[index] == main.snake.new_block, f"growth differs ({where})"
+    assert bytes(batch.snake_grid[index]) == bytes(main.board.snake), (
+        f"snake grid differs ({where})"
+    )
+    assert outcome == OUTCOMES[main.outcome], f"outcome differs ({where})"
+    assert batch.score[index] == main.score_HUD.score, f"score differs ({where})"
+    assert batch.snake_speed[index] == main.snake_speed, f"speed differs ({where})"
+    assert batch.obstacle_spawn_interval[index] == main.obstacle_spawn_interval, (
+        f"spawn interval differs ({where})"
+    )
+    assert batch.obstacle_timer[index] == main._obstacle_spawn_timer, (
+        f"spawn timer differs ({where})"
+    )
+    assert batch.obstacle_speed[index] == main.obstacle_speed, (
+        f"obstacle speed differs ({where})"
+    )
+
+    batch_obstacles: set[tuple[int, float]] = {
+        (int(x), float(batch.row_y[index, row]))
+        for row in np.flatnonzero(batch.row_active[index])
+        for x in np.flatnonzero(batch.row_mask[index, row])
+    }
+    main_obstacles: set[tuple[int, float]] = {
+        (obstacle.x + dx, obstacle.y)
+        for obstacle in main.obstacles or []
+        for dx in range(obstacle.width)
+    }
+    assert batch_obstacles == main_obstacles, f"obstacles differ ({where})"
+
+
+def check_spawns(batch: BatchGame, respawned: np.ndarray, tick: int):
+    """
+    Assert that the items the batch placed with its own RNG follow the spawn rules
+    (`sync_random_state` overwrites them with the scalar game's right after, so this
+    is the only check of the batch's apple and poison placement).
+
+    Items spawn on cells with neither snake nor another item, like
+    `Board.random_free_cell`; obstacles do not block a spawn in either engine
+    (they only ever pass over items). In the games that respawned their poisons
+    this tick, the poison count must be in the level's range: at most the largest
+    respawn, and at least the smallest one (or the whole free board).
+
+    :param batch: The batch engine, right after `step`.
+    :param respawned: Per game, True if an apple was eaten or the round restarted.
+    :param tick: Current tick (for the error message).
+    """
+    games: np.ndarray = batch.games
+    where: str = f"{batch.level} tick {tick}"
+    items: np.ndarray = batch.item_grid
+    stacked: np.ndarray = np.flatnonzero(
+        np.any((items > 0) & (batch.snake_grid > 0), axis=1)
+    )
+    assert not len(stacked), f"item under the snake ({where}, games {stacked})"
+
+    has_apple: np.ndarray = batch.apple >= 0
+    apples: np.ndarray = np.count_nonzero(items == Board.APPLE, axis=1)
+    assert np.array_equal(apples, has_apple.astype(apples.dtype)), (
+        f"apple count differs from the apple cell ({where})"
+    )
+    placed: np.ndarray = items[games[has_apple], batch.apple[has_apple]]
+    assert np.all(placed == Board.APPLE), f"apple cell holds no apple ({where})"
+
+    poisons: np.ndarray = np.count_nonzero(items == Board.POISON, axis=1)
+    if batch.level == "easy":
+        low, high = np.zeros_like(poisons), np.zeros_like(poisons)
+    elif batch.level == "medium":  # PoisonField.respawn: 3..5 plus the apples eaten
+        low, high = 3 + batch.score, 5 + batch.score
+    else:  # hard
+        low, high = np.full_like(poisons, 3), np.full_like(poisons, 8)
+    over: np.ndarray = respawned & (poisons > high)
+    assert not over.any(), f"too many poisons ({where}, games {np.flatnonzero(over)})"
+    free: np.ndarray = batch._free_mask(games).sum(axis=1)
+    short: np.ndarray = respawned & (poisons < low) & (free > 0)
+    assert not short.any(), f"too few poisons ({where}, games {np.flatnonzero(short)})"
+
+
+def sync_random_state(batch: BatchGame, index: int, main: Main):
+    """
+    Copy the RNG-driven parts of a scalar game (apple, poisons, row size) into a slot,
+    since the two engines draw their random numbers differently.
+
+    :param batch: The batch engine.
+    :param index: Slot of the batch to overwrite.
+    :param main: The scalar game to copy from.
+    """
+    if batch.obstacles_count[index] != main.obstacles_count:
+        # re-rolled this tick by an apple: a row spawned in the same tick used it
+        fresh: np.ndarray = batch.row_active[index] & (batch.row_y[index] == -2)
+        batch.row_mask[index, fresh] = batch.row_layouts[main.obstacles_count]
+    batch.item_grid[index] = np.frombuffer(main.board.items, dtype=np.uint8)
+    pos: Vector2 | None = main.apple.pos
+    batch.apple[index] = -1 if pos is None else int(pos.y) * batch.width + int(pos.x)
+    batch.obstacles_count[index] = main.obstacles_count
+
+
+def check_parity(level: str, games: int = 16, ticks: int = 3000, seed: int = 0) -> int:
+    """
+    Step scalar `Main` games and a `BatchGame` side by side with the same actions and
+    assert after every tick that they agree on everything not drawn from an RNG.
+
+    :param level: The difficulty level to check.
+    :param games: Number of games to run.
+    :param ticks: Number of ticks to run.
+    :param seed: Seed of the scalar games, the batch and the action policy.
+    Returns:
+        int: Number of finished rounds seen (to show the check covered resets).
+    """
+    mains: list[Main] = [
+        Main(None, None, None, level, headless=True, seed=seed + index)
+        for index in range(games)
+    ]
+    batch: BatchGame = BatchGame(level, games, seed=seed)
+    for index, main in enumerate(mains):
+        batch.load_game(index, main)
+    policy: random.Random = random.Random(seed + 1)
+
+    rounds: int = 0
+    for tick in range(ticks):
+        actions: list[int] = [policy_action(main, policy) for main in mains]
+        for main, action in zip(mains, actions):
+            steer(main, action)
+            main.outcome = None
+            main.update_game()
+        scores: np.ndarray = batch.score.copy()
+        outcomes: np.ndarray = batch.step(actions)
+        check_spawns(batch, (outcomes != PLAYING) | (batch.score > scores), tick)
+
+        for index, main in enumerate(mains):
+            sync_random_state(batch, index, main)
+            compare(batch, index, main, int(outcomes[index]), tick)
+        rounds += int(np.count_nonzero(outcomes))
+    return rounds
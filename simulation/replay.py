@@ -0,0 +1,145 @@
+import hashlib
+import random
+import struct
+from typing import Callable, Iterable
+from pygame import Vector2
+from classes.Main import Main
+from classes.Replay.Replay import Replay, ReplayPlayer, pack_state
+
+TURNS: tuple[Vector2, ...] = (Vector2(0, -1), Vector2(0, 1), Vector2(-1, 0), Vector2(1, 0))
+
+
+def state_digest(main: Main) -> bytes:
+    """
+    Hash everything a game tick can change, including the RNG state, so two games
+    can be compared bit for bit.
+
+    :param main: The game to hash.
+    Returns:
+        bytes: SHA-1 digest of the logical game state.
+    """
+    h = hashlib.sha1()
+    body = main.snake.body
+    h.update(struct.pack("<2i", len(body), main.snake.new_block))
+    for x, y in body.cells():
+        h.update(struct.pack("<2i", x, y))
+    h.update(struct.pack("<2d", main.snake.direction.x, main.snake.direction.y))
+    h.update(bytes(main.board.items))
+    h.update(bytes(main.board.obstacles))
+    for obstacle in main.obstacles or []:
+        h.update(
+            struct.pack("<3id", obstacle.x, obstacle.width, obstacle.height, obstacle.y)
+        )
+    h.update(
+        struct.pack(
+            "<i5d2i",
+            main.score_HUD.score,
+            main.snake_speed,
+            main.obstacle_spawn_interval,
+            main.obstacle_speed,
+            main._obstacle_spawn_timer,
+            main.obstacles_count,
+            main.tick,
+            len(main.inputs),
+        )
+    )
+    h.update(repr(main.rng.getstate()).encode())
+    h.update(repr((main.outcome, main.death_cause, main.round_score)).encode())
+    return h.digest()
+
+
+def replay_game(
+    level: str,
+    seed: int,
+    inputs: Iterable[tuple[int, int, int]],
+    ticks: int,
+    on_tick: Callable[[Main], None] | None = None,
+) -> Main:
+    """
+    Re-run a recorded session headlessly from its seed and input log.
+
+    :param level: The difficulty level the session was played on.
+    :param seed: `Main.seed` of the recorded session.
+    :param inputs: `Main.inputs` of the recorded session, (tick, dx, dy) in order.
+    :param ticks: Number of ticks to run.
+    :param on_tick: Optional callback run after every tick.
+    Returns:
+        Main: The game after `ticks` ticks.
+    """
+    main: Main = Main(None, None, None, level, headless=True, seed=seed)
+    pending = iter(inputs)
+    turn: tuple[int, int, int] | None = next(pending, None)
+    for _ in range(ticks):
+        while turn is not None and turn[0] == main.tick:
+            main.change_direction(Vector2(turn[1], turn[2]))
+            turn = next(pending, None)
+        main.update_game()
+        if on_tick is not None:
+            on_tick(main)
+    return main
+
+
+def check_replay(level: str, seed: int = 0, ticks: int = 5000) -> int:
+    """
+    Play a session with random turns, replay it from its seed and input log and
+    assert the two games match bit for bit after every tick.
+
+    :param level: The difficulty level to check.
+    :param seed: Seed of the recorded session and of its turns.
+    :param ticks: Number of ticks to run.
+    Returns:
+        int: Number of recorded inputs that were replayed.
+    """
+    main: Main = Main(None, None, None, level, headless=True, seed=seed)
+    policy: random.Random = random.Random(seed + 1)
+    digests: list[bytes] = []
+    for _ in range(ticks):
+        for _ in range(policy.choice((0, 0, 0, 1, 2))):  # several keys per tick too
+            main.change_direction(policy.choice(TURNS))
+        main.update_game()
+        digests.append(state_digest(main))
+
+    def verify(replayed: Main):
+        assert state_digest(replayed) == digests[replayed.tick - 1], (
+            f"replay diverged ({level} seed {seed} tick {replayed.tick})"
+        )
+
+    replay_game(level, main.seed, main.inputs, ticks, on_tick=verify)
+    return len(main.inputs)
+
+
+def check_replay_file(level: str, seed: int = 0, ticks: int = 5000) -> int:
+    """
+    Record a session with random turns into a replay file, read it back and check
+    that seeking to random ticks (backwards and forwards) lands on the same state
+    as playing straight through.
+
+    :param level: The difficulty level to check.
+    :param seed: Seed of the recorded session and of its turns.
+    :param ticks: Number of ticks to record.
+    Returns:
+        int: Size of the replay file in bytes.
+    """
+    main: Main = Main(None, None, None, level, headless=True, seed=seed)
+    policy: random.Random = random.Random(seed + 1)
+    targets: list[int] = [policy.randrange(ticks + 1) for _ in range(50)] + [ticks, 0]
+    states: dict[int, bytes] = {0: pack_state(main)}
+    for _ in range(ticks):
+        if policy.random() < 0.2:
+            main.change_direction(policy.choice(TURNS))
+        main.update_game()
+        if main.tick in targets:
+            states[main.tick] = pack_state(main)
+
+    data: bytes = Replay.record(
+        level, main.seed, main.inputs, main.tick, zoom=main.zoom
+    ).to_bytes()
+    player: ReplayPlayer = ReplayPlayer(
+        Replay.from_bytes(data), Main(None, None, None, level, headless=True)
+    )
+    for tick in targets:  # in random order, so seeks go both ways
+        player.seek(tick)
+        assert pack_state(player.main) == states[tick], (
+            f"seek diverged ({level} seed {seed} tick {tick})"
+        )
+    return len(data)
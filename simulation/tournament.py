@@ -0,0 +1,118 @@
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator
+from classes.Main import Main
+from simulation.agents import AGENTS, agent_stats
+
+
+def play_game(agent: str, level: str, seed: int, max_ticks: int = 100_000) -> dict:
+    """
+    Play one headless game until its first game over (or win, or `max_ticks`).
+
+    :param agent: Name of the agent in `AGENTS`.
+    :param level: The difficulty level ('easy', 'medium', 'hard').
+    :param seed: Seed of the game and of the agent.
+    :param max_ticks: Ticks after which the game is stopped ("timeout").
+    Returns:
+        dict: agent, level, seed, score, ticks survived and cause of the end.
+    """
+    policy = AGENTS[agent]
+    rng: random.Random = random.Random(seed)
+    main: Main = Main(None, None, None, level, headless=True, seed=seed)
+
+    ticks: int = 0
+    while main.outcome is None and ticks < max_ticks:
+        direction = policy(main, rng)
+        if direction is not None:
+            main.change_direction(direction)
+        main.update_game()
+        ticks += 1
+
+    if main.outcome is None:
+        score: int = main.score_HUD.score
+        cause: str = "timeout"
+    else:
+        score: int = main.round_score
+        cause: str = main.death_cause or main.outcome  # "win" has no death cause
+
+    result: dict = {
+        "agent": agent,
+        "level": level,
+        "seed": seed,
+        "score": score,
+        "ticks": ticks,
+        "cause": cause,
+    }
+    stats: dict = agent_stats(main)
+    if stats:
+        result["decision_us"] = stats["mean_us"]
+        result["decision_max_us"] = stats["max_us"]
+        result["field_rebuilds"] = stats["rebuilds"]  # one per apple
+        result["field_repairs"] = stats["repairs"]
+    return result
+
+
+def run_tournament(
+    agents: list[str],
+    levels: list[str],
+    seeds: list[int],
+    workers: int | None = None,
+    max_ticks: int = 100_000,
+) -> Iterator[dict]:
+    """
+    Play every (agent, level, seed) game across a process pool.
+
+    :param agents: Names of the agents to compare.
+    :param levels: Levels to play.
+    :param seeds: Seeds to play on each level (shared by all agents).
+    :param workers: Number of worker processes (one per core if None).
+    :param max_ticks: Tick limit per game.
+    Returns:
+        Iterator[dict]: Results of `play_game`, yielded as each game finishes.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(play_game, agent, level, seed, max_ticks)
+            for agent in agents
+            for level in levels
+            for seed in seeds
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def summarize(results: list[dict]) -> dict[tuple[str, str], dict]:
+    """
+    Aggregate game results into per-agent, per-level statistics.
+
+    :param results: Results of `play_game`.
+    Returns:
+        dict[tuple[str, str], dict]: (agent, level) -> games, mean/max score,
+        mean ticks, how many games ended by each cause and, for planning agents,
+        mean/max decision time.
+    """
+    stats: dict[tuple[str, str], dict] = {}
+    for result in results:
+        entry: dict = stats.setdefault(
+            (result["agent"], result["level"]),
+            {"games": 0, "total_score": 0, "max_score": 0, "total_ticks": 0, "causes": {}},
+        )
+        entry["games"] += 1
+        entry["total_score"] += result["score"]
+        entry["max_score"] = max(entry["max_score"], result["score"])
+        entry["total_ticks"] += result["ticks"]
+        entry["causes"][result["cause"]] = entry["causes"].get(result["cause"], 0) + 1
+        if "decision_us" in result:  # planning agents report their decision cost
+            entry["total_decision_us"] = (
+                entry.get("total_decision_us", 0.0) + result["decision_us"]
+            )
+            entry["max_decision_us"] = max(
+                entry.get("max_decision_us", 0.0), result["decision_max_us"]
+            )
+
+    for entry in stats.values():
+        entry["mean_score"] = entry.pop("total_score") / entry["games"]
+        entry["mean_ticks"] = entry.pop("total_ticks") / entry["games"]
+        if "total_decision_us" in entry:
+            entry["mean_decision_us"] = entry.pop("total_decision_us") / entry["games"]
+    return stats
@@ -0,0 +1,127 @@
+import random
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import pytest
+from pygame import Vector2
+from classes.Main import Main
+from classes.Replay.Replay import Replay
+import simulation.export as export
+from simulation.export import export_replay
+
+TURNS: tuple[Vector2, ...] = (
+    Vector2(0, -1),
+    Vector2(0, 1),
+    Vector2(-1, 0),
+    Vector2(1, 0),
+)
+
+
+@pytest.fixture
+def replay_path(tmp_path: Path) -> Path:
+    """
+    A short hard game with random turns, saved as a replay (a few keyframes long).
+    """
+    main: Main = Main(None, None, None, "hard", headless=True, seed=3)
+    turns: random.Random = random.Random(4)
+    for _ in range(600):
+        if turns.random() < 0.2:
+            main.change_direction(turns.choice(TURNS))
+        main.update_game()
+    path: Path = tmp_path / "game.grpl"
+    Replay.record(
+        main.level, main.seed, main.inputs, main.tick, keyframe_interval=64
+    ).save(path)
+    return path
+
+
+def test_gif_export(replay_path: Path, tmp_path: Path):
+    from PIL import Image
+
+    out: Path = tmp_path / "game.gif"
+    frames: int = export_replay(
+        replay_path, out, "gif", workers=2, every=10, scale=0.25
+    )
+    assert frames == 61
+    with Image.open(out) as gif:
+        assert gif.size == (236, 150)
+        assert 1 < gif.n_frames <= frames  # unchanged frames only lengthen the previous
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="mp4 export needs ffmpeg")
+def test_mp4_export(replay_path: Path, tmp_path: Path):
+    out: Path = tmp_path / "game.mp4"
+    frames: int = export_replay(
+        replay_path, out, "mp4", workers=2, every=10, scale=0.25
+    )
+    assert frames == 61
+    assert out.stat().st_size > 0
+
+
+class FakeEncoder:
+    """
+    Stands in for an ffmpeg process: keeps its command line and counts the bytes
+    piped to it.
+    """
+
+    def __init__(self, command: list[str], stdin=None):
+        self.command: list[str] = command
+        self.stdin: FakeEncoder = self
+        self.written: int = 0
+
+    def write(self, data: bytes):
+        self.written += len(data)
+
+    def close(self):
+        pass
+
+    def wait(self) -> int:
+        return 0
+
+
+def test_mp4_commands(replay_path: Path, tmp_path: Path, monkeypatch):
+    """
+    The ffmpeg command lines of an mp4 export and the segment list they are joined
+    from, with ffmpeg mocked out (ranges run in threads so the mocks apply).
+    """
+    encoders: list[FakeEncoder] = []
+    joins: list[tuple[list[str], list[str]]] = []  # (command, lines of the list)
+
+    def popen(command: list[str], stdin=None) -> FakeEncoder:
+        encoders.append(FakeEncoder(command, stdin))
+        return encoders[-1]
+
+    def run(command: list[str], check: bool = False):
+        listing: str = command[command.index("-i") + 1]
+        joins.append((command, Path(listing).read_text().splitlines()))
+
+    monkeypatch.setattr(export.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(export.subprocess, "Popen", popen)
+    monkeypatch.setattr(export.subprocess, "run", run)
+    monkeypatch.setattr(export, "ProcessPoolExecutor", ThreadPoolExecutor)
+
+    out: Path = tmp_path / "game.mp4"
+    frames: int = export_replay(
+        replay_path, out, "mp4", workers=2, every=10, scale=0.25, fps=5
+    )
+    assert frames == 61
+    assert len(encoders) == len(export.split_chunks(Replay.load(replay_path), 8))
+    encoders.sort(key=lambda encoder: encoder.command[-1])  # ranges run concurrently
+    segments: list[str] = []
+    for k, encoder in enumerate(encoders):
+        command: list[str] = encoder.command
+        assert command[:4] == ["ffmpeg", "-loglevel", "error", "-y"]
+        assert command[command.index("-s") + 1] == "236x150"
+        assert command[command.index("-r") + 1] == "5"
+        assert command[command.index("-vf") + 1] == "pad=ceil(iw/2)*2:ceil(ih/2)*2"
+        assert command[-1].endswith(f"{k:05d}.mp4")  # one segment per range, in order
+        segments.append(command[-1])
+    assert sum(encoder.written for encoder in encoders) == frames * 236 * 150 * 3
+
+    [(command, lines)] = joins  # one join, without re-encoding
+    listing: str = command[command.index("-i") + 1]
+    assert command == [
+        "ffmpeg", "-loglevel", "error", "-y",
+        "-f", "concat", "-safe", "0", "-i", listing, "-c", "copy", str(out),
+    ]
+    assert lines == [f"file '{segment}'" for segment in segments]
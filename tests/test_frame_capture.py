@@ -0,0 +1,72 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # runs on a headless server
+
+from pathlib import Path
+import numpy as np
+import pygame as game
+import pytest
+from settings.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from classes.FrameCapture.FrameCapture import FrameCapture, FrameWriter, GRAY_WEIGHTS
+
+
+@pytest.fixture
+def screen() -> game.Surface:
+    """
+    The display of the SDL dummy driver, filled with random pixels.
+    """
+    game.display.init()
+    surface: game.Surface = game.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    noise: np.random.Generator = np.random.default_rng(0)
+    game.surfarray.blit_array(
+        surface, noise.integers(0, 256, (SCREEN_WIDTH, SCREEN_HEIGHT, 3), np.uint8)
+    )
+    yield surface
+    game.display.quit()
+
+
+def test_frame_is_a_view_of_the_screen(screen: game.Surface):
+    capture: FrameCapture = FrameCapture(screen, lambda frame, tick: None)
+    frame: np.ndarray = capture.frame()
+    expected: np.ndarray = game.surfarray.array3d(screen).transpose(1, 0, 2)
+    assert frame.shape == (SCREEN_HEIGHT, SCREEN_WIDTH, 3)
+    assert np.array_equal(frame, expected)
+    assert not frame.flags.owndata  # the surface's own pixels, not a copy
+
+
+def test_downsampled_luma(screen: game.Surface):
+    frames: list[tuple[np.ndarray, int]] = []
+    capture: FrameCapture = FrameCapture(
+        screen, lambda frame, tick: frames.append((frame.copy(), tick)), 2, True
+    )
+    capture.capture(7)
+    capture.capture(8)  # the reused buffers give the same result again
+
+    rgb: np.ndarray = game.surfarray.array3d(screen).transpose(1, 0, 2)[::2, ::2]
+    expected: np.ndarray = (rgb.astype(np.uint32) @ GRAY_WEIGHTS >> 8).astype(np.uint8)
+    assert [tick for _, tick in frames] == [7, 8]
+    for frame, _ in frames:
+        assert frame.shape == ((SCREEN_HEIGHT + 1) // 2, (SCREEN_WIDTH + 1) // 2)
+        assert np.array_equal(frame, expected)
+    screen.fill((0, 0, 0))  # the capture released the surface
+
+
+def test_frame_writer(screen: game.Surface, tmp_path: Path):
+    path: Path = tmp_path / "frames.npy"
+    writer: FrameWriter = FrameWriter(path)
+    capture: FrameCapture = FrameCapture(screen, writer, scale=4)
+    capture.capture(1)
+    screen.fill((255, 0, 0))
+    capture.capture(2)
+    writer.close()
+
+    with path.open("rb") as file:
+        first: np.ndarray = np.load(file)
+        second: np.ndarray = np.load(file)
+    assert (
+        first.shape
+        == second.shape
+        == ((SCREEN_HEIGHT + 3) // 4, (SCREEN_WIDTH + 3) // 4, 3)
+    )
+    assert np.all(second == (255, 0, 0))
+    assert (tmp_path / "frames.npy.ticks").read_text().split() == ["1", "2"]
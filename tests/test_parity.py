@@ -0,0 +1,13 @@
+import pytest
+from settings.settings import LEVELS
+from simulation.parity import check_parity
+
+
+@pytest.mark.parametrize("level", list(LEVELS))
+def test_batch_game_follows_main(level: str):
+    """
+    BatchGame and scalar Main games agree tick by tick, and the batch's own item
+    spawns are valid (see `simulation/parity.py`).
+    """
+    rounds: int = check_parity(level, games=8, ticks=400, seed=0)
+    assert rounds > 0  # the run covered at least one round restart
@@ -0,0 +1,56 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import time
+from settings.settings import LEVELS
+from simulation.agents import AGENTS
+from simulation.tournament import run_tournament, summarize
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Play seeded headless games per agent and level across all cores."
+    )
+    parser.add_argument("--agents", nargs="+", choices=list(AGENTS), default=list(AGENTS))
+    parser.add_argument("--levels", nargs="+", choices=list(LEVELS), default=list(LEVELS))
+    parser.add_argument("--games", type=int, default=100, help="seeds per agent and level")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-ticks", type=int, default=100_000)
+    parser.add_argument(
+        "--jsonl", action="store_true", help="print every game result as a JSON line"
+    )
+    args = parser.parse_args()
+
+    seeds: list[int] = list(range(args.first_seed, args.first_seed + args.games))
+    results: list[dict] = []
+    start: float = time.perf_counter()
+    for result in run_tournament(
+        args.agents, args.levels, seeds, args.workers, args.max_ticks
+    ):
+        results.append(result)
+        if args.jsonl:
+            print(json.dumps(result), flush=True)
+    elapsed: float = time.perf_counter() - start
+
+    total_ticks: int = sum(result["ticks"] for result in results)
+    print(
+        f"{len(results)} games in {elapsed:.2f}s "
+        f"({len(results) / elapsed:,.1f} games/s, {total_ticks / elapsed:,.0f} ticks/s)"
+    )
+    for (agent, level), entry in sorted(summarize(results).items()):
+        causes: str = ", ".join(f"{k}={v}" for k, v in sorted(entry["causes"].items()))
+        planning: str = (
+            f" decision mean={entry['mean_decision_us']:.0f}us "
+            f"max={entry['max_decision_us']:.0f}us"
+            if "mean_decision_us" in entry
+            else ""
+        )
+        print(
+            f"{agent:>9} {level:>6}: games={entry['games']} "
+            f"score mean={entry['mean_score']:.2f} max={entry['max_score']} "
+            f"ticks mean={entry['mean_ticks']:.0f} [{causes}]{planning}"
+        )